@@ -7,21 +7,41 @@ PRD-v0 Command: python parser.py episode_2_ex_final.md
 """
 
 import argparse
+import glob
+import hashlib
+import itertools
 import json
 import logging
+import os
 import re
+import shutil
 import sys
+import tempfile
 import time
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Callable, Dict, Any, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from utils.serialization import dump_json, dumps_json, load_json
 
 try:
     import jsonschema
 
-    SCHEMA_VALIDATION_AVAILABLE = True
+    JSONSCHEMA_AVAILABLE = True
+except ImportError:
+    JSONSCHEMA_AVAILABLE = False
+
+try:
+    import fastjsonschema
+
+    FASTJSONSCHEMA_AVAILABLE = True
 except ImportError:
-    SCHEMA_VALIDATION_AVAILABLE = False
+    FASTJSONSCHEMA_AVAILABLE = False
+
+SCHEMA_VALIDATION_AVAILABLE = JSONSCHEMA_AVAILABLE or FASTJSONSCHEMA_AVAILABLE
 
 
 def load_config(config_path: str = "config.json") -> Dict[str, Any]:
@@ -38,6 +58,7 @@ def load_config(config_path: str = "config.json") -> Dict[str, Any]:
                 "default_output_dir": "output/json",
                 "default_debug_mode": False,
                 "max_processing_time_seconds": 10,
+                "escape_tolerant": False,
             },
             "logging": {
                 "default_level": "INFO",
@@ -118,35 +139,376 @@ def normalize_scene_id(scene_name: str) -> str:
     return scene_id
 
 
+# Scene marker: ## **\[SCENE: NAME\]**
+# Note: In markdown, square brackets are escaped with backslashes
+SCENE_HEADER_PATTERN = re.compile(r"^## \*\*\\\[SCENE: ([^\]]+)\\\]\*\*$", re.MULTILINE)
+
+# Body token patterns. The tokenizer only tries these at the start of a line,
+# so they carry no ^ anchor of their own.
+# Dialogue: CHARACTER: (optional direction) "text"
+# Supports THORAK:, ZARA:, BOTH:, and potentially other characters
+DIALOGUE_TOKEN_PATTERN = re.compile(r"([A-Z][A-Z\s]*?):\s*(?:\(([^)]+)\))?\s*\"([^\"]+)\"")
+
+# Multimedia tags: \[TYPE: identifier\] with an optional PROMPT: "text" for images.
+# Each entry is (line prefix, multimedia key, pattern); the prefix (a str or a
+# tuple of str) lets the tokenizer dispatch on a cheap startswith check before
+# running a regex.
+MULTIMEDIA_TOKEN_PATTERNS = (
+    (
+        "\\[IMG:",
+        "image_tags",
+        re.compile(r"\\\[IMG:\s*([^\]]+)\\\](?:\s*PROMPT:\s*\"([^\"]+)\")?"),
+    ),
+    ("\\[SFX:", "sfx_tags", re.compile(r"\\\[SFX:\s*([^\]]+)\\\]")),
+    ("\\[MUSIC:", "music_tags", re.compile(r"\\\[MUSIC:\s*([^\]]+)\\\]")),
+    ("\\[AMBIENT:", "ambient_tags", re.compile(r"\\\[AMBIENT:\s*([^\]]+)\\\]")),
+    ("\\[TRANSITION:", "transition_tags", re.compile(r"\\\[TRANSITION:\s*([^\]]+)\\\]")),
+)
+
+MULTIMEDIA_TAG_TYPES = tuple(tag_type for _, tag_type, _ in MULTIMEDIA_TOKEN_PATTERNS)
+
+# Line starts that can begin a body token (uppercase letter or escaped tag)
+TOKEN_LINE_START_PATTERN = re.compile(
+    r"^(?=[A-Z]|\\\[(?:IMG|SFX|MUSIC|AMBIENT|TRANSITION):)", re.MULTILINE
+)
+
+# Escape-tolerant grammar: tags are also accepted as written by hand ([SFX: x])
+# or as left by tools/process_episode.py (\[SFX: x]), so scripts parse without
+# that pre-processing step
+TOLERANT_SCENE_HEADER_PATTERN = re.compile(
+    r"^## \*\*\\?\[SCENE: ([^\]]+?)\\?\]\*\*$", re.MULTILINE
+)
+
+UNESCAPED_SCENE_HEADER_PREFIX = "## **["
+
+TOLERANT_MULTIMEDIA_TOKEN_PATTERNS = (
+    (
+        ("\\[IMG:", "[IMG:"),
+        "image_tags",
+        re.compile(r"\\?\[IMG:\s*([^\]]+?)\\?\](?:\s*PROMPT:\s*\"([^\"]+)\")?"),
+    ),
+    (("\\[SFX:", "[SFX:"), "sfx_tags", re.compile(r"\\?\[SFX:\s*([^\]]+?)\\?\]")),
+    (("\\[MUSIC:", "[MUSIC:"), "music_tags", re.compile(r"\\?\[MUSIC:\s*([^\]]+?)\\?\]")),
+    (("\\[AMBIENT:", "[AMBIENT:"), "ambient_tags", re.compile(r"\\?\[AMBIENT:\s*([^\]]+?)\\?\]")),
+    (
+        ("\\[TRANSITION:", "[TRANSITION:"),
+        "transition_tags",
+        re.compile(r"\\?\[TRANSITION:\s*([^\]]+?)\\?\]"),
+    ),
+)
+
+TOLERANT_TOKEN_LINE_START_PATTERN = re.compile(
+    r"^(?=[A-Z]|\\?\[(?:IMG|SFX|MUSIC|AMBIENT|TRANSITION):)", re.MULTILINE
+)
+
+# A line-start tag whose closing bracket is not escaped: only the tolerant
+# grammar reads it, so a scene containing one may parse differently per grammar
+UNESCAPED_TAG_PATTERN = re.compile(
+    r"^\\?\[(?:IMG|SFX|MUSIC|AMBIENT|TRANSITION):[^\]\n]*(?<!\\)\]", re.MULTILINE
+)
+
+
+class ScriptGrammar(NamedTuple):
+    """The scene header and body token patterns one parse uses.
+
+    ``tag_start_chars`` are the first characters that can begin a multimedia
+    tag. With ``escape_tolerant``, unescaped tags inside fenced code blocks
+    are skipped, matching what tools/process_episode.py leaves unescaped.
+    """
+
+    scene_header_pattern: "re.Pattern[str]"
+    token_line_start_pattern: "re.Pattern[str]"
+    multimedia_token_patterns: Tuple[Tuple[Any, str, "re.Pattern[str]"], ...]
+    tag_start_chars: str
+    escape_tolerant: bool
+
+
+STRICT_GRAMMAR = ScriptGrammar(
+    SCENE_HEADER_PATTERN, TOKEN_LINE_START_PATTERN, MULTIMEDIA_TOKEN_PATTERNS, "\\", False
+)
+
+TOLERANT_GRAMMAR = ScriptGrammar(
+    TOLERANT_SCENE_HEADER_PATTERN,
+    TOLERANT_TOKEN_LINE_START_PATTERN,
+    TOLERANT_MULTIMEDIA_TOKEN_PATTERNS,
+    "\\[",
+    True,
+)
+
+
+def escape_tolerant_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of config with parser.escape_tolerant switched on."""
+    return {**config, "parser": {**config.get("parser", {}), "escape_tolerant": True}}
+
+
+def script_grammar(config: Dict[str, Any]) -> ScriptGrammar:
+    """Return the grammar selected by parser.escape_tolerant in config."""
+    if config.get("parser", {}).get("escape_tolerant", False):
+        return TOLERANT_GRAMMAR
+    return STRICT_GRAMMAR
+
+
+NEWLINE_PATTERN = re.compile(r"\n")
+
+CODE_FENCE = "```"
+
+
+class ScriptToken(NamedTuple):
+    """A typed token emitted by the script tokenizer.
+
+    ``kind`` is "scene", "dialogue" or a multimedia key such as "sfx_tags".
+    ``line`` is the 1-based file line for scene tokens and the 1-based line
+    within the scene body for everything else. ``groups`` holds the raw
+    (unstripped) captures; scene tokens carry (name, stripped body).
+    ``start``/``end`` is the token's span in the tokenized text; for scene
+    tokens it is the span of the stripped body.
+    """
+
+    kind: str
+    line: int
+    groups: Tuple[Optional[str], ...]
+    start: int = 0
+    end: int = 0
+
+    def group(self, index: int) -> str:
+        """Return a capture that always participates in this token's match."""
+        value = self.groups[index]
+        if value is None:
+            raise ValueError(f"{self.kind} token on line {self.line} has no group {index}")
+        return value
+
+
+class LineIndex:
+    """Precomputed newline offsets for O(log n) offset-to-line lookups.
+
+    Built once per script and shared by every extractor, replacing the
+    ``content[:offset].count("\\n")`` pattern that made each lookup cost
+    O(offset) and allocated a throwaway prefix copy.
+    """
+
+    __slots__ = ("newline_offsets",)
+
+    def __init__(self, content: str):
+        self.newline_offsets = [match.start() for match in NEWLINE_PATTERN.finditer(content)]
+
+    def line_number(self, offset: int) -> int:
+        """Return the 1-based line number containing ``offset``."""
+        return bisect_left(self.newline_offsets, offset) + 1
+
+
+class CodeFenceIndex:
+    """Code fence offsets for O(log n) "inside a fenced code block" checks.
+
+    Fences are counted left to right like ``text[:offset].count("```")``,
+    the rule tools/process_episode.py uses, so an offset is inside a block
+    when an odd number of fences end at or before it. ``open_at_start`` is
+    for text that begins inside a block, e.g. a streamed scene body.
+    """
+
+    __slots__ = ("fence_ends", "open_at_start")
+
+    def __init__(self, content: str, open_at_start: bool = False):
+        self.fence_ends = []
+        self.open_at_start = open_at_start
+        position = content.find(CODE_FENCE)
+        while position != -1:
+            self.fence_ends.append(position + len(CODE_FENCE))
+            position = content.find(CODE_FENCE, position + len(CODE_FENCE))
+
+    def contains(self, offset: int) -> bool:
+        """Return whether ``offset`` lies within a fenced code block."""
+        return (bisect_right(self.fence_ends, offset) + self.open_at_start) % 2 == 1
+
+
+def tokenize_scene_body(
+    content: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    line_index: Optional[LineIndex] = None,
+    grammar: ScriptGrammar = STRICT_GRAMMAR,
+    fences: Optional[CodeFenceIndex] = None,
+) -> Iterator[ScriptToken]:
+    """Tokenize the scene body ``content[start:end]`` in a single pass.
+
+    Every token pattern is anchored to a line start, so only lines whose first
+    character can begin a token are visited, and each is checked against the
+    one pattern that first character selects. A separate resume offset is
+    kept per token kind so a match spanning several lines hides later lines
+    from its own kind only, exactly like running one ``finditer`` per kind.
+    """
+    if end is None:
+        end = len(content)
+    if line_index is None:
+        line_index = LineIndex(content)
+    if fences is None and grammar.escape_tolerant:
+        fences = CodeFenceIndex(content)
+
+    # Line numbers are reported relative to the first line of the body
+    line_offset = line_index.line_number(start) - 1
+    resume_at = dict.fromkeys(("dialogue",) + MULTIMEDIA_TAG_TYPES, 0)
+
+    # The body start counts as a line start even when it falls mid-line
+    candidates = itertools.chain(
+        (start,),
+        (
+            match.start()
+            for match in grammar.token_line_start_pattern.finditer(content, start + 1, end)
+        ),
+    )
+
+    for line_start in candidates:
+        if line_start >= end:
+            break
+        first_char = content[line_start]
+
+        if "A" <= first_char <= "Z":
+            if line_start >= resume_at["dialogue"]:
+                match = DIALOGUE_TOKEN_PATTERN.match(content, line_start, end)
+                if match:
+                    resume_at["dialogue"] = match.end()
+                    yield ScriptToken(
+                        "dialogue",
+                        line_index.line_number(line_start) - line_offset,
+                        match.groups(),
+                        line_start,
+                        match.end(),
+                    )
+        elif first_char in grammar.tag_start_chars:
+            for prefix, tag_type, pattern in grammar.multimedia_token_patterns:
+                if content.startswith(prefix, line_start):
+                    if first_char == "[" and fences is not None and fences.contains(line_start):
+                        break
+                    if line_start >= resume_at[tag_type]:
+                        match = pattern.match(content, line_start, end)
+                        if match:
+                            resume_at[tag_type] = match.end()
+                            yield ScriptToken(
+                                tag_type,
+                                line_index.line_number(line_start) - line_offset,
+                                match.groups(),
+                                line_start,
+                                match.end(),
+                            )
+                    break
+
+
+def iter_scene_headers(
+    content: str, grammar: ScriptGrammar, fences: Optional[CodeFenceIndex] = None
+) -> Iterator["re.Match[str]"]:
+    """Yield scene header matches, skipping unescaped ones in fenced code blocks."""
+    if fences is None and grammar.escape_tolerant:
+        fences = CodeFenceIndex(content)
+    for header in grammar.scene_header_pattern.finditer(content):
+        if (
+            fences is not None
+            and content.startswith(UNESCAPED_SCENE_HEADER_PREFIX, header.start())
+            and fences.contains(header.start() + len(UNESCAPED_SCENE_HEADER_PREFIX) - 1)
+        ):
+            continue
+        yield header
+
+
+def iter_scene_tokens(
+    content: str,
+    line_index: Optional[LineIndex] = None,
+    grammar: ScriptGrammar = STRICT_GRAMMAR,
+    fences: Optional[CodeFenceIndex] = None,
+) -> Iterator[ScriptToken]:
+    """Yield one scene token per scene header, without tokenizing the bodies."""
+    if line_index is None:
+        line_index = LineIndex(content)
+    if fences is None and grammar.escape_tolerant:
+        fences = CodeFenceIndex(content)
+
+    headers = iter_scene_headers(content, grammar, fences)
+    header = next(headers, None)
+    while header:
+        next_header = next(headers, None)
+
+        # Trim the body in place (same rule as str.strip) so the tokenizer can
+        # work on absolute offsets shared with the line index
+        body_start = header.end()
+        body_end = next_header.start() if next_header else len(content)
+        while body_start < body_end and content[body_start].isspace():
+            body_start += 1
+        while body_end > body_start and content[body_end - 1].isspace():
+            body_end -= 1
+
+        yield ScriptToken(
+            "scene",
+            line_index.line_number(header.start()),
+            (header.group(1), content[body_start:body_end]),
+            body_start,
+            body_end,
+        )
+
+        header = next_header
+
+
+def tokenize_script(
+    content: str,
+    line_index: Optional[LineIndex] = None,
+    grammar: ScriptGrammar = STRICT_GRAMMAR,
+) -> Iterator[ScriptToken]:
+    """Tokenize a whole script, yielding each scene token followed by its body tokens."""
+    if line_index is None:
+        line_index = LineIndex(content)
+    fences = CodeFenceIndex(content) if grammar.escape_tolerant else None
+
+    for scene_token in iter_scene_tokens(content, line_index, grammar, fences):
+        yield scene_token
+        if scene_token.start < scene_token.end:
+            yield from tokenize_scene_body(
+                content, scene_token.start, scene_token.end, line_index, grammar, fences
+            )
+
+
+def build_dialogue(token: ScriptToken) -> Dict[str, Any]:
+    """Build a dialogue entry from a dialogue token."""
+    direction = token.groups[1]
+    text = token.group(2).strip()
+
+    return {
+        "character": token.group(0).strip(),
+        "direction": direction.strip() if direction else None,
+        "text": text,
+        # Character count drives cost estimation
+        "character_count": len(text),
+        "line_position": token.line,
+    }
+
+
+def build_multimedia_tag(token: ScriptToken) -> Dict[str, Any]:
+    """Build a multimedia tag entry from a multimedia token."""
+    if token.kind == "image_tags":
+        prompt = token.groups[1]
+        return {
+            "tag_id": token.group(0).strip(),
+            "prompt": prompt.strip() if prompt else None,
+            "line_position": token.line,
+            "tag_type": "image",
+        }
+
+    return {
+        "tag_id": token.group(0).strip(),
+        "line_position": token.line,
+        "tag_type": token.kind.replace("_tags", ""),  # "sfx_tags" -> "sfx"
+    }
+
+
 def parse_dialogue_from_content(
     content: str, logger: logging.Logger
 ) -> List[Dict[str, Any]]:
     """Extract dialogue lines from scene content."""
-    # Pattern to match dialogue: CHARACTER: (optional direction) "text"
-    # Supports THORAK:, ZARA:, BOTH:, and potentially other characters
-    dialogue_pattern = re.compile(
-        r"^([A-Z][A-Z\s]*?):\s*(?:\(([^)]+)\))?\s*\"([^\"]+)\"", re.MULTILINE
-    )
-
     dialogues = []
-    for match in dialogue_pattern.finditer(content):
-        character = match.group(1).strip()
-        direction = match.group(2).strip() if match.group(2) else None
-        text = match.group(3).strip()
-
-        # Calculate character count (for cost estimation)
-        character_count = len(text)
-
-        dialogue_data = {
-            "character": character,
-            "direction": direction,
-            "text": text,
-            "character_count": character_count,
-            "line_position": content[: match.start()].count("\n") + 1,
-        }
-
-        dialogues.append(dialogue_data)
-        logger.debug(f"Found dialogue: {character} ({character_count} chars)")
+    for token in tokenize_scene_body(content):
+        if token.kind == "dialogue":
+            dialogue_data = build_dialogue(token)
+            dialogues.append(dialogue_data)
+            logger.debug(
+                f"Found dialogue: {dialogue_data['character']} "
+                f"({dialogue_data['character_count']} chars)"
+            )
 
     return dialogues
 
@@ -155,140 +517,388 @@ def parse_multimedia_tags_from_content(
     content: str, logger: logging.Logger
 ) -> Dict[str, List[Dict[str, Any]]]:
     """Extract multimedia tags from scene content."""
-
-    # Pattern to match multimedia tags: [TYPE: identifier] optional PROMPT: "text"
-    multimedia_patterns = {
-        "image_tags": re.compile(
-            r"^\\\[IMG:\s*([^\]]+)\\\](?:\s*PROMPT:\s*\"([^\"]+)\")?", re.MULTILINE
-        ),
-        "sfx_tags": re.compile(r"^\\\[SFX:\s*([^\]]+)\\\]", re.MULTILINE),
-        "music_tags": re.compile(r"^\\\[MUSIC:\s*([^\]]+)\\\]", re.MULTILINE),
-        "ambient_tags": re.compile(r"^\\\[AMBIENT:\s*([^\]]+)\\\]", re.MULTILINE),
-        "transition_tags": re.compile(r"^\\\[TRANSITION:\s*([^\]]+)\\\]", re.MULTILINE),
+    multimedia_data: Dict[str, List[Dict[str, Any]]] = {
+        tag_type: [] for tag_type in MULTIMEDIA_TAG_TYPES
     }
 
-    multimedia_data = {
-        "image_tags": [],
-        "sfx_tags": [],
-        "music_tags": [],
-        "ambient_tags": [],
-        "transition_tags": [],
+    for token in tokenize_scene_body(content):
+        if token.kind != "dialogue":
+            tag_data = build_multimedia_tag(token)
+            multimedia_data[token.kind].append(tag_data)
+            logger.debug(
+                f"Found {token.kind.upper().replace('_TAGS', '')} tag: {tag_data['tag_id']}"
+            )
+
+    return multimedia_data
+
+
+def build_scene(
+    scene_token: ScriptToken, body_tokens: Iterable[ScriptToken], logger: logging.Logger
+) -> Dict[str, Any]:
+    """Assemble a scene entry from its scene token and body tokens."""
+    dialogues = []
+    multimedia_tags: Dict[str, List[Dict[str, Any]]] = {
+        tag_type: [] for tag_type in MULTIMEDIA_TAG_TYPES
     }
 
-    # Extract image tags (can have optional PROMPT)
-    for match in multimedia_patterns["image_tags"].finditer(content):
-        tag_id = match.group(1).strip()
-        prompt = match.group(2).strip() if match.group(2) else None
-        line_position = content[: match.start()].count("\n") + 1
+    for token in body_tokens:
+        if token.kind == "dialogue":
+            dialogue_data = build_dialogue(token)
+            dialogues.append(dialogue_data)
+            logger.debug(
+                f"Found dialogue: {dialogue_data['character']} "
+                f"({dialogue_data['character_count']} chars)"
+            )
+        else:
+            tag_data = build_multimedia_tag(token)
+            multimedia_tags[token.kind].append(tag_data)
+            logger.debug(
+                f"Found {token.kind.upper().replace('_TAGS', '')} tag: {tag_data['tag_id']}"
+            )
+
+    scene_name = scene_token.group(0).strip()
+    scene_data = {
+        "scene_id": normalize_scene_id(scene_name),
+        "scene_name": scene_name,
+        "start_line": scene_token.line,
+        "content": scene_token.groups[1],
+        "dialogues": dialogues,
+        "multimedia": multimedia_tags,
+        "metadata": {
+            "dialogue_count": len(dialogues),
+            "image_tags": multimedia_tags["image_tags"],
+            "sfx_tags": multimedia_tags["sfx_tags"],
+            "music_tags": multimedia_tags["music_tags"],
+            "ambient_tags": multimedia_tags["ambient_tags"],
+            "transition_tags": multimedia_tags["transition_tags"],
+        },
+    }
 
-        image_data = {
-            "tag_id": tag_id,
-            "prompt": prompt,
-            "line_position": line_position,
-            "tag_type": "image",
-        }
-        multimedia_data["image_tags"].append(image_data)
-        logger.debug(f"Found IMG tag: {tag_id}")
-
-    # Extract other multimedia tags (simpler format)
-    for tag_type, pattern in multimedia_patterns.items():
-        if tag_type == "image_tags":
-            continue  # Already processed above
-
-        for match in pattern.finditer(content):
-            tag_id = match.group(1).strip()
-            line_position = content[: match.start()].count("\n") + 1
-
-            tag_data = {
-                "tag_id": tag_id,
-                "line_position": line_position,
-                "tag_type": tag_type.replace("_tags", ""),  # "sfx_tags" -> "sfx"
-            }
-            multimedia_data[tag_type].append(tag_data)
-            logger.debug(f"Found {tag_type.upper().replace('_TAGS', '')} tag: {tag_id}")
+    logger.debug(
+        f"Extracted scene: {scene_name} (line {scene_token.line}, {len(dialogues)} dialogues)"
+    )
+    return scene_data
 
-    return multimedia_data
 
+def scene_content_hash(scene_name: str, content: str) -> str:
+    """Hash a scene's name and stripped body; equal hashes parse to equal scenes."""
+    digest = hashlib.sha256(scene_name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(content.encode("utf-8"))
+    return digest.hexdigest()
 
-def extract_scenes(content: str, logger: logging.Logger) -> List[Dict[str, Any]]:
-    """Extract scenes from the markdown content."""
-    # Pattern to match scene markers: ## **\[SCENE: NAME\]**
-    # Note: In markdown, square brackets are escaped with backslashes
-    scene_pattern = re.compile(r"^## \*\*\\\[SCENE: ([^\]]+)\\\]\*\*$", re.MULTILINE)
 
-    # Find all scene markers with their positions
-    scene_matches = list(scene_pattern.finditer(content))
+def compact_scene(scene: Dict[str, Any], include_content: bool = False) -> Dict[str, Any]:
+    """Convert a parsed scene to the compact v2 output layout.
 
-    if not scene_matches:
-        logger.warning("No scenes found in the script")
-        return []
+    Tags are written once under "multimedia" instead of being repeated in
+    "metadata", and the raw body is replaced by its content_sha256 unless
+    ``include_content`` is set.
+    """
+    compact = {
+        "scene_id": scene["scene_id"],
+        "scene_name": scene["scene_name"],
+        "start_line": scene["start_line"],
+        "content_sha256": scene_content_hash(scene["scene_name"], scene["content"]),
+    }
+    if include_content:
+        compact["content"] = scene["content"]
+    compact["dialogues"] = scene["dialogues"]
+    compact["multimedia"] = scene["multimedia"]
+    compact["metadata"] = {"dialogue_count": len(scene["dialogues"])}
+    return compact
 
-    # Split content into lines for line number tracking
-    lines = content.split("\n")
 
-    # Build scenes list
-    scenes = []
-    for i, match in enumerate(scene_matches):
-        scene_name = match.group(1).strip()
-        scene_id = normalize_scene_id(scene_name)
-
-        # Calculate line number (1-based)
-        start_pos = match.start()
-        line_number = content[:start_pos].count("\n") + 1
-
-        # Extract content from this scene marker to the next (or end of file)
-        content_start = match.end()
-        if i < len(scene_matches) - 1:
-            # Content ends at the start of the next scene
-            content_end = scene_matches[i + 1].start()
-        else:
-            # Last scene - content goes to end of file
-            content_end = len(content)
+def expand_scene(scene: Dict[str, Any], start_line: int, content: str) -> Dict[str, Any]:
+    """Rebuild a full v1 scene from a previously written v1 or v2 scene."""
+    multimedia = scene["multimedia"]
+    return {
+        "scene_id": scene["scene_id"],
+        "scene_name": scene["scene_name"],
+        "start_line": start_line,
+        "content": content,
+        "dialogues": scene["dialogues"],
+        "multimedia": multimedia,
+        "metadata": {
+            "dialogue_count": len(scene["dialogues"]),
+            **{tag_type: multimedia[tag_type] for tag_type in MULTIMEDIA_TAG_TYPES},
+        },
+    }
 
-        # Extract and clean scene content
-        scene_content = content[content_start:content_end].strip()
 
-        # Parse dialogues within this scene
-        dialogues = parse_dialogue_from_content(scene_content, logger)
+def index_reusable_scenes(scenes: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Index previously parsed scenes by scene_content_hash for incremental reparse.
 
-        # Parse multimedia tags within this scene
-        multimedia_tags = parse_multimedia_tags_from_content(scene_content, logger)
+    Accepts both output layouts: v2 scenes carry the hash as content_sha256.
+    """
+    reusable = {}
+    for scene in scenes:
+        if "scene_name" not in scene or "multimedia" not in scene:
+            continue
+        if isinstance(scene.get("content_sha256"), str):
+            reusable[scene["content_sha256"]] = scene
+        elif isinstance(scene.get("content"), str):
+            reusable[scene_content_hash(scene["scene_name"], scene["content"])] = scene
+    return reusable
 
-        scene_data = {
-            "scene_id": scene_id,
-            "scene_name": scene_name,
-            "start_line": line_number,
-            "content": scene_content,
-            "dialogues": dialogues,
-            "multimedia": multimedia_tags,
-            "metadata": {
-                "dialogue_count": len(dialogues),
-                "image_tags": multimedia_tags["image_tags"],
-                "sfx_tags": multimedia_tags["sfx_tags"],
-                "music_tags": multimedia_tags["music_tags"],
-                "ambient_tags": multimedia_tags["ambient_tags"],
-                "transition_tags": multimedia_tags["transition_tags"],
-            },
-        }
 
-        scenes.append(scene_data)
-        logger.debug(
-            f"Extracted scene: {scene_name} (line {line_number}, {len(dialogues)} dialogues)"
+def extract_scenes(
+    content: str,
+    logger: logging.Logger,
+    reusable_scenes: Optional[Dict[str, Dict[str, Any]]] = None,
+    grammar: ScriptGrammar = STRICT_GRAMMAR,
+) -> List[Dict[str, Any]]:
+    """Extract scenes from the markdown content in a single tokenizer pass.
+
+    When ``reusable_scenes`` (see index_reusable_scenes) is given, scenes whose
+    name and body are unchanged are rebuilt from it instead of re-tokenized,
+    with the current start_line and body. The previous output does not record
+    its grammar, so with the tolerant one, scenes holding unescaped tags are
+    always re-tokenized.
+    """
+    line_index = LineIndex(content)
+    fences = CodeFenceIndex(content) if grammar.escape_tolerant else None
+    scenes = []
+    reused_count = 0
+
+    for scene_token in iter_scene_tokens(content, line_index, grammar, fences):
+        # Scene tokens always carry their body; without one there is nothing to match
+        scene_body = scene_token.groups[1]
+        if reusable_scenes and scene_body is not None and not (
+            grammar.escape_tolerant and UNESCAPED_TAG_PATTERN.search(scene_body)
+        ):
+            scene_name = scene_token.group(0).strip()
+            prior_scene = reusable_scenes.get(scene_content_hash(scene_name, scene_body))
+            if prior_scene is not None:
+                scenes.append(expand_scene(prior_scene, scene_token.line, scene_body))
+                reused_count += 1
+                logger.debug(f"Reused unchanged scene: {scene_name} (line {scene_token.line})")
+                continue
+
+        body_tokens = tokenize_scene_body(
+            content, scene_token.start, scene_token.end, line_index, grammar, fences
         )
+        scenes.append(build_scene(scene_token, body_tokens, logger))
+
+    if not scenes:
+        logger.warning("No scenes found in the script")
+        return []
 
+    if reusable_scenes is not None:
+        logger.info(
+            f"Reused {reused_count} unchanged scenes, re-parsed {len(scenes) - reused_count}"
+        )
     logger.info(f"Extracted {len(scenes)} scenes from the script")
     return scenes
 
 
+def iter_scenes(
+    input_path: Path,
+    logger: Optional[logging.Logger] = None,
+    grammar: ScriptGrammar = STRICT_GRAMMAR,
+) -> Iterator[Dict[str, Any]]:
+    """Yield finished scenes while reading the script line by line.
+
+    Only the body of the current scene is buffered, so peak memory is bounded
+    by the largest scene rather than the whole script. Scenes match those of
+    extract_scenes for any script whose scene headers fit on a single line.
+    """
+    if logger is None:
+        logger = logging.getLogger("versusMonster.parser")
+
+    scene_name = None
+    scene_line = 0
+    body_lines: List[str] = []
+    scene_count = 0
+    # Fences seen so far, and whether the current body starts inside a code block
+    fence_count = 0
+    body_in_fence = False
+
+    def finish_scene() -> Dict[str, Any]:
+        body = "".join(body_lines).strip()
+        scene_token = ScriptToken("scene", scene_line, (scene_name, body))
+        fences = CodeFenceIndex(body, body_in_fence) if grammar.escape_tolerant else None
+        return build_scene(
+            scene_token, tokenize_scene_body(body, grammar=grammar, fences=fences), logger
+        )
+
+    with open(input_path, "r", encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            header = grammar.scene_header_pattern.match(line)
+            if grammar.escape_tolerant:
+                if (
+                    header
+                    and fence_count % 2 == 1
+                    and line.startswith(UNESCAPED_SCENE_HEADER_PREFIX)
+                ):
+                    header = None
+                fence_count += line.count(CODE_FENCE)
+            if header:
+                if scene_name is not None:
+                    scene_count += 1
+                    yield finish_scene()
+                scene_name = header.group(1)
+                scene_line = line_number
+                body_lines = [line[header.end():]]
+                body_in_fence = fence_count % 2 == 1
+            elif scene_name is not None:
+                body_lines.append(line)
+
+    if scene_name is None:
+        logger.warning("No scenes found in the script")
+        return
+
+    scene_count += 1
+    yield finish_scene()
+    logger.info(f"Streamed {scene_count} scenes from the script")
+
+
+def build_episode_metadata(
+    input_path: Path, content: str, total_scenes: int
+) -> Dict[str, Any]:
+    """Build the episode_metadata section from the input file name and content."""
+    # Extract episode number from filename
+    episode_match = input_path.stem
+    episode_number = (
+        episode_match
+        if episode_match.startswith("episode_")
+        else f"episode_{episode_match}"
+    )
+
+    return {
+        "title": f"Episode {episode_number.replace('episode_', '').replace('_', ' ').title()}",
+        "number": episode_number,
+        "input_file": str(input_path.absolute()),
+        "content_preview": content[:200] + "..." if len(content) > 200 else content,
+        "total_scenes": total_scenes,
+    }
+
+
+def read_content_preview(input_path: Path) -> str:
+    """Read just enough of the script to build content_preview."""
+    # 200 preview characters plus one to detect truncation
+    with open(input_path, "r", encoding="utf-8") as file:
+        return file.read(201)
+
+
+# tools/process_episode.py, imported on first use by --normalize
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+
+
+def normalize_script(
+    input_path: Path, write_normalized: bool, logger: logging.Logger
+) -> str:
+    """Read the script and escape its multimedia tags in memory.
+
+    Applies the same transformation as tools/process_episode.py, so parsing
+    the result matches parsing that tool's ``<stem>_processed.md`` output.
+    The processed copy is written to that path only if ``write_normalized``.
+
+    The tool escapes only the opening bracket of non-SCENE tags
+    (``\\[SFX: x]``), which the strict grammar does not read: parse the
+    result with escape_tolerant_config.
+    """
+    if str(TOOLS_DIR) not in sys.path:
+        sys.path.insert(0, str(TOOLS_DIR))
+    import process_episode
+
+    with open(input_path, "r", encoding="utf-8") as file:
+        content = file.read()
+
+    normalized, stats = process_episode.normalize_episode_content(content)
+    logger.info(
+        f"🏷️ Normalized tags: {stats.total_fixed} escaped, "
+        f"{stats.total_already_escaped} already escaped"
+    )
+
+    if write_normalized:
+        processed_path = process_episode.processed_output_path(input_path)
+        with open(processed_path, "w", encoding="utf-8") as file:
+            file.write(normalized)
+        logger.info(f"✓ Normalized script saved: {processed_path}")
+
+    return normalized
+
+
+def load_reusable_scenes(
+    json_file: Path, logger: logging.Logger
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Load a previous parser output and index its scenes for incremental reparse."""
+    try:
+        prior_output = load_json(json_file)
+    except FileNotFoundError:
+        logger.info(f"No previous output at {json_file} - parsing all scenes")
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read previous output {json_file}: {e} - parsing all scenes")
+        return None
+
+    reusable_scenes = index_reusable_scenes(prior_output.get("scenes", []))
+    logger.info(f"Loaded {len(reusable_scenes)} reusable scenes from {json_file}")
+    return reusable_scenes
+
+
+def load_scene_summaries(
+    summary_file: Path, accumulator: "EpisodeAccumulator", logger: logging.Logger
+) -> Dict[str, Dict[str, Any]]:
+    """Load per-scene partials saved by save_scene_summaries, keyed by scene_content_hash.
+
+    Partials recorded under different timing or grammar settings are ignored.
+    """
+    try:
+        saved = load_json(summary_file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read scene summaries {summary_file}: {e}")
+        return {}
+
+    if not isinstance(saved, dict) or saved.get("settings") != accumulator.summary_settings():
+        logger.info(f"Scene summaries in {summary_file} are outdated - recomputing them")
+        return {}
+    summaries = saved.get("scenes", {})
+    return summaries if isinstance(summaries, dict) else {}
+
+
+def save_scene_summaries(
+    summary_file: Path, accumulator: "EpisodeAccumulator", logger: logging.Logger
+) -> None:
+    """Save the accumulator's per-scene partials for the next incremental run."""
+    dump_json(
+        {"settings": accumulator.summary_settings(), "scenes": accumulator.scene_summaries},
+        summary_file,
+    )
+    logger.debug(f"Saved {len(accumulator.scene_summaries)} scene summaries: {summary_file}")
+
+
 def parse_episode_script(
-    input_path: Path, logger: logging.Logger, config: Dict[str, Any]
+    input_path: Path,
+    logger: logging.Logger,
+    config: Dict[str, Any],
+    reusable_scenes: Optional[Dict[str, Dict[str, Any]]] = None,
+    accumulator: Optional["EpisodeAccumulator"] = None,
+    content: Optional[str] = None,
+    scene_summaries: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
-    """Parse the episode markdown script into structured data."""
-    logger.info(f"Reading script from: {input_path}")
+    """Parse the episode markdown script into structured data.
+
+    ``reusable_scenes`` enables incremental reparse; see extract_scenes.
+    ``scene_summaries`` holds the matching per-scene partials (see
+    EpisodeAccumulator.add_scenes).
+    Pass an ``accumulator`` to keep the scene totals gathered for validation
+    so generate_output_metadata can reuse them without another scene walk.
+    Pass ``content`` to parse text already in memory (e.g. normalized by
+    normalize_script) instead of reading ``input_path``.
+    """
+    if content is not None:
+        logger.info(f"Parsing in-memory script for: {input_path}")
+    else:
+        logger.info(f"Reading script from: {input_path}")
 
     try:
-        with open(input_path, "r", encoding="utf-8") as file:
-            content = file.read()
+        if content is None:
+            with open(input_path, "r", encoding="utf-8") as file:
+                content = file.read()
     except UnicodeDecodeError:
         logger.error(f"Failed to read file with UTF-8 encoding: {input_path}")
         raise
@@ -312,29 +922,16 @@ def parse_episode_script(
             },
         }
 
-    # Extract episode number from filename
-    episode_match = input_path.stem
-    episode_number = (
-        episode_match
-        if episode_match.startswith("episode_")
-        else f"episode_{episode_match}"
-    )
-
     # Extract scenes from the content
-    scenes = extract_scenes(content, logger)
+    scenes = extract_scenes(content, logger, reusable_scenes, script_grammar(config))
 
-    # Validate content and generate warnings/feedback
-    validation_results = validate_episode_content(content, scenes, config, logger)
+    # Validate content and generate warnings/feedback from a single scene walk
+    if accumulator is None:
+        accumulator = EpisodeAccumulator(config)
+    validation_results = accumulator.add_scenes(scenes, scene_summaries).validation(logger)
 
-    # Placeholder parsing result - will be implemented in subsequent tasks
     parsed_data = {
-        "episode_metadata": {
-            "title": f"Episode {episode_number.replace('episode_', '').replace('_', ' ').title()}",
-            "number": episode_number,
-            "input_file": str(input_path.absolute()),
-            "content_preview": content[:200] + "..." if len(content) > 200 else content,
-            "total_scenes": len(scenes),
-        },
+        "episode_metadata": build_episode_metadata(input_path, content, len(scenes)),
         "scenes": scenes,
         "warnings": validation_results["warnings"],
         "feedback": validation_results["feedback"],
@@ -347,379 +944,492 @@ def parse_episode_script(
     return parsed_data
 
 
-def validate_episode_content(
-    content: str,
-    scenes: List[Dict[str, Any]],
-    config: Dict[str, Any],
-    logger: logging.Logger,
-) -> Dict[str, Any]:
-    """Validate episode content and generate warnings/feedback."""
-    validation_config = config.get("validation", {})
-    warnings = []
-    feedback = {
-        "missing_tags": [],
-        "format_violations": [],
-        "quality_suggestions": [],
+class EpisodeAccumulator:
+    """Episode-wide aggregates collected one scene at a time.
+
+    Holds everything the validation and metadata sections need (per-speaker
+    character counts, tag counts, per-scene timings and validation signals),
+    so those sections can be produced without keeping the scenes themselves
+    in memory, e.g. when scenes are streamed straight to disk.
+    """
+
+    # Map tag types to validation config format
+    TAG_NAMES = {
+        "image_tags": "IMG:",
+        "sfx_tags": "SFX:",
+        "music_tags": "MUSIC:",
+        "ambient_tags": "AMBIENT:",
+        "transition_tags": "TRANSITION:",
     }
 
-    # Check for required scenes
-    if not scenes:
-        warnings.append("No scene markers found. Expected format: ## **[SCENE: NAME]**")
-        feedback["format_violations"].append("Missing scene structure")
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        if config is None:
+            config = {}
+        self.config = config
 
-    # Check for required characters
-    required_characters = validation_config.get(
-        "required_characters", ["THORAK", "ZARA"]
-    )
-    found_characters = set()
+        episode_settings = config.get("episode_settings", {})
+        self.speech_rate = episode_settings.get("default_speech_rate_words_per_minute", 150)
+        self.pause_between_speakers = episode_settings.get(
+            "pause_duration_between_speakers_seconds", 0.5
+        )
+        self.scene_transition_duration = episode_settings.get(
+            "scene_transition_duration_seconds", 1.0
+        )
 
-    # Collect all dialogues for character validation
-    total_dialogues = 0
-    total_character_count = 0
-    scene_dialogue_counts = []
+        self.scene_count = 0
+        self.total_dialogues = 0
+        self.total_characters = 0
+        self.total_words = 0
+        self.total_dialogue_duration = 0
+        self.characters_by_speaker: Dict[str, int] = {}
+        self.tag_counts = {tag_type: 0 for tag_type in MULTIMEDIA_TAG_TYPES}
+        self.found_multimedia: Set[str] = set()
+        self.scenes_with_images = 0
+        self.scene_timings: List[Dict[str, Any]] = []
+        self.empty_scenes: List[str] = []
+        self.short_dialogues: List[Tuple[str, str]] = []
+        self.oversized_dialogues: List[Tuple[str, int]] = []
+        self.scene_summaries: Dict[str, Dict[str, Any]] = {}
+
+    def summary_settings(self) -> Dict[str, Any]:
+        """Settings a summarize_scene partial depends on besides the scene itself."""
+        return {
+            "speech_rate": self.speech_rate,
+            "pause_between_speakers": self.pause_between_speakers,
+            "escape_tolerant": script_grammar(self.config).escape_tolerant,
+        }
 
-    for scene in scenes:
-        scene_dialogues = len(scene.get("dialogues", []))
-        total_dialogues += scene_dialogues
-        scene_dialogue_counts.append(scene_dialogues)
-
-        for dialogue in scene.get("dialogues", []):
-            found_characters.add(dialogue["character"])
-            total_character_count += dialogue["character_count"]
-
-    # Check for missing required characters
-    missing_characters = set(required_characters) - found_characters
-    if missing_characters:
-        for char in missing_characters:
-            warnings.append(f"Required character '{char}' not found in any dialogue")
-            feedback["missing_tags"].append(f"Character: {char}")
-
-    # Check multimedia tag usage
-    required_multimedia = validation_config.get("multimedia_tags", [])
-    found_multimedia = set()
-    multimedia_counts = {}
+    def summarize_scene(self, scene: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the per-scene partial aggregates that add_partial folds in.
 
-    for scene in scenes:
-        multimedia = scene.get("multimedia", {})
-        for tag_type, tags in multimedia.items():
-            if tags:  # If there are any tags of this type
-                # Map tag types to config format
-                tag_mapping = {
-                    "image_tags": "IMG:",
-                    "sfx_tags": "SFX:",
-                    "music_tags": "MUSIC:",
-                    "ambient_tags": "AMBIENT:",
-                    "transition_tags": "TRANSITION:",
-                }
-                tag_name = tag_mapping.get(
-                    tag_type, tag_type.replace("_tags", "").upper() + ":"
-                )
-                found_multimedia.add(tag_name)
-                multimedia_counts[tag_name] = multimedia_counts.get(tag_name, 0) + len(
-                    tags
-                )
+        Episode totals are sums of these partials, so a scene reused from a
+        previous run only needs its partial recomputed from the stored entry,
+        never a re-parse of its text.
+        """
+        scene_name = scene.get("scene_name", "")
+        dialogues = scene.get("dialogues", [])
+        dialogue_count = len(dialogues)
 
-    # Check for missing multimedia types
-    missing_multimedia = set(required_multimedia) - found_multimedia
-    if missing_multimedia and validation_config.get("warning_on_missing_tags", True):
-        for tag in missing_multimedia:
-            warnings.append(f"No {tag} tags found in episode")
-            feedback["missing_tags"].append(f"Multimedia: {tag}")
-
-    # Content quality checks
-    if total_dialogues < 10:
-        feedback["quality_suggestions"].append(
-            f"Episode has only {total_dialogues} dialogues - consider adding more content"
-        )
+        characters_by_speaker: Dict[str, int] = {}
+        short_dialogues = []
+        oversized_dialogues = []
+        scene_dialogue_duration = 0
+        scene_words = 0
+        for dialogue in dialogues:
+            character = dialogue["character"]
+            char_count = dialogue["character_count"]
+            characters_by_speaker[character] = characters_by_speaker.get(character, 0) + char_count
 
-    if total_character_count < 1000:
-        feedback["quality_suggestions"].append(
-            f"Episode has only {total_character_count} characters - may be too short for podcast format"
-        )
+            # Estimate words (simple split by spaces)
+            words = len(dialogue["text"].split())
+            scene_words += words
+            # Calculate speech duration (words per minute to seconds)
+            scene_dialogue_duration += (words / self.speech_rate) * 60
 
-    # Check for scene balance
-    if scenes:
-        avg_dialogues_per_scene = total_dialogues / len(scenes)
-        if avg_dialogues_per_scene < 2:
-            feedback["quality_suggestions"].append(
-                "Some scenes have very few dialogues - consider consolidating or expanding"
-            )
+            if char_count < 5:
+                short_dialogues.append(dialogue["text"])
+            # Very long dialogues usually point at formatting issues
+            if char_count > 1000:
+                oversized_dialogues.append(char_count)
 
-        # Check for scenes with no dialogues
-        empty_scenes = [
-            scene["scene_name"]
-            for scene in scenes
-            if len(scene.get("dialogues", [])) == 0
-        ]
-        if empty_scenes:
-            for scene_name in empty_scenes:
-                warnings.append(f"Scene '{scene_name}' contains no dialogue")
-                feedback["format_violations"].append(f"Empty scene: {scene_name}")
+        # Add pauses between speakers (one less pause than dialogue count)
+        if dialogue_count > 1:
+            scene_dialogue_duration += (dialogue_count - 1) * self.pause_between_speakers
 
-    # Check dialogue format compliance
-    for scene in scenes:
-        for dialogue in scene.get("dialogues", []):
-            # Check for very short dialogues
-            if dialogue["character_count"] < 5:
-                feedback["quality_suggestions"].append(
-                    f"Very short dialogue in {scene['scene_name']}: '{dialogue['text'][:50]}'"
-                )
+        multimedia = scene.get("multimedia", {})
+        return {
+            "scene_id": scene["scene_id"],
+            "scene_name": scene_name,
+            "dialogue_count": dialogue_count,
+            "word_count": scene_words,
+            "dialogue_duration_seconds": scene_dialogue_duration,
+            "characters_by_speaker": characters_by_speaker,
+            "tag_counts": {tag_type: len(tags) for tag_type, tags in multimedia.items()},
+            "has_images": bool(multimedia.get("image_tags", [])),
+            "short_dialogues": short_dialogues,
+            "oversized_dialogues": oversized_dialogues,
+        }
 
-            # Check for very long dialogues (potential formatting issues)
-            if dialogue["character_count"] > 1000:
-                warnings.append(
-                    f"Extremely long dialogue in {scene['scene_name']} ({dialogue['character_count']} chars) - check for formatting errors"
-                )
-                feedback["format_violations"].append(
-                    f"Oversized dialogue in {scene['scene_name']}"
-                )
+    def add_partial(self, partial: Dict[str, Any]) -> "EpisodeAccumulator":
+        """Fold one per-scene partial into the episode aggregates."""
+        scene_name = partial["scene_name"]
+        dialogue_count = partial["dialogue_count"]
 
-    # Check multimedia distribution
-    scenes_with_images = sum(
-        1 for scene in scenes if scene.get("multimedia", {}).get("image_tags", [])
-    )
-    if scenes_with_images == 0:
-        warnings.append(
-            "No image tags found in any scene - visual content may be missing"
-        )
-        feedback["missing_tags"].append("Images: No visual content")
-    elif (
-        scenes_with_images < len(scenes) * 0.5
-    ):  # Less than half the scenes have images
-        feedback["quality_suggestions"].append(
-            f"Only {scenes_with_images}/{len(scenes)} scenes have images - consider adding more visual content"
-        )
+        self.scene_count += 1
+        self.total_dialogues += dialogue_count
+        if dialogue_count == 0:
+            self.empty_scenes.append(scene_name)
 
-    # Log validation summary
-    logger.info(
-        f"Content validation: {len(warnings)} warnings, {len(feedback['missing_tags']) + len(feedback['format_violations']) + len(feedback['quality_suggestions'])} feedback items"
-    )
+        for character, char_count in partial["characters_by_speaker"].items():
+            self.characters_by_speaker[character] = (
+                self.characters_by_speaker.get(character, 0) + char_count
+            )
+            self.total_characters += char_count
 
-    return {"warnings": warnings, "feedback": feedback}
+        self.short_dialogues.extend((scene_name, text) for text in partial["short_dialogues"])
+        self.oversized_dialogues.extend(
+            (scene_name, char_count) for char_count in partial["oversized_dialogues"]
+        )
 
+        self.scene_timings.append(
+            {
+                "scene_id": partial["scene_id"],
+                "dialogue_duration_seconds": round(partial["dialogue_duration_seconds"], 2),
+                "word_count": partial["word_count"],
+                "dialogue_count": dialogue_count,
+                "estimated_reading_speed_wpm": self.speech_rate,
+            }
+        )
+        self.total_dialogue_duration += partial["dialogue_duration_seconds"]
+        self.total_words += partial["word_count"]
 
-def calculate_character_counts(scenes: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Calculate character counts for cost estimation."""
-    character_counts = {}
-    total_characters = 0
+        for tag_type, tag_count in partial["tag_counts"].items():
+            if tag_count:
+                self.found_multimedia.add(
+                    self.TAG_NAMES.get(tag_type, tag_type.replace("_tags", "").upper() + ":")
+                )
+            if tag_type in self.tag_counts:
+                self.tag_counts[tag_type] += tag_count
+        if partial["has_images"]:
+            self.scenes_with_images += 1
+
+        return self
+
+    def add_scene(self, scene: Dict[str, Any]) -> "EpisodeAccumulator":
+        """Fold one scene into the aggregates."""
+        return self.add_partial(self.summarize_scene(scene))
+
+    def add_scenes(
+        self,
+        scenes: Iterable[Dict[str, Any]],
+        summaries: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> "EpisodeAccumulator":
+        """Fold every scene into the aggregates.
+
+        With ``summaries`` (scene_content_hash -> partial, see
+        load_scene_summaries), matching scenes are folded in from their stored
+        partial instead of walking their dialogues again, and every scene's
+        partial is kept in ``scene_summaries`` for save_scene_summaries.
+        """
+        if summaries is None:
+            for scene in scenes:
+                self.add_scene(scene)
+            return self
+
+        for scene in scenes:
+            scene_hash = scene_content_hash(scene["scene_name"], scene["content"])
+            partial = summaries.get(scene_hash)
+            if partial is None:
+                partial = self.summarize_scene(scene)
+            else:
+                # Scene ids are positional; the stored partial may come from another slot
+                partial = {**partial, "scene_id": scene["scene_id"]}
+            self.scene_summaries[scene_hash] = partial
+            self.add_partial(partial)
+        return self
+
+    def character_counts(self) -> Dict[str, Any]:
+        """Character counts for cost estimation."""
+        return {
+            "total_characters": self.total_characters,
+            "by_speaker": dict(self.characters_by_speaker),
+        }
 
-    for scene in scenes:
-        for dialogue in scene.get("dialogues", []):
-            character = dialogue["character"]
-            char_count = dialogue["character_count"]
+    def multimedia_counts(self) -> Dict[str, int]:
+        """Multimedia tag counts for cost estimation."""
+        return {
+            "image_generation_count": self.tag_counts["image_tags"],
+            "sfx_count": self.tag_counts["sfx_tags"],
+            "music_cue_count": self.tag_counts["music_tags"],
+            "ambient_count": self.tag_counts["ambient_tags"],
+            "transition_count": self.tag_counts["transition_tags"],
+        }
 
-            if character not in character_counts:
-                character_counts[character] = 0
-            character_counts[character] += char_count
-            total_characters += char_count
+    def timing_estimates(self) -> Dict[str, Any]:
+        """Timing estimates for dialogue and scenes."""
+        # Add scene transition time (between scenes, not before first or after last)
+        num_scene_transitions = max(0, self.scene_count - 1)
+        total_transition_duration = num_scene_transitions * self.scene_transition_duration
 
-    return {"total_characters": total_characters, "by_speaker": character_counts}
+        # Calculate total episode duration
+        total_duration = self.total_dialogue_duration + total_transition_duration
 
+        return {
+            "total_duration_seconds": round(total_duration, 2),
+            "total_duration_minutes": round(total_duration / 60, 2),
+            "dialogue_duration_seconds": round(self.total_dialogue_duration, 2),
+            "transition_duration_seconds": round(total_transition_duration, 2),
+            "total_words": self.total_words,
+            "average_speech_rate_wpm": self.speech_rate,
+            "scene_count": self.scene_count,
+            "scene_timings": list(self.scene_timings),
+        }
 
-def calculate_detailed_costs(
-    scenes: List[Dict[str, Any]], config: Dict[str, Any]
-) -> Dict[str, Any]:
-    """Calculate detailed cost breakdown for all pipeline components."""
-    cost_config = config.get("cost_estimation", {})
+    def detailed_costs(self) -> Dict[str, Any]:
+        """Detailed cost breakdown for all pipeline components."""
+        cost_config = self.config.get("cost_estimation", {})
 
-    # Voice generation costs (ElevenLabs)
-    character_stats = calculate_character_counts(scenes)
-    elevenlabs_cost_per_char = cost_config.get("elevenlabs_cost_per_character", 0.0003)
-    voice_generation_cost = (
-        character_stats["total_characters"] * elevenlabs_cost_per_char
-    )
+        # Voice generation costs (ElevenLabs)
+        elevenlabs_cost_per_char = cost_config.get("elevenlabs_cost_per_character", 0.0003)
+        voice_generation_cost = self.total_characters * elevenlabs_cost_per_char
 
-    # Voice costs by speaker
-    voice_costs_by_speaker = {}
-    for speaker, char_count in character_stats["by_speaker"].items():
-        voice_costs_by_speaker[speaker] = char_count * elevenlabs_cost_per_char
+        # Voice costs by speaker
+        voice_costs_by_speaker = {}
+        for speaker, char_count in self.characters_by_speaker.items():
+            voice_costs_by_speaker[speaker] = char_count * elevenlabs_cost_per_char
 
-    # Multimedia costs
-    multimedia_stats = calculate_multimedia_counts(scenes)
-    image_cost_per_prompt = cost_config.get("image_generation_cost_per_prompt", 0.05)
-    sfx_cost_per_effect = cost_config.get("sfx_cost_per_effect", 0.02)
-    music_cost_per_cue = cost_config.get("music_cost_per_cue", 0.10)
+        # Multimedia costs
+        multimedia_stats = self.multimedia_counts()
+        image_cost_per_prompt = cost_config.get("image_generation_cost_per_prompt", 0.05)
+        sfx_cost_per_effect = cost_config.get("sfx_cost_per_effect", 0.02)
+        music_cost_per_cue = cost_config.get("music_cost_per_cue", 0.10)
 
-    image_generation_cost = (
-        multimedia_stats["image_generation_count"] * image_cost_per_prompt
-    )
-    sfx_processing_cost = multimedia_stats["sfx_count"] * sfx_cost_per_effect
-    music_processing_cost = multimedia_stats["music_cue_count"] * music_cost_per_cue
-    ambient_processing_cost = (
-        multimedia_stats["ambient_count"] * sfx_cost_per_effect
-    )  # Same rate as SFX
-    transition_processing_cost = (
-        multimedia_stats["transition_count"] * sfx_cost_per_effect
-    )  # Same rate as SFX
-
-    # Total audio processing cost
-    audio_processing_cost = (
-        sfx_processing_cost
-        + music_processing_cost
-        + ambient_processing_cost
-        + transition_processing_cost
-    )
+        image_generation_cost = (
+            multimedia_stats["image_generation_count"] * image_cost_per_prompt
+        )
+        sfx_processing_cost = multimedia_stats["sfx_count"] * sfx_cost_per_effect
+        music_processing_cost = multimedia_stats["music_cue_count"] * music_cost_per_cue
+        ambient_processing_cost = (
+            multimedia_stats["ambient_count"] * sfx_cost_per_effect
+        )  # Same rate as SFX
+        transition_processing_cost = (
+            multimedia_stats["transition_count"] * sfx_cost_per_effect
+        )  # Same rate as SFX
+
+        # Total audio processing cost
+        audio_processing_cost = (
+            sfx_processing_cost
+            + music_processing_cost
+            + ambient_processing_cost
+            + transition_processing_cost
+        )
 
-    # Total episode cost
-    total_episode_cost = (
-        voice_generation_cost + image_generation_cost + audio_processing_cost
-    )
+        # Total episode cost
+        total_episode_cost = (
+            voice_generation_cost + image_generation_cost + audio_processing_cost
+        )
 
-    # Cost breakdown by pipeline component
-    pipeline_costs = {
-        "step_1_script_parsing": 0.0,  # No cost for parsing
-        "step_2_voice_generation": voice_generation_cost,
-        "step_3_image_generation": image_generation_cost,
-        "step_4_cost_estimation": 0.0,  # No cost for cost estimation
-        "step_5_audio_processing": audio_processing_cost,
-        "step_6_quality_assurance": 0.0,  # No cost for QA
-        "step_7_video_assembly": 0.0,  # No external cost for video assembly
-        "step_8_distribution": 0.0,  # No cost for distribution processing
-    }
+        # Cost breakdown by pipeline component
+        pipeline_costs = {
+            "step_1_script_parsing": 0.0,  # No cost for parsing
+            "step_2_voice_generation": voice_generation_cost,
+            "step_3_image_generation": image_generation_cost,
+            "step_4_cost_estimation": 0.0,  # No cost for cost estimation
+            "step_5_audio_processing": audio_processing_cost,
+            "step_6_quality_assurance": 0.0,  # No cost for QA
+            "step_7_video_assembly": 0.0,  # No external cost for video assembly
+            "step_8_distribution": 0.0,  # No cost for distribution processing
+        }
 
-    return {
-        "total_episode_cost": round(total_episode_cost, 4),
-        "currency": cost_config.get("currency", "USD"),
-        "cost_breakdown": {
-            "voice_generation": {
-                "total_cost": round(voice_generation_cost, 4),
-                "cost_per_character": elevenlabs_cost_per_char,
-                "total_characters": character_stats["total_characters"],
-                "costs_by_speaker": {
-                    speaker: round(cost, 4)
-                    for speaker, cost in voice_costs_by_speaker.items()
+        return {
+            "total_episode_cost": round(total_episode_cost, 4),
+            "currency": cost_config.get("currency", "USD"),
+            "cost_breakdown": {
+                "voice_generation": {
+                    "total_cost": round(voice_generation_cost, 4),
+                    "cost_per_character": elevenlabs_cost_per_char,
+                    "total_characters": self.total_characters,
+                    "costs_by_speaker": {
+                        speaker: round(cost, 4)
+                        for speaker, cost in voice_costs_by_speaker.items()
+                    },
                 },
-            },
-            "image_generation": {
-                "total_cost": round(image_generation_cost, 4),
-                "cost_per_image": image_cost_per_prompt,
-                "total_images": multimedia_stats["image_generation_count"],
-            },
-            "audio_processing": {
-                "total_cost": round(audio_processing_cost, 4),
-                "sfx_cost": round(sfx_processing_cost, 4),
-                "music_cost": round(music_processing_cost, 4),
-                "ambient_cost": round(ambient_processing_cost, 4),
-                "transition_cost": round(transition_processing_cost, 4),
-                "breakdown": {
-                    "sfx_count": multimedia_stats["sfx_count"],
-                    "music_count": multimedia_stats["music_cue_count"],
-                    "ambient_count": multimedia_stats["ambient_count"],
-                    "transition_count": multimedia_stats["transition_count"],
+                "image_generation": {
+                    "total_cost": round(image_generation_cost, 4),
+                    "cost_per_image": image_cost_per_prompt,
+                    "total_images": multimedia_stats["image_generation_count"],
+                },
+                "audio_processing": {
+                    "total_cost": round(audio_processing_cost, 4),
+                    "sfx_cost": round(sfx_processing_cost, 4),
+                    "music_cost": round(music_processing_cost, 4),
+                    "ambient_cost": round(ambient_processing_cost, 4),
+                    "transition_cost": round(transition_processing_cost, 4),
+                    "breakdown": {
+                        "sfx_count": multimedia_stats["sfx_count"],
+                        "music_count": multimedia_stats["music_cue_count"],
+                        "ambient_count": multimedia_stats["ambient_count"],
+                        "transition_count": multimedia_stats["transition_count"],
+                    },
                 },
             },
-        },
-        "pipeline_component_costs": pipeline_costs,
-        "cost_per_minute": round(
-            total_episode_cost
-            / (
-                config.get("episode_settings", {}).get(
-                    "expected_characters_per_minute", 200
-                )
-                / 60
-            ),
-            4,
-        )
-        if total_episode_cost > 0
-        else 0.0,
-    }
+            "pipeline_component_costs": pipeline_costs,
+            "cost_per_minute": round(
+                total_episode_cost
+                / (
+                    self.config.get("episode_settings", {}).get(
+                        "expected_characters_per_minute", 200
+                    )
+                    / 60
+                ),
+                4,
+            )
+            if total_episode_cost > 0
+            else 0.0,
+        }
 
+    def output_metadata(self, input_path: Path, processing_time: float) -> Dict[str, Any]:
+        """Metadata section for the parsed output."""
+        character_stats = self.character_counts()
+        multimedia_stats = self.multimedia_counts()
 
-def calculate_multimedia_counts(scenes: List[Dict[str, Any]]) -> Dict[str, int]:
-    """Calculate multimedia tag counts for cost estimation."""
-    counts = {
-        "image_generation_count": 0,
-        "sfx_count": 0,
-        "music_cue_count": 0,
-        "ambient_count": 0,
-        "transition_count": 0,
-    }
+        return {
+            "processing_timestamp": datetime.now().isoformat(),
+            "input_file_path": str(input_path.absolute()),
+            "total_processing_time_seconds": round(processing_time, 3),
+            "estimated_downstream_costs": {
+                "elevenlabs_character_count": character_stats["total_characters"],
+                "image_generation_count": multimedia_stats["image_generation_count"],
+                "sfx_count": multimedia_stats["sfx_count"],
+                "music_cue_count": multimedia_stats["music_cue_count"],
+                "ambient_count": multimedia_stats["ambient_count"],
+                "transition_count": multimedia_stats["transition_count"],
+            },
+            "detailed_cost_analysis": self.detailed_costs(),
+            "timing_estimates": self.timing_estimates(),
+            "validation_status": "passed",  # Will be determined by validation and schema checks
+            "character_count_by_speaker": character_stats["by_speaker"],
+        }
 
-    for scene in scenes:
-        multimedia = scene.get("multimedia", {})
-        counts["image_generation_count"] += len(multimedia.get("image_tags", []))
-        counts["sfx_count"] += len(multimedia.get("sfx_tags", []))
-        counts["music_cue_count"] += len(multimedia.get("music_tags", []))
-        counts["ambient_count"] += len(multimedia.get("ambient_tags", []))
-        counts["transition_count"] += len(multimedia.get("transition_tags", []))
+    def validation(self, logger: logging.Logger) -> Dict[str, Any]:
+        """Validate the accumulated episode and generate warnings/feedback."""
+        validation_config = self.config.get("validation", {})
+        warnings: List[str] = []
+        feedback: Dict[str, List[str]] = {
+            "missing_tags": [],
+            "format_violations": [],
+            "quality_suggestions": [],
+        }
 
-    return counts
+        # Check for required scenes
+        if not self.scene_count:
+            warnings.append("No scene markers found. Expected format: ## **[SCENE: NAME]**")
+            feedback["format_violations"].append("Missing scene structure")
 
+        # Check for missing required characters
+        required_characters = validation_config.get(
+            "required_characters", ["THORAK", "ZARA"]
+        )
+        missing_characters = set(required_characters) - set(self.characters_by_speaker)
+        if missing_characters:
+            for char in missing_characters:
+                warnings.append(f"Required character '{char}' not found in any dialogue")
+                feedback["missing_tags"].append(f"Character: {char}")
+
+        # Check for missing multimedia types
+        required_multimedia = validation_config.get("multimedia_tags", [])
+        missing_multimedia = set(required_multimedia) - self.found_multimedia
+        if missing_multimedia and validation_config.get("warning_on_missing_tags", True):
+            for tag in missing_multimedia:
+                warnings.append(f"No {tag} tags found in episode")
+                feedback["missing_tags"].append(f"Multimedia: {tag}")
+
+        # Content quality checks
+        if self.total_dialogues < 10:
+            feedback["quality_suggestions"].append(
+                f"Episode has only {self.total_dialogues} dialogues - consider adding more content"
+            )
 
-def calculate_timing_estimates(
-    scenes: List[Dict[str, Any]], config: Dict[str, Any]
+        if self.total_characters < 1000:
+            feedback["quality_suggestions"].append(
+                f"Episode has only {self.total_characters} characters - "
+                "may be too short for podcast format"
+            )
+
+        # Check for scene balance
+        if self.scene_count:
+            avg_dialogues_per_scene = self.total_dialogues / self.scene_count
+            if avg_dialogues_per_scene < 2:
+                feedback["quality_suggestions"].append(
+                    "Some scenes have very few dialogues - consider consolidating or expanding"
+                )
+
+            # Check for scenes with no dialogues
+            for scene_name in self.empty_scenes:
+                warnings.append(f"Scene '{scene_name}' contains no dialogue")
+                feedback["format_violations"].append(f"Empty scene: {scene_name}")
+
+        # Check dialogue format compliance
+        for scene_name, text in self.short_dialogues:
+            feedback["quality_suggestions"].append(
+                f"Very short dialogue in {scene_name}: '{text[:50]}'"
+            )
+
+        for scene_name, char_count in self.oversized_dialogues:
+            warnings.append(
+                f"Extremely long dialogue in {scene_name} ({char_count} chars) - "
+                "check for formatting errors"
+            )
+            feedback["format_violations"].append(f"Oversized dialogue in {scene_name}")
+
+        # Check multimedia distribution
+        if self.scenes_with_images == 0:
+            warnings.append(
+                "No image tags found in any scene - visual content may be missing"
+            )
+            feedback["missing_tags"].append("Images: No visual content")
+        elif (
+            self.scenes_with_images < self.scene_count * 0.5
+        ):  # Less than half the scenes have images
+            feedback["quality_suggestions"].append(
+                f"Only {self.scenes_with_images}/{self.scene_count} scenes have images - "
+                "consider adding more visual content"
+            )
+
+        # Log validation summary
+        feedback_count = (
+            len(feedback["missing_tags"])
+            + len(feedback["format_violations"])
+            + len(feedback["quality_suggestions"])
+        )
+        logger.info(
+            f"Content validation: {len(warnings)} warnings, {feedback_count} feedback items"
+        )
+
+        return {"warnings": warnings, "feedback": feedback}
+
+
+def validate_episode_content(
+    content: str,
+    scenes: List[Dict[str, Any]],
+    config: Dict[str, Any],
+    logger: logging.Logger,
 ) -> Dict[str, Any]:
-    """Calculate timing estimates for dialogue and scenes."""
-    episode_settings = config.get("episode_settings", {})
-    speech_rate = episode_settings.get("default_speech_rate_words_per_minute", 150)
-    pause_between_speakers = episode_settings.get(
-        "pause_duration_between_speakers_seconds", 0.5
-    )
-    scene_transition_duration = episode_settings.get(
-        "scene_transition_duration_seconds", 1.0
-    )
+    """Validate episode content and generate warnings/feedback."""
+    return EpisodeAccumulator(config).add_scenes(scenes).validation(logger)
 
-    total_dialogue_duration = 0
-    total_words = 0
-    scene_timings = []
 
-    for scene in scenes:
-        scene_dialogue_duration = 0
-        scene_words = 0
-        dialogue_count = len(scene.get("dialogues", []))
+def calculate_character_counts(scenes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Calculate character counts for cost estimation."""
+    return EpisodeAccumulator().add_scenes(scenes).character_counts()
 
-        # Calculate dialogue duration for this scene
-        for dialogue in scene.get("dialogues", []):
-            text = dialogue["text"]
-            # Estimate words (simple split by spaces)
-            words = len(text.split())
-            scene_words += words
 
-            # Calculate speech duration (words per minute to seconds)
-            speech_duration = (words / speech_rate) * 60
-            scene_dialogue_duration += speech_duration
+def calculate_detailed_costs(
+    scenes: List[Dict[str, Any]], config: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Calculate detailed cost breakdown for all pipeline components."""
+    return EpisodeAccumulator(config).add_scenes(scenes).detailed_costs()
 
-        # Add pauses between speakers (one less pause than dialogue count)
-        if dialogue_count > 1:
-            scene_dialogue_duration += (dialogue_count - 1) * pause_between_speakers
 
-        # Store scene timing data
-        scene_timing = {
-            "scene_id": scene["scene_id"],
-            "dialogue_duration_seconds": round(scene_dialogue_duration, 2),
-            "word_count": scene_words,
-            "dialogue_count": dialogue_count,
-            "estimated_reading_speed_wpm": speech_rate,
-        }
-        scene_timings.append(scene_timing)
-
-        total_dialogue_duration += scene_dialogue_duration
-        total_words += scene_words
-
-    # Add scene transition time (between scenes, not before first or after last)
-    num_scene_transitions = max(0, len(scenes) - 1)
-    total_transition_duration = num_scene_transitions * scene_transition_duration
-
-    # Calculate total episode duration
-    total_duration = total_dialogue_duration + total_transition_duration
-
-    timing_data = {
-        "total_duration_seconds": round(total_duration, 2),
-        "total_duration_minutes": round(total_duration / 60, 2),
-        "dialogue_duration_seconds": round(total_dialogue_duration, 2),
-        "transition_duration_seconds": round(total_transition_duration, 2),
-        "total_words": total_words,
-        "average_speech_rate_wpm": speech_rate,
-        "scene_count": len(scenes),
-        "scene_timings": scene_timings,
-    }
+def calculate_multimedia_counts(scenes: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Calculate multimedia tag counts for cost estimation."""
+    return EpisodeAccumulator().add_scenes(scenes).multimedia_counts()
 
-    return timing_data
+
+def calculate_timing_estimates(
+    scenes: List[Dict[str, Any]], config: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Calculate timing estimates for dialogue and scenes."""
+    return EpisodeAccumulator(config).add_scenes(scenes).timing_estimates()
 
 
-def load_output_schema() -> Dict[str, Any]:
-    """Load the JSON schema for output validation."""
-    schema_path = Path("schema/output_schema.json")
+OUTPUT_SCHEMA_FILES = {1: "output_schema.json", 2: "output_schema_v2.json"}
+
+
+@lru_cache(maxsize=None)
+def load_output_schema(schema_version: int = 1) -> Dict[str, Any]:
+    """Load the JSON schema for output validation (read once per process)."""
+    schema_path = Path("schema") / OUTPUT_SCHEMA_FILES[schema_version]
     try:
         with open(schema_path, "r", encoding="utf-8") as file:
             return json.load(file)
@@ -729,30 +1439,128 @@ def load_output_schema() -> Dict[str, Any]:
         raise ValueError(f"Invalid JSON in schema file {schema_path}: {e}")
 
 
+def is_iso_datetime(value: Any) -> bool:
+    """Format check for "date-time" that accepts the parser's naive ISO timestamps."""
+    if not isinstance(value, str):
+        return True
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+class CompiledSchemaValidator:
+    """An output schema compiled once and reused for every validated episode."""
+
+    __slots__ = ("backend", "_validate", "_iter_errors", "schema_error")
+
+    def __init__(self, schema: Dict[str, Any], backend: str):
+        self.backend = backend
+        self._validate: Optional[Callable[[Any], Any]] = None
+        self._iter_errors: Optional[Callable[[Any], Iterable[Any]]] = None
+        self.schema_error: Optional[str] = None
+
+        if backend == "fastjsonschema":
+            try:
+                self._validate = fastjsonschema.compile(
+                    schema, formats={"date-time": is_iso_datetime}
+                )
+            except fastjsonschema.JsonSchemaDefinitionException as e:
+                self.schema_error = f"Schema definition error: {e}"
+            return
+
+        validator_class = jsonschema.validators.validator_for(schema)
+        try:
+            validator_class.check_schema(schema)
+        except jsonschema.SchemaError as e:
+            self.schema_error = f"Schema definition error: {e.message}"
+            return
+        format_checker = jsonschema.FormatChecker()
+        format_checker.checks("date-time")(is_iso_datetime)
+        self._iter_errors = validator_class(schema, format_checker=format_checker).iter_errors
+
+    def errors(self, output_data: Dict[str, Any], collect_all: bool = False) -> List[str]:
+        """Return schema error messages: the most relevant one, or all with collect_all."""
+        if self.schema_error:
+            return [self.schema_error]
+
+        if self._validate is not None:
+            # fastjsonschema stops at the first error
+            try:
+                self._validate(output_data)
+            except fastjsonschema.JsonSchemaValueException as e:
+                path = ".".join(str(p) for p in (e.path or [])[1:])
+                return [f"Schema validation error: {e.message} at {path}"]
+            return []
+
+        # Without a schema error or fastjsonschema, __init__ set up jsonschema
+        iter_errors = self._iter_errors
+        if iter_errors is None:
+            raise RuntimeError(f"No schema validator compiled for backend {self.backend}")
+        if collect_all:
+            found = sorted(
+                iter_errors(output_data), key=lambda e: [str(p) for p in e.absolute_path]
+            )
+        else:
+            best = jsonschema.exceptions.best_match(iter_errors(output_data))
+            found = [best] if best is not None else []
+
+        return [
+            f"Schema validation error: {e.message} at {'.'.join(str(p) for p in e.absolute_path)}"
+            for e in found
+        ]
+
+
+@lru_cache(maxsize=None)
+def get_schema_validator(
+    schema_version: int = 1, backend: str = "auto"
+) -> Optional[CompiledSchemaValidator]:
+    """Build the validator for an output schema once per process.
+
+    ``backend`` is "jsonschema", "fastjsonschema" or "auto" (jsonschema when
+    installed, else fastjsonschema). Returns None when no backend is
+    available or the schema file is missing.
+    """
+    schema = load_output_schema(schema_version)
+    if not schema:
+        return None
+
+    if backend == "auto":
+        backend = "jsonschema" if JSONSCHEMA_AVAILABLE else "fastjsonschema"
+    available = {"jsonschema": JSONSCHEMA_AVAILABLE, "fastjsonschema": FASTJSONSCHEMA_AVAILABLE}
+    if not available.get(backend, False):
+        return None
+
+    return CompiledSchemaValidator(schema, backend)
+
+
 def validate_output_against_schema(
-    output_data: Dict[str, Any], logger: logging.Logger
+    output_data: Dict[str, Any],
+    logger: logging.Logger,
+    schema_version: int = 1,
+    config: Optional[Dict[str, Any]] = None,
 ) -> List[str]:
     """Validate output data against JSON schema. Returns list of validation errors."""
+    schema_config = (config or {}).get("schema_validation", {})
+    backend = schema_config.get("backend", "auto")
+
     if not SCHEMA_VALIDATION_AVAILABLE:
         logger.warning("jsonschema package not available - skipping schema validation")
         return []
 
-    schema = load_output_schema()
-    if not schema:
-        logger.warning("Output schema not found - skipping schema validation")
+    validator = get_schema_validator(schema_version, backend)
+    if validator is None:
+        if not load_output_schema(schema_version):
+            logger.warning("Output schema not found - skipping schema validation")
+        else:
+            logger.warning(f"{backend} package not available - skipping schema validation")
         return []
 
-    errors = []
-    try:
-        jsonschema.validate(output_data, schema)
+    errors = validator.errors(output_data, schema_config.get("collect_all_errors", False))
+    if not errors:
         logger.info("✓ Output validates against JSON schema")
-    except jsonschema.ValidationError as e:
-        error_msg = f"Schema validation error: {e.message} at {'.'.join(str(p) for p in e.absolute_path)}"
-        errors.append(error_msg)
-        logger.error(error_msg)
-    except jsonschema.SchemaError as e:
-        error_msg = f"Schema definition error: {e.message}"
-        errors.append(error_msg)
+    for error_msg in errors:
         logger.error(error_msg)
 
     return errors
@@ -784,29 +1592,48 @@ def generate_output_metadata(
     processing_time: float,
     scenes: List[Dict[str, Any]],
     config: Dict[str, Any],
+    accumulator: Optional[EpisodeAccumulator] = None,
 ) -> Dict[str, Any]:
-    """Generate metadata for the parsed output."""
-    character_stats = calculate_character_counts(scenes)
-    multimedia_stats = calculate_multimedia_counts(scenes)
-    timing_stats = calculate_timing_estimates(scenes, config)
-    detailed_costs = calculate_detailed_costs(scenes, config)
+    """Generate metadata for the parsed output.
+
+    ``accumulator`` must already hold ``scenes`` (see parse_episode_script);
+    without one the scenes are walked here.
+    """
+    if accumulator is None:
+        accumulator = EpisodeAccumulator(config).add_scenes(scenes)
+    return accumulator.output_metadata(input_path, processing_time)
+
+
+def output_json_indent(config: Dict[str, Any]) -> Optional[int]:
+    """Return the configured JSON indent; 0 or null writes compact output."""
+    indent = config.get("output", {}).get("json_indent", 2)
+    return int(indent) if indent else None
+
+
+def output_schema_settings(config: Dict[str, Any]) -> Tuple[int, bool]:
+    """Return the configured output schema version and v2 content flag."""
+    output_config = config.get("output", {})
+    schema_version = output_config.get("schema_version", 1)
+    if schema_version not in OUTPUT_SCHEMA_FILES:
+        raise ValueError(f"Unsupported output schema version: {schema_version}")
+    return schema_version, output_config.get("include_scene_content", False)
+
+
+def build_output_data(
+    parsed_data: Dict[str, Any],
+    metadata: Dict[str, Any],
+    schema_version: int = 1,
+    include_content: bool = False,
+) -> Dict[str, Any]:
+    """Combine parsed data with metadata in the requested output schema layout."""
+    if schema_version == 1:
+        return {"metadata": metadata, **parsed_data}
 
     return {
-        "processing_timestamp": datetime.now().isoformat(),
-        "input_file_path": str(input_path.absolute()),
-        "total_processing_time_seconds": round(processing_time, 3),
-        "estimated_downstream_costs": {
-            "elevenlabs_character_count": character_stats["total_characters"],
-            "image_generation_count": multimedia_stats["image_generation_count"],
-            "sfx_count": multimedia_stats["sfx_count"],
-            "music_cue_count": multimedia_stats["music_cue_count"],
-            "ambient_count": multimedia_stats["ambient_count"],
-            "transition_count": multimedia_stats["transition_count"],
-        },
-        "detailed_cost_analysis": detailed_costs,
-        "timing_estimates": timing_stats,
-        "validation_status": "passed",  # Will be determined by validation and schema checks
-        "character_count_by_speaker": character_stats["by_speaker"],
+        "schema_version": schema_version,
+        "metadata": metadata,
+        **parsed_data,
+        "scenes": [compact_scene(scene, include_content) for scene in parsed_data["scenes"]],
     }
 
 
@@ -820,9 +1647,10 @@ def save_output_files(
     config: Dict[str, Any],
 ) -> None:
     """Save the parsed data and metadata to output files."""
+    schema_version, include_content = output_schema_settings(config)
 
     # Combine parsed data with metadata
-    output_data = {"metadata": metadata, **parsed_data}
+    output_data = build_output_data(parsed_data, metadata, schema_version, include_content)
 
     # Determine content validation status first
     content_validation_status = determine_validation_status(
@@ -830,7 +1658,7 @@ def save_output_files(
     )
 
     # Validate against schema and update metadata
-    schema_errors = validate_output_against_schema(output_data, logger)
+    schema_errors = validate_output_against_schema(output_data, logger, schema_version, config)
     if schema_errors:
         final_status = "failed"
         # Add schema errors to warnings
@@ -840,7 +1668,7 @@ def save_output_files(
             [f"Schema validation: {error}" for error in schema_errors]
         )
         # Recreate output data with updated metadata and warnings
-        output_data = {"metadata": metadata, **parsed_data}
+        output_data = build_output_data(parsed_data, metadata, schema_version, include_content)
     else:
         # Use content validation status if schema validation passes
         final_status = content_validation_status
@@ -850,12 +1678,28 @@ def save_output_files(
 
     # Main JSON output
     json_file = output_path / f"{episode_name}.json"
-    with open(json_file, "w", encoding="utf-8") as file:
-        json.dump(output_data, file, indent=2, ensure_ascii=False)
+    dump_json(output_data, json_file, output_json_indent(config))
 
     logger.info(f"✓ JSON output saved: {json_file}")
 
-    # Validation report
+    write_validation_report(
+        output_path, episode_name, metadata, parsed_data.get("warnings", []), schema_errors, logger
+    )
+
+    # Debug output (if enabled)
+    if debug:
+        write_debug_output(output_path, episode_name, metadata, logger)
+
+
+def write_validation_report(
+    output_path: Path,
+    episode_name: str,
+    metadata: Dict[str, Any],
+    warnings: List[str],
+    schema_errors: List[str],
+    logger: logging.Logger,
+) -> None:
+    """Write the human-readable validation report."""
     validation_file = output_path / f"{episode_name}_validation.txt"
     with open(validation_file, "w", encoding="utf-8") as file:
         file.write(f"versusMonster Script Parser - Validation Report\n")
@@ -871,31 +1715,570 @@ def save_output_files(
                 file.write(f"  - {error}\n")
             file.write("\n")
 
-        if parsed_data.get("warnings"):
+        if warnings:
             file.write("WARNINGS:\n")
-            for warning in parsed_data["warnings"]:
+            for warning in warnings:
                 file.write(f"  - {warning}\n")
         else:
             file.write("No warnings generated.\n")
 
     logger.info(f"✓ Validation report saved: {validation_file}")
 
-    # Debug output (if enabled)
+
+def write_debug_output(
+    output_path: Path, episode_name: str, metadata: Dict[str, Any], logger: logging.Logger
+) -> None:
+    """Write the debug JSON output."""
+    debug_path = output_path / "debug"
+    debug_file = debug_path / f"{episode_name}_debug.json"
+    dump_json(
+        {
+            "debug_info": {
+                "full_metadata": metadata,
+                "parsing_details": "Debug information will be added in subsequent tasks",
+            }
+        },
+        debug_file,
+    )
+    logger.info(f"✓ Debug output saved: {debug_file}")
+
+
+def write_episode_json_stream(
+    json_file: Path,
+    scenes: Iterable[Dict[str, Any]],
+    build_sections: Callable[[], Dict[str, Any]],
+    indent: Optional[int] = 2,
+) -> int:
+    """Write episode JSON with the scenes array streamed through a spool file.
+
+    Scenes are serialized one at a time into a temporary spool next to the
+    output, so only the scene being written is held in memory. Once the scenes
+    are exhausted, ``build_sections`` returns the other top-level sections in
+    output order; the scenes array is placed right after "episode_metadata",
+    giving the same layout as save_output_files. Returns the scene count.
+    """
+    item_indent = " " * (indent or 0)
+    scene_indent = item_indent * 2
+    scene_count = 0
+
+    with tempfile.TemporaryFile("w+", encoding="utf-8", dir=json_file.parent) as spool:
+        for scene in scenes:
+            if scene_count:
+                spool.write(",\n")
+            scene_json = dumps_json(scene, indent).decode("utf-8")
+            # JSON strings never contain raw newlines, so re-indenting by line is safe
+            spool.write(scene_indent + scene_json.replace("\n", "\n" + scene_indent))
+            scene_count += 1
+
+        sections = build_sections()
+        entries = []
+        for key, value in sections.items():
+            value_json = dumps_json(value, indent).decode("utf-8")
+            key_json = dumps_json(key).decode("utf-8")
+            entries.append(
+                f"{item_indent}{key_json}: " + value_json.replace("\n", "\n" + item_indent)
+            )
+            if key == "episode_metadata":
+                entries.append(None)  # Scenes array goes here
+
+        spool.seek(0)
+        with open(json_file, "w", encoding="utf-8") as file:
+            file.write("{\n")
+            for position, entry in enumerate(entries):
+                if position:
+                    file.write(",\n")
+                if entry is not None:
+                    file.write(entry)
+                elif scene_count:
+                    file.write(f'{item_indent}"scenes": [\n')
+                    shutil.copyfileobj(spool, file)
+                    file.write(f"\n{item_indent}]")
+                else:
+                    file.write(f'{item_indent}"scenes": []')
+            file.write("\n}")
+
+    return scene_count
+
+
+def stream_episode_script(
+    input_path: Path,
+    output_path: Path,
+    episode_name: str,
+    start_time: float,
+    debug: bool,
+    logger: logging.Logger,
+    config: Dict[str, Any],
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Parse and save an episode with scenes streamed straight to the output file.
+
+    Scenes are written as soon as they are parsed and only their aggregates
+    are kept, so peak memory stays bounded by the largest scene. Schema
+    validation needs the whole document and is skipped in this mode.
+    Returns the metadata section and the warnings list.
+    """
+    logger.info(f"Streaming script from: {input_path}")
+    schema_version, include_content = output_schema_settings(config)
+    grammar = script_grammar(config)
+    accumulator = EpisodeAccumulator(config)
+    result: Dict[str, Any] = {}
+
+    def accumulated_scenes() -> Iterator[Dict[str, Any]]:
+        for scene in iter_scenes(input_path, logger, grammar):
+            accumulator.add_scene(scene)
+            yield scene if schema_version == 1 else compact_scene(scene, include_content)
+
+    def build_sections() -> Dict[str, Any]:
+        validation_results = accumulator.validation(logger)
+        metadata = accumulator.output_metadata(input_path, time.time() - start_time)
+        metadata["validation_status"] = determine_validation_status(
+            validation_results["warnings"], validation_results["feedback"], config
+        )
+        result["metadata"] = metadata
+        result["warnings"] = validation_results["warnings"]
+
+        sections = {"schema_version": schema_version} if schema_version != 1 else {}
+        return {
+            **sections,
+            "metadata": metadata,
+            "episode_metadata": build_episode_metadata(
+                input_path, read_content_preview(input_path), accumulator.scene_count
+            ),
+            "warnings": validation_results["warnings"],
+            "feedback": validation_results["feedback"],
+        }
+
+    json_file = output_path / f"{episode_name}.json"
+    write_episode_json_stream(
+        json_file, accumulated_scenes(), build_sections, output_json_indent(config)
+    )
+    logger.info(f"✓ JSON output saved: {json_file}")
+
+    metadata = result["metadata"]
+    write_validation_report(output_path, episode_name, metadata, result["warnings"], [], logger)
     if debug:
-        debug_path = output_path / "debug"
-        debug_file = debug_path / f"{episode_name}_debug.json"
-        with open(debug_file, "w", encoding="utf-8") as file:
-            json.dump(
-                {
-                    "debug_info": {
-                        "full_metadata": metadata,
-                        "parsing_details": "Debug information will be added in subsequent tasks",
-                    }
-                },
-                file,
-                indent=2,
+        write_debug_output(output_path, episode_name, metadata, logger)
+
+    return metadata, result["warnings"]
+
+
+PARSE_CACHE_VERSION = 1
+
+# Config sections that change parser output; editing any of them invalidates the cache
+PARSE_CACHE_CONFIG_SECTIONS = ("validation", "cost_estimation", "episode_settings")
+
+
+def compute_parse_cache_key(content_bytes: bytes, config: Dict[str, Any]) -> str:
+    """Build the cache key from the script bytes and the output-relevant config."""
+    relevant_config = {
+        section: config.get(section, {}) for section in PARSE_CACHE_CONFIG_SECTIONS
+    }
+    relevant_config["parser_version"] = config.get("parser", {}).get("version", "1.0")
+    relevant_config["cache_version"] = PARSE_CACHE_VERSION
+    if script_grammar(config).escape_tolerant:
+        # Only added when set, so existing strict-mode entries stay valid
+        relevant_config["escape_tolerant"] = True
+
+    digest = hashlib.sha256(hashlib.sha256(content_bytes).digest())
+    digest.update(json.dumps(relevant_config, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_cached_parse(
+    cache_dir: Path,
+    cache_key: str,
+    input_path: Path,
+    processing_time: float,
+    logger: logging.Logger,
+    content_preview: Optional[str] = None,
+) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Return (parsed_data, metadata) from the parse cache, or None on a miss.
+
+    Path-dependent fields and the processing timestamp are refreshed, and the
+    entry is touched so eviction sees it as recently used. ``content_preview``
+    overrides the preview read from ``input_path``.
+    """
+    cache_file = cache_dir / f"{cache_key}.json"
+    try:
+        entry = load_json(cache_file)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable parse cache entry {cache_file.name}: {e}")
+        return None
+
+    if entry.get("cache_version") != PARSE_CACHE_VERSION:
+        return None
+
+    try:
+        os.utime(cache_file)
+    except OSError:
+        pass
+
+    parsed_data = entry["parsed_data"]
+    if content_preview is None:
+        content_preview = read_content_preview(input_path)
+    parsed_data["episode_metadata"] = build_episode_metadata(
+        input_path, content_preview, len(parsed_data["scenes"])
+    )
+
+    metadata = entry["metadata"]
+    metadata["processing_timestamp"] = datetime.now().isoformat()
+    metadata["input_file_path"] = str(input_path.absolute())
+    metadata["total_processing_time_seconds"] = round(processing_time, 3)
+
+    logger.debug(f"Parse cache hit: {cache_file.name}")
+    return parsed_data, metadata
+
+
+def store_cached_parse(
+    cache_dir: Path,
+    cache_key: str,
+    parsed_data: Dict[str, Any],
+    metadata: Dict[str, Any],
+    cache_config: Dict[str, Any],
+    logger: logging.Logger,
+) -> None:
+    """Store a parse result in the cache, then evict least recently used entries."""
+    cache_file = cache_dir / f"{cache_key}.json"
+    entry = {
+        "cache_version": PARSE_CACHE_VERSION,
+        "parsed_data": parsed_data,
+        "metadata": metadata,
+    }
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file first so an interrupted run never leaves a partial entry
+        temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        dump_json(entry, temp_file, indent=None)
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Could not write parse cache entry: {e}")
+        return
+
+    logger.debug(f"Parse cache entry saved: {cache_file.name}")
+    evict_parse_cache(
+        cache_dir,
+        cache_config.get("max_entries", 256),
+        int(cache_config.get("max_size_mb", 100) * 1024 * 1024),
+        logger,
+    )
+
+
+def evict_parse_cache(
+    cache_dir: Path, max_entries: int, max_bytes: int, logger: logging.Logger
+) -> int:
+    """Remove least recently used cache entries beyond the count and size caps."""
+    entries = []
+    for cache_file in cache_dir.glob("*.json"):
+        try:
+            stat = cache_file.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, cache_file))
+
+    # Oldest modification time first; hits touch their entry
+    entries.sort()
+    total_bytes = sum(size for _, size, _ in entries)
+    remaining = len(entries)
+    removed = 0
+
+    for _, size, cache_file in entries:
+        if remaining <= max_entries and total_bytes <= max_bytes:
+            break
+        try:
+            cache_file.unlink()
+        except OSError:
+            continue
+        remaining -= 1
+        total_bytes -= size
+        removed += 1
+
+    if removed:
+        logger.debug(f"Evicted {removed} parse cache entries")
+    return removed
+
+
+def process_episode_file(
+    input_file: str,
+    output_dir: str,
+    config: Dict[str, Any],
+    logger: logging.Logger,
+    debug: bool = False,
+    use_cache: bool = True,
+    incremental: bool = False,
+    stream: bool = False,
+    start_time: Optional[float] = None,
+    normalize: bool = False,
+    write_normalized: bool = False,
+) -> Dict[str, Any]:
+    """Run parser steps 1-5 for one script and return a run summary.
+
+    With ``normalize``, tags are escaped in memory before parsing (see
+    normalize_script); streaming reads the file directly and does not
+    support it. Errors propagate to the caller, which decides how to
+    report them.
+    """
+    if start_time is None:
+        start_time = time.time()
+
+    # Step 1: Validate input file
+    logger.info(f"🔍 Step 1: Validating input file...")
+    input_path = validate_input_file(input_file)
+    logger.info(f"✓ Input file validated: {input_path}")
+
+    # Step 2: Prepare output directory
+    logger.info(f"📁 Step 2: Preparing output directory...")
+    output_path = ensure_output_directory(output_dir, debug)
+    logger.info(f"✓ Output directory ready: {output_path}")
+
+    episode_name = input_path.stem
+
+    if stream:
+        # Steps 3-5 fused: scenes go straight to disk as they are parsed
+        logger.info(f"📖 Step 3: Streaming episode script to output...")
+        metadata, warnings = stream_episode_script(
+            input_path, output_path, episode_name, start_time, debug, logger, config
+        )
+        processing_time = metadata["total_processing_time_seconds"]
+        scene_count = metadata["timing_estimates"]["scene_count"]
+        logger.info(f"✓ Episode parsing complete - streamed {scene_count} scenes")
+    else:
+        content = None
+        if normalize:
+            # The normalized text is parsed and cached directly; no intermediate file
+            content = normalize_script(input_path, write_normalized, logger)
+            config = escape_tolerant_config(config)
+
+        cache_config = config.get("parse_cache", {})
+        use_cache = use_cache and cache_config.get("enabled", True)
+        cache_dir = Path(cache_config.get("directory", "output/cache/parser"))
+        cache_key: Optional[str] = None
+        cached = None
+        if use_cache:
+            content_bytes = input_path.read_bytes() if content is None else content.encode("utf-8")
+            cache_key = compute_parse_cache_key(content_bytes, config)
+            cached = load_cached_parse(
+                cache_dir, cache_key, input_path, time.time() - start_time, logger,
+                content_preview=None if content is None else content[:201],
+            )
+
+        if cached:
+            # Steps 3-4 skipped: the script and relevant config are unchanged
+            logger.info(f"♻️ Step 3: Script unchanged - reusing cached parse...")
+            parsed_data, metadata = cached
+            processing_time = metadata["total_processing_time_seconds"]
+            scene_count = len(parsed_data.get("scenes", []))
+            logger.info(f"✓ Cached parse loaded - {scene_count} scenes")
+        else:
+            # Step 3: Parse the episode script
+            logger.info(f"📖 Step 3: Parsing episode script...")
+            reusable_scenes = None
+            scene_summaries = None
+            accumulator = EpisodeAccumulator(config)
+            summary_file = output_path / f"{episode_name}.scene_summaries.json"
+            if incremental:
+                reusable_scenes = load_reusable_scenes(
+                    output_path / f"{episode_name}.json", logger
+                )
+                scene_summaries = load_scene_summaries(summary_file, accumulator, logger)
+            parsed_data = parse_episode_script(
+                input_path, logger, config, reusable_scenes, accumulator, content,
+                scene_summaries
+            )
+            scene_count = len(parsed_data.get("scenes", []))
+            logger.info(f"✓ Episode parsing complete - found {scene_count} scenes")
+
+            # Step 4: Generate metadata and cost estimates
+            logger.info(f"📊 Step 4: Generating metadata and cost estimates...")
+            processing_time = time.time() - start_time
+            metadata = generate_output_metadata(
+                input_path, processing_time, parsed_data["scenes"], config, accumulator
             )
-        logger.info(f"✓ Debug output saved: {debug_file}")
+
+            if cache_key is not None:
+                store_cached_parse(
+                    cache_dir, cache_key, parsed_data, metadata, cache_config, logger
+                )
+            if incremental:
+                save_scene_summaries(summary_file, accumulator, logger)
+
+        # Step 5: Save output files
+        logger.info(f"💾 Step 5: Saving output files...")
+        save_output_files(
+            parsed_data, metadata, output_path, episode_name, debug, logger, config
+        )
+        warnings = parsed_data.get("warnings", [])
+
+    # Show cost summary
+    cost_data = metadata.get("detailed_cost_analysis", {})
+    total_cost = cost_data.get("total_episode_cost", 0)
+    total_chars = metadata.get("estimated_downstream_costs", {}).get(
+        "elevenlabs_character_count", 0
+    )
+    logger.info(
+        f"✓ Cost analysis complete - estimated ${total_cost:.2f} ({total_chars} characters)"
+    )
+
+    return {
+        "input_file": str(input_path),
+        "output_file": str(output_path / f"{episode_name}.json"),
+        "episode": episode_name,
+        "validation_status": metadata.get("validation_status", "unknown"),
+        "scene_count": scene_count,
+        "warnings_count": len(warnings),
+        "total_characters": total_chars,
+        "total_episode_cost": total_cost,
+        "processing_time_seconds": processing_time,
+    }
+
+
+def collect_batch_inputs(pattern: str) -> List[Path]:
+    """Resolve a directory or glob pattern to a sorted list of markdown scripts."""
+    path = Path(pattern)
+    if path.is_dir():
+        candidates = path.glob("*.md")
+    else:
+        candidates = (Path(match) for match in glob.glob(pattern, recursive=True))
+
+    return sorted(candidate for candidate in candidates if candidate.suffix.lower() == ".md")
+
+
+# Per-process state for batch workers, set once by init_batch_worker
+_batch_worker_state: Dict[str, Any] = {}
+
+
+def init_batch_worker(config: Dict[str, Any], options: Dict[str, Any]) -> None:
+    """Initialize a batch worker process once: config, logging and output schema."""
+    logger = setup_logging(options["debug"], config)
+    if not options["debug"]:
+        # Per-episode step logs from many workers would interleave; keep problems only
+        logging.getLogger("versusMonster").setLevel(logging.WARNING)
+
+    # Compile the schema validator up front so every episode in this worker reuses it
+    schema_version, _ = output_schema_settings(config)
+    get_schema_validator(
+        schema_version, config.get("schema_validation", {}).get("backend", "auto")
+    )
+
+    _batch_worker_state.update(config=config, options=options, logger=logger)
+
+
+def run_batch_episode(input_file: str) -> Dict[str, Any]:
+    """Parse one episode inside a batch worker, capturing any failure."""
+    options = _batch_worker_state["options"]
+    start_time = time.time()
+
+    try:
+        summary = process_episode_file(
+            input_file,
+            options["output_dir"],
+            _batch_worker_state["config"],
+            _batch_worker_state["logger"],
+            debug=options["debug"],
+            use_cache=options["use_cache"],
+            incremental=options["incremental"],
+            stream=options["stream"],
+            start_time=start_time,
+            normalize=options["normalize"],
+            write_normalized=options["write_normalized"],
+        )
+        summary["success"] = True
+        return summary
+    except Exception as e:
+        return {
+            "input_file": input_file,
+            "success": False,
+            "error": f"{type(e).__name__}: {e}",
+            "processing_time_seconds": round(time.time() - start_time, 3),
+        }
+
+
+def run_batch(args: argparse.Namespace, config: Dict[str, Any], logger: logging.Logger) -> int:
+    """Parse every script matched by --batch across a process pool.
+
+    Writes per-episode outputs as usual plus a combined batch_summary.json.
+    A failing script is reported in the summary without stopping the batch.
+    """
+    start_time = time.time()
+    input_files = collect_batch_inputs(args.batch)
+    if not input_files:
+        logger.error(f"❌ No markdown scripts matched: {args.batch}")
+        return 1
+
+    output_path = ensure_output_directory(args.output_dir, args.debug)
+    workers = max(1, min(args.workers or os.cpu_count() or 1, len(input_files)))
+    logger.info(f"📚 Batch: {len(input_files)} scripts across {workers} worker processes")
+
+    options = {
+        "output_dir": args.output_dir,
+        "debug": args.debug,
+        "use_cache": not args.no_cache,
+        "incremental": args.incremental,
+        "stream": args.stream,
+        "normalize": args.normalize,
+        "write_normalized": args.write_normalized,
+    }
+
+    results: Dict[str, Dict[str, Any]] = {}
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_batch_worker, initargs=(config, options)
+    ) as executor:
+        futures = {
+            executor.submit(run_batch_episode, str(input_file)): str(input_file)
+            for input_file in input_files
+        }
+        for future in as_completed(futures):
+            input_file = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker process itself died (e.g. killed or out of memory)
+                result = {
+                    "input_file": input_file,
+                    "success": False,
+                    "error": f"{type(e).__name__}: {e}",
+                }
+            results[input_file] = result
+
+            progress = f"({len(results)}/{len(input_files)})"
+            if result["success"]:
+                logger.info(
+                    f"  {progress} ✓ {result['episode']}: {result['validation_status']} "
+                    f"({result['scene_count']} scenes, {result['processing_time_seconds']:.3f}s)"
+                )
+            else:
+                logger.error(f"  {progress} ❌ {input_file}: {result['error']}")
+
+    episodes = [results[str(input_file)] for input_file in input_files]
+    succeeded = [episode for episode in episodes if episode["success"]]
+    failed = [episode for episode in episodes if not episode["success"]]
+
+    batch_summary = {
+        "processing_timestamp": datetime.now().isoformat(),
+        "pattern": args.batch,
+        "workers": workers,
+        "total_files": len(episodes),
+        "succeeded": len(succeeded),
+        "failed": len(failed),
+        "total_processing_time_seconds": round(time.time() - start_time, 3),
+        "total_characters": sum(episode["total_characters"] for episode in succeeded),
+        "total_episode_cost": round(sum(episode["total_episode_cost"] for episode in succeeded), 4),
+        "validation_status_counts": {
+            status: sum(1 for episode in succeeded if episode["validation_status"] == status)
+            for status in ("passed", "warning", "failed")
+        },
+        "episodes": episodes,
+    }
+
+    summary_file = output_path / "batch_summary.json"
+    dump_json(batch_summary, summary_file)
+
+    logger.info(f"✅ Batch complete in {batch_summary['total_processing_time_seconds']:.3f}s")
+    logger.info(f"📄 Summary: {summary_file}")
+    logger.info(f"🎯 {len(succeeded)}/{len(episodes)} scripts parsed, {len(failed)} failed")
+
+    return 1 if failed else 0
 
 
 def main() -> int:
@@ -916,12 +2299,43 @@ def main() -> int:
     # Parse command line arguments
     parser = argparse.ArgumentParser(
         description="Parse versusMonster podcast scripts into structured JSON",
-        epilog="Example: python parser.py episode_2_ex_final.md",
+        epilog="Example: python parser.py episode_2_ex_final.md\n"
+        "         python parser.py --normalize episode_2_raw.md\n"
+        "         python parser.py --escape-tolerant episode_2_raw.md\n"
+        "         python parser.py --batch scripts/season_1 --workers 8",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
     parser.add_argument(
-        "input_file", help="Path to the markdown script file (e.g., episode_2_ex_final.md)"
+        "input_file",
+        nargs="?",
+        help="Path to the markdown script file (e.g., episode_2_ex_final.md)",
+    )
+
+    parser.add_argument(
+        "--schema-version",
+        type=int,
+        choices=sorted(OUTPUT_SCHEMA_FILES),
+        help="Output JSON schema: 1 = full (default), 2 = compact, tags written once",
+    )
+
+    parser.add_argument(
+        "--include-scene-content",
+        action="store_true",
+        help="Keep raw scene content in schema v2 output",
+    )
+
+    parser.add_argument(
+        "--batch",
+        metavar="DIR_OR_GLOB",
+        help="Parse every .md script in a directory or matching a glob, in parallel",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --batch (default: CPU count)",
     )
 
     parser.add_argument(
@@ -935,7 +2349,55 @@ def main() -> int:
         "--output-dir",
         type=str,
         default=parser_config.get("default_output_dir", "output/json"),
-        help=f"Custom output directory (default: {parser_config.get('default_output_dir', 'output/json')})",
+        help=(
+            "Custom output directory "
+            f"(default: {parser_config.get('default_output_dir', 'output/json')})"
+        ),
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Always re-parse, bypassing the content-hash parse cache",
+    )
+
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=False,
+        help="Reuse unchanged scenes from the previous output JSON instead of re-parsing them",
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=False,
+        help="Stream scenes straight to the output file (bounded memory, bypasses the parse cache)",
+    )
+
+    parser.add_argument(
+        "--normalize",
+        action="store_true",
+        default=False,
+        help="Escape multimedia tags in memory first, as tools/process_episode.py does",
+    )
+
+    parser.add_argument(
+        "--write-normalized",
+        action="store_true",
+        default=False,
+        help="With --normalize, also save the escaped script as <stem>_processed.md",
+    )
+
+    parser.add_argument(
+        "--escape-tolerant",
+        action="store_true",
+        default=parser_config.get("escape_tolerant", False),
+        help=(
+            "Accept unescaped [TAG: ...] markup as well, "
+            "so tools/process_episode.py is not needed"
+        ),
     )
 
     parser.add_argument(
@@ -946,63 +2408,60 @@ def main() -> int:
 
     args = parser.parse_args()
 
+    if args.write_normalized and not args.normalize:
+        parser.error("--write-normalized requires --normalize")
+    if args.normalize and args.stream:
+        parser.error("--normalize cannot be combined with --stream")
+
+    # Command-line output options override config (and reach batch workers with it)
+    output_overrides = {}
+    if args.schema_version is not None:
+        output_overrides["schema_version"] = args.schema_version
+    if args.include_scene_content:
+        output_overrides["include_scene_content"] = True
+    if output_overrides:
+        config = {**config, "output": {**config.get("output", {}), **output_overrides}}
+    if args.escape_tolerant:
+        config = escape_tolerant_config(config)
+
     # Set up logging
     logger = setup_logging(args.debug, config)
     parser_version = parser_config.get("version", "1.0")
     pipeline_info = config.get("pipeline", {})
     logger.info(
-        f"🚀 versusMonster Script Parser v{parser_version} - Step {pipeline_info.get('step_number', 1)} of {pipeline_info.get('pipeline_total_steps', 8)}-Component Pipeline"
+        f"🚀 versusMonster Script Parser v{parser_version} - "
+        f"Step {pipeline_info.get('step_number', 1)} of "
+        f"{pipeline_info.get('pipeline_total_steps', 8)}-Component Pipeline"
     )
 
-    try:
-        # Step 1: Validate input file
-        logger.info(f"🔍 Step 1: Validating input file...")
-        input_path = validate_input_file(args.input_file)
-        logger.info(f"✓ Input file validated: {input_path}")
-
-        # Step 2: Prepare output directory
-        logger.info(f"📁 Step 2: Preparing output directory...")
-        output_path = ensure_output_directory(args.output_dir, args.debug)
-        logger.info(f"✓ Output directory ready: {output_path}")
-
-        # Step 3: Parse the episode script
-        logger.info(f"📖 Step 3: Parsing episode script...")
-        parsed_data = parse_episode_script(input_path, logger, config)
-        scene_count = len(parsed_data.get("scenes", []))
-        logger.info(f"✓ Episode parsing complete - found {scene_count} scenes")
-
-        # Step 4: Generate metadata and cost estimates
-        logger.info(f"📊 Step 4: Generating metadata and cost estimates...")
-        processing_time = time.time() - start_time
-        metadata = generate_output_metadata(
-            input_path, processing_time, parsed_data["scenes"], config
-        )
+    if args.batch:
+        return run_batch(args, config, logger)
 
-        # Show cost summary
-        cost_data = metadata.get("detailed_cost_analysis", {})
-        total_cost = cost_data.get("total_episode_cost", 0)
-        total_chars = metadata.get("estimated_downstream_costs", {}).get(
-            "elevenlabs_character_count", 0
-        )
-        logger.info(
-            f"✓ Cost analysis complete - estimated ${total_cost:.2f} ({total_chars} characters)"
-        )
+    if not args.input_file:
+        parser.error("an input file is required unless --batch is given")
 
-        # Step 5: Save output files
-        logger.info(f"💾 Step 5: Saving output files...")
-        episode_name = input_path.stem
-        save_output_files(
-            parsed_data, metadata, output_path, episode_name, args.debug, logger, config
+    try:
+        summary = process_episode_file(
+            args.input_file,
+            args.output_dir,
+            config,
+            logger,
+            debug=args.debug,
+            use_cache=not args.no_cache,
+            incremental=args.incremental,
+            stream=args.stream,
+            start_time=start_time,
+            normalize=args.normalize,
+            write_normalized=args.write_normalized,
         )
 
         # Final status with summary
-        validation_status = metadata.get("validation_status", "unknown")
-        warnings_count = len(parsed_data.get("warnings", []))
+        validation_status = summary["validation_status"]
 
-        logger.info(f"✅ Parsing complete in {processing_time:.3f}s")
-        logger.info(f"📄 Output: {output_path / f'{episode_name}.json'}")
+        logger.info(f"✅ Parsing complete in {summary['processing_time_seconds']:.3f}s")
+        logger.info(f"📄 Output: {summary['output_file']}")
         logger.info(
-            f"🎯 Status: {validation_status.upper()} ({warnings_count} warnings)"
+            f"🎯 Status: {validation_status.upper()} ({summary['warnings_count']} warnings)"
         )
 
         if validation_status == "failed":
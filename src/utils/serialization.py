@@ -0,0 +1,80 @@
+"""
+versusMonster JSON Serialization
+Reads and writes pipeline JSON with orjson or msgspec when installed,
+falling back to the standard library json module otherwise.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+    msgspec = None
+
+# Raised by load_json/loads_json for malformed input, whichever backend is used
+JSONDecodeError = json.JSONDecodeError
+
+
+def json_backend() -> str:
+    """Name of the fastest available JSON backend."""
+    if ORJSON_AVAILABLE:
+        return "orjson"
+    if MSGSPEC_AVAILABLE:
+        return "msgspec"
+    return "json"
+
+
+def dumps_json(data: Any, indent: Optional[int] = 2) -> bytes:
+    """Serialize data to UTF-8 JSON bytes.
+
+    ``indent`` of 0 or None writes compact JSON; otherwise the output matches
+    json.dumps(data, indent=indent, ensure_ascii=False) in layout.
+    """
+    if ORJSON_AVAILABLE and indent in (None, 0, 2):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    if MSGSPEC_AVAILABLE:
+        encoded = msgspec.json.encode(data)
+        return msgspec.json.format(encoded, indent=indent) if indent else encoded
+
+    if indent:
+        return json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+
+    if MSGSPEC_AVAILABLE:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise JSONDecodeError(str(e), data if isinstance(data, str) else "", 0) from e
+
+    return json.loads(data)
+
+
+def dump_json(data: Any, file_path: Union[str, Path], indent: Optional[int] = 2) -> None:
+    """Write data as JSON to file_path (see dumps_json for ``indent``)."""
+    with open(file_path, "wb") as file:
+        file.write(dumps_json(data, indent))
+
+
+def load_json(file_path: Union[str, Path]) -> Any:
+    """Read JSON from file_path."""
+    with open(file_path, "rb") as file:
+        return loads_json(file.read())
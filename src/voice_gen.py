@@ -7,14 +7,32 @@ PRD-v0 Command: python voice_gen.py episode_007.json
 """
 
 import argparse
+import hashlib
+import heapq
+import io
 import json
 import logging
+import math
 import os
+import random
+import re
+import shutil
+import textwrap
 import sys
+import threading
 import time
+import wave
+from abc import ABC, abstractmethod
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType, TracebackType
+from typing import BinaryIO, Callable, Dict, Any, Iterable, List, NamedTuple, Optional, Tuple, Type
+
+from utils.serialization import JSONDecodeError, load_json
 
 try:
     from dotenv import load_dotenv
@@ -40,6 +58,38 @@ def load_config(config_path: str = "config.json") -> Dict[str, Any]:
                 "model": "eleven_multilingual_v2",
                 "max_retries": 3,
                 "retry_delay_seconds": 1.0,
+                "max_concurrency": 4,
+                "backend": "elevenlabs",
+                "rate_limits": {
+                    "requests_per_second": None,
+                    "characters_per_minute": None,
+                    "adaptive_concurrency": True,
+                    "max_backoff_seconds": 30.0,
+                    "max_throttle_retries": 8
+                },
+                "audio_io": {
+                    "write_buffer_kb": 1024,
+                    "fsync": False
+                },
+                "audio_cache": {
+                    "enabled": True,
+                    "directory": "output/cache/audio",
+                    "max_size_mb": 2048,
+                    "link_mode": "hardlink"
+                },
+                "chunking": {
+                    "max_chunk_characters": 1000,
+                    "merge_short_lines": False,
+                    "short_line_characters": 5,
+                    "max_merged_lines": 8,
+                    "merge_break_seconds": 0.5,
+                    "min_silence_ms": 200,
+                    "silence_threshold": 500
+                },
+                "planning": {
+                    "request_latency_seconds": 0.8,
+                    "latency_seconds_per_character": 0.01
+                },
                 "character_voices": {
                     "THORAK": {
                         "voice_id": "JBFqnCBsd6RMkjVDRZzb",
@@ -111,6 +161,208 @@ def setup_elevenlabs_client(logger: logging.Logger) -> Optional[Any]:
         return None
 
 
+class TTSBackend(ABC):
+    """Text-to-speech backend interface used by generate_voice_file."""
+
+    name = "base"
+
+    @abstractmethod
+    def convert(
+        self,
+        text: str,
+        voice_id: str,
+        model_id: str,
+        output_format: str,
+        voice_settings: Dict[str, Any],
+    ) -> Iterable[bytes]:
+        """Synthesize ``text`` and return the audio as an iterable of byte chunks.
+
+        Errors should carry ``status_code`` (and ``headers`` for Retry-After)
+        like the ElevenLabs SDK's ApiError so throttling is recognized.
+        """
+
+
+class ElevenLabsBackend(TTSBackend):
+    """ElevenLabs text-to-speech API."""
+
+    name = "elevenlabs"
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    def convert(
+        self,
+        text: str,
+        voice_id: str,
+        model_id: str,
+        output_format: str,
+        voice_settings: Dict[str, Any],
+    ) -> Iterable[bytes]:
+        audio: Iterable[bytes] = self.client.text_to_speech.convert(
+            text=text,
+            voice_id=voice_id,
+            model_id=model_id,
+            output_format=output_format,
+            voice_settings=voice_settings
+        )
+        return audio
+
+
+# ElevenLabs pause markup, e.g. <break time="0.5s" />
+BREAK_TAG_PATTERN = re.compile(r'<break\s+time="(\d+(?:\.\d+)?)s"\s*/>')
+
+
+class MockTTSError(Exception):
+    """Simulated API error with the status_code/headers shape of ElevenLabs errors."""
+
+    def __init__(self, status_code: int, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(f"status_code: {status_code}, {message}")
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class MockTTSBackend(TTSBackend):
+    """Offline backend producing deterministic WAV audio for load tests and benchmarks.
+
+    Each line becomes a sine tone (pitch from the voice and text) with seeded
+    noise, lasting len(text) / characters_per_second; <break> tags become
+    digital silence of their stated length. Latency, jitter, error
+    and throttle outcomes are drawn from an RNG seeded by the request and its
+    attempt number, so runs are reproducible at any concurrency.
+    ``concurrency_limit`` answers 429 to requests beyond that many in flight.
+    """
+
+    name = "mock"
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.2,
+        jitter_seconds: float = 0.05,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        concurrency_limit: Optional[int] = None,
+        retry_after_seconds: float = 1.0,
+        characters_per_second: float = 15.0,
+        seed: int = 0,
+    ):
+        self.latency_seconds = latency_seconds
+        self.jitter_seconds = jitter_seconds
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.concurrency_limit = concurrency_limit
+        self.retry_after_seconds = retry_after_seconds
+        self.characters_per_second = characters_per_second
+        self.seed = seed
+        self.lock = threading.Lock()
+        self.attempts: Dict[str, int] = {}
+        self.in_flight = 0
+        self.requests = 0
+        self.characters = 0
+
+    def convert(
+        self,
+        text: str,
+        voice_id: str,
+        model_id: str,
+        output_format: str,
+        voice_settings: Dict[str, Any],
+    ) -> Iterable[bytes]:
+        request_key = f"{voice_id}\0{text}"
+        with self.lock:
+            attempt = self.attempts.get(request_key, 0)
+            self.attempts[request_key] = attempt + 1
+            self.requests += 1
+            over_limit = (
+                self.concurrency_limit is not None and self.in_flight >= self.concurrency_limit
+            )
+            if not over_limit:
+                self.in_flight += 1
+
+        digest = hashlib.sha256(f"{self.seed}\0{request_key}\0{attempt}".encode("utf-8")).digest()
+        rng = random.Random(digest)
+        retry_after = {"retry-after": str(self.retry_after_seconds)}
+        if over_limit:
+            raise MockTTSError(429, "too_many_concurrent_requests", retry_after)
+
+        try:
+            time.sleep(max(0.0, self.latency_seconds + rng.uniform(-1, 1) * self.jitter_seconds))
+            roll = rng.random()
+            if roll < self.throttle_rate:
+                raise MockTTSError(429, "rate_limit_exceeded", retry_after)
+            if roll < self.throttle_rate + self.error_rate:
+                raise MockTTSError(500, "internal_server_error")
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+        with self.lock:
+            self.characters += len(text)
+        audio = self.synthesize(text, voice_id, output_format)
+        # Return in chunks like a streamed HTTP response
+        return (audio[offset:offset + 65536] for offset in range(0, len(audio), 65536))
+
+    def synthesize(self, text: str, voice_id: str, output_format: str) -> bytes:
+        """Deterministic mono 16-bit WAV for a line of text."""
+        sample_rate = 44100
+        format_parts = output_format.split("_")
+        if len(format_parts) > 1 and format_parts[1].isdigit():
+            sample_rate = int(format_parts[1])
+
+        digest = hashlib.sha256(f"{voice_id}\0{text}".encode("utf-8")).digest()
+        frequency = 110 + int.from_bytes(digest[:2], "big") % 330
+        period = max(2, round(sample_rate / frequency))
+        noise = random.Random(digest)
+        cycle = array("h", (
+            int(8000 * math.sin(2 * math.pi * i / period) + noise.uniform(-500, 500))
+            for i in range(period)
+        ))
+        if sys.byteorder == "big":
+            cycle.byteswap()
+
+        cycle_bytes = cycle.tobytes()
+        pieces = BREAK_TAG_PATTERN.split(text)
+        frames = bytearray()
+        for index, piece in enumerate(pieces):
+            if index % 2:
+                frames += bytes(2 * int(sample_rate * float(piece)))
+                continue
+            if len(pieces) > 1:
+                piece = piece.strip()
+                if not piece:
+                    continue
+            frame_count = max(period, int(sample_rate * len(piece) / self.characters_per_second))
+            frames += (cycle_bytes * (frame_count // period + 1))[:frame_count * 2]
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(frames)
+        return buffer.getvalue()
+
+
+def create_tts_backend(
+    backend_name: str, config: Dict[str, Any], logger: logging.Logger
+) -> Optional[TTSBackend]:
+    """Create the named TTS backend ("elevenlabs" or "mock"); None on failure."""
+    if backend_name == "mock":
+        mock_config = config.get("voice_generation", {}).get("mock_backend", {})
+        backend = MockTTSBackend(**mock_config)
+        logger.info(
+            f"✓ Mock TTS backend ready (latency {backend.latency_seconds}s, "
+            f"error rate {backend.error_rate}, throttle rate {backend.throttle_rate})"
+        )
+        return backend
+
+    if backend_name == "elevenlabs":
+        client = setup_elevenlabs_client(logger)
+        return ElevenLabsBackend(client) if client else None
+
+    logger.error(f"Unknown TTS backend: {backend_name}")
+    return None
+
+
 def validate_input_file(file_path: str) -> Path:
     """Validate that the input JSON file exists and is readable."""
     path = Path(file_path)
@@ -139,9 +391,8 @@ def load_script_parser_json(input_path: Path, logger: logging.Logger) -> Dict[st
     logger.info(f"Loading Script Parser JSON from: {input_path}")
 
     try:
-        with open(input_path, "r", encoding="utf-8") as file:
-            data = json.load(file)
-    except json.JSONDecodeError as e:
+        data = load_json(input_path)
+    except JSONDecodeError as e:
         logger.error(f"Invalid JSON in input file: {e}")
         raise
     except IOError as e:
@@ -161,7 +412,9 @@ def load_script_parser_json(input_path: Path, logger: logging.Logger) -> Dict[st
     # Count total dialogues
     total_dialogues = sum(len(scene.get("dialogues", [])) for scene in data["scenes"])
     
-    logger.info(f"✓ Loaded {episode_title} with {scene_count} scenes and {total_dialogues} dialogues")
+    logger.info(
+        f"✓ Loaded {episode_title} with {scene_count} scenes and {total_dialogues} dialogues"
+    )
     
     return data
 
@@ -189,6 +442,17 @@ def extract_dialogues(scenes: List[Dict[str, Any]], logger: logging.Logger) -> L
     return dialogues
 
 
+# Punctuation stripped from voice directions before adjustment lookup
+DIRECTION_PUNCTUATION = str.maketrans("", "", ",.")
+
+
+def normalize_direction(direction: Optional[str]) -> Optional[str]:
+    """Normalize a voice direction for lookup (lowercase, remove punctuation)."""
+    if not direction:
+        return None
+    return direction.lower().translate(DIRECTION_PUNCTUATION).strip()
+
+
 def get_character_voice_settings(character: str, config: Dict[str, Any]) -> Dict[str, Any]:
     """Get voice settings for a specific character."""
     voice_config = config.get("voice_generation", {})
@@ -219,10 +483,11 @@ def apply_voice_direction_adjustments(
     adjusted_settings = base_settings.copy()
     
     # Get direction adjustments from config
-    direction_adjustments = config.get("voice_generation", {}).get("voice_direction_adjustments", {})
+    direction_adjustments = config.get("voice_generation", {}).get(
+        "voice_direction_adjustments", {}
+    )
     
-    # Normalize direction for lookup (lowercase, remove punctuation)
-    direction_key = direction.lower().replace(",", "").replace(".", "").strip()
+    direction_key = normalize_direction(direction)
     
     # Apply adjustments if direction is found
     if direction_key in direction_adjustments:
@@ -241,6 +506,87 @@ def apply_voice_direction_adjustments(
     return adjusted_settings
 
 
+@dataclass(frozen=True, slots=True)
+class VoiceSettings:
+    """Resolved, immutable voice settings for one character and direction."""
+
+    voice_id: str
+    stability: float
+    similarity: float
+    style: float
+
+    @classmethod
+    def from_config(cls, settings: Dict[str, Any]) -> "VoiceSettings":
+        """Build from a character_voices entry, defaulting missing values."""
+        return cls(
+            voice_id=settings["voice_id"],
+            stability=settings.get("stability", 0.5),
+            similarity=settings.get("similarity", 0.75),
+            style=settings.get("style", 0.5)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class VoiceSettingsTable:
+    """(character, normalized direction) -> VoiceSettings, resolved once per run.
+
+    ``unknown_characters`` fell back to the default voice and
+    ``unknown_directions`` have no voice_direction_adjustments entry.
+    """
+
+    settings: MappingProxyType
+    normalized_directions: MappingProxyType
+    unknown_characters: Tuple[str, ...]
+    unknown_directions: Tuple[str, ...]
+
+    def lookup(self, character: str, direction: Optional[str]) -> VoiceSettings:
+        """Settings for a dialogue; the pair must have been seen at build time."""
+        return self.settings[(character, self.normalized_directions.get(direction))]
+
+
+def build_voice_settings_table(
+    dialogues: Iterable[Dict[str, Any]],
+    config: Dict[str, Any]
+) -> VoiceSettingsTable:
+    """Resolve voice settings for every distinct (character, direction) in dialogues."""
+    voice_config = config.get("voice_generation", {})
+    character_voices = voice_config.get("character_voices", {})
+    direction_adjustments = voice_config.get("voice_direction_adjustments", {})
+
+    settings: Dict[Tuple[str, Optional[str]], VoiceSettings] = {}
+    normalized_directions: Dict[Optional[str], Optional[str]] = {None: None}
+    unknown_characters: Dict[str, None] = {}
+    unknown_directions: Dict[str, None] = {}
+
+    for dialogue in dialogues:
+        character = dialogue["character"]
+        direction = dialogue.get("direction")
+
+        if direction not in normalized_directions:
+            direction_key = normalize_direction(direction)
+            normalized_directions[direction] = direction_key
+            if direction_key and direction_key not in direction_adjustments:
+                unknown_directions[direction_key] = None
+        direction_key = normalized_directions[direction]
+
+        if (character, direction_key) in settings:
+            continue
+        if character not in character_voices:
+            unknown_characters[character] = None
+
+        base_voice_settings = get_character_voice_settings(character, config)
+        settings[(character, direction_key)] = VoiceSettings.from_config(
+            apply_voice_direction_adjustments(base_voice_settings, direction_key, config)
+        )
+
+    return VoiceSettingsTable(
+        settings=MappingProxyType(settings),
+        normalized_directions=MappingProxyType(normalized_directions),
+        unknown_characters=tuple(unknown_characters),
+        unknown_directions=tuple(unknown_directions)
+    )
+
+
 def generate_voice_filename(
     episode_name: str, 
     scene_id: str, 
@@ -252,44 +598,439 @@ def generate_voice_filename(
     return f"{episode_name}_{scene_id}_{dialogue_index:03d}_{character}.wav"
 
 
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at ``rate`` tokens per second."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Block until ``amount`` tokens are taken; returns seconds waited.
+
+        Requests larger than the bucket wait for a full bucket and leave it in
+        debt, so oversized lines are delayed rather than rejected.
+        """
+        waited = 0.0
+        while True:
+            delay = self.try_acquire(amount, time.monotonic())
+            if not delay:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    def try_acquire(self, amount: float, now: float) -> float:
+        """Take ``amount`` tokens at time ``now`` if available.
+
+        Returns 0.0 on success, else the seconds to wait before retrying.
+        Also used with a simulated clock by plan_voice_generation.
+        """
+        with self.lock:
+            if now > self.updated:
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+            needed = min(amount, self.capacity)
+            if self.tokens >= needed:
+                self.tokens -= amount
+                return 0.0
+            return (needed - self.tokens) / self.rate
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on in-flight requests.
+
+    Each success raises the limit by 1/limit (about +1 per window of requests);
+    a throttled request halves it. Only requests started after the last
+    decrease can trigger another, so one burst of 429s halves the limit once.
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1):
+        self.max_limit = max(min_limit, max_limit)
+        self.min_limit = min_limit
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self.epoch = 0
+        self.condition = threading.Condition()
+
+    def acquire(self) -> int:
+        """Block until a request slot is free; returns the epoch to pass to release."""
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+            return self.epoch
+
+    def release(self, epoch: int, throttled: bool = False) -> None:
+        """Free a slot and adjust the limit for the request's outcome."""
+        with self.condition:
+            self.in_flight -= 1
+            if not throttled:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            elif epoch == self.epoch:
+                self.limit = max(float(self.min_limit), self.limit / 2)
+                self.epoch += 1
+            self.condition.notify_all()
+
+
+class TTSRateLimiter:
+    """Shared request-rate, character-rate and concurrency limits for TTS calls."""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        requests_per_second: Optional[float] = None,
+        characters_per_minute: Optional[float] = None,
+        adaptive: bool = True,
+    ):
+        self.request_bucket = (
+            TokenBucket(requests_per_second, max(1.0, requests_per_second))
+            if requests_per_second
+            else None
+        )
+        self.character_bucket = (
+            TokenBucket(characters_per_minute / 60.0, characters_per_minute)
+            if characters_per_minute
+            else None
+        )
+        self.concurrency = AdaptiveConcurrency(max_concurrency) if adaptive else None
+        self.stats_lock = threading.Lock()
+        self.throttled_requests = 0
+        self.rate_limited_seconds = 0.0
+        self.min_concurrency_limit = max_concurrency
+
+    def acquire(self, characters: int) -> int:
+        """Wait for a concurrency slot and both rate buckets; returns a release ticket."""
+        ticket = self.concurrency.acquire() if self.concurrency else 0
+        waited = 0.0
+        if self.request_bucket:
+            waited += self.request_bucket.acquire(1)
+        if self.character_bucket:
+            waited += self.character_bucket.acquire(characters)
+        if waited:
+            with self.stats_lock:
+                self.rate_limited_seconds += waited
+        return ticket
+
+    def release(self, ticket: int, throttled: bool = False) -> None:
+        """Report a finished request; throttled requests shrink concurrency."""
+        if throttled:
+            with self.stats_lock:
+                self.throttled_requests += 1
+        if self.concurrency:
+            self.concurrency.release(ticket, throttled)
+            with self.stats_lock:
+                self.min_concurrency_limit = min(
+                    self.min_concurrency_limit, int(self.concurrency.limit)
+                )
+
+    def summary(self) -> Dict[str, Any]:
+        """Rate limiting statistics for the voice report."""
+        return {
+            "throttled_requests": self.throttled_requests,
+            "rate_limited_seconds": round(self.rate_limited_seconds, 2),
+            "min_concurrency_limit": self.min_concurrency_limit,
+        }
+
+
+def build_rate_limiter(config: Dict[str, Any], max_concurrency: int) -> TTSRateLimiter:
+    """Create the shared TTS rate limiter from voice_generation.rate_limits."""
+    rate_config = config.get("voice_generation", {}).get("rate_limits", {})
+    return TTSRateLimiter(
+        max_concurrency,
+        requests_per_second=rate_config.get("requests_per_second"),
+        characters_per_minute=rate_config.get("characters_per_minute"),
+        adaptive=rate_config.get("adaptive_concurrency", True),
+    )
+
+
+def get_error_status_code(error: Exception) -> Optional[int]:
+    """HTTP status code carried by an API client exception, if any."""
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """Seconds to wait from a Retry-After header on an API client exception."""
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def compute_backoff_delay(
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+    retry_after: Optional[float] = None,
+) -> float:
+    """Full-jitter exponential backoff; a Retry-After value takes precedence."""
+    if retry_after is not None:
+        return min(retry_after, max_delay) + random.uniform(0, base_delay)
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def build_api_voice_settings(voice_settings: VoiceSettings) -> Dict[str, Any]:
+    """Map character voice settings to the ElevenLabs voice_settings payload."""
+    return {
+        "stability": voice_settings.stability,
+        "similarity_boost": voice_settings.similarity,
+        "style": voice_settings.style
+    }
+
+
+def compute_audio_cache_key(
+    text: str,
+    voice_id: str,
+    model: str,
+    output_format: str,
+    api_voice_settings: Dict[str, Any],
+) -> str:
+    """Content address of a synthesized line: equal keys produce equal audio."""
+    key_data = {
+        "text": text,
+        "voice_id": voice_id,
+        "model": model,
+        "output_format": output_format,
+        "voice_settings": api_voice_settings,
+    }
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def place_audio_file(source: Path, destination: Path, link_mode: str = "hardlink") -> None:
+    """Atomically hard-link (or copy) source to destination."""
+    temp_path = destination.with_name(f".{destination.name}.{threading.get_ident()}.tmp")
+    if link_mode == "hardlink":
+        try:
+            os.link(source, temp_path)
+        except OSError:
+            shutil.copy2(source, temp_path)
+    else:
+        shutil.copy2(source, temp_path)
+    os.replace(temp_path, destination)
+
+
+class AudioCache:
+    """Content-addressed store of generated audio shared across episodes.
+
+    Entries live at ``<directory>/<key[:2]>/<key><suffix>`` and are placed
+    into episode directories as hard links (falling back to copies across
+    filesystems, or always copies with link_mode "copy"). Hits refresh the
+    entry mtime so evict() removes least recently used entries first.
+
+    Entries are probed (see probe_audio_file) before they are stored or
+    served. A hard-linked episode file shares its entry's data, so a corrupt
+    entry is removed on sight and the line is synthesized again.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int, link_mode: str = "hardlink"):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.link_mode = link_mode
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.hit_characters = 0
+        self.stored = 0
+        self.evicted = 0
+        self.corrupt = 0
+
+    def entry_path(self, key: str, suffix: str) -> Path:
+        """Store location for a cache key."""
+        return self.directory / key[:2] / f"{key}{suffix}"
+
+    def contains(self, key: str, suffix: str) -> bool:
+        """Whether an intact entry exists, without placing or touching it."""
+        return probe_audio_file(self.entry_path(key, suffix)) is not None
+
+    def discard(self, entry: Path, logger: Optional[logging.Logger] = None) -> None:
+        """Remove a corrupt entry so the next request regenerates it."""
+        try:
+            entry.unlink()
+        except OSError:
+            return
+        with self.lock:
+            self.corrupt += 1
+        if logger:
+            logger.warning(f"🗑️ Removed corrupt audio cache entry: {entry.name}")
+
+    def fetch(
+        self,
+        key: str,
+        output_path: Path,
+        characters: int = 0,
+        logger: Optional[logging.Logger] = None,
+    ) -> bool:
+        """Place an intact cached entry at output_path; False on a miss.
+
+        A corrupt entry is discarded and reported as a miss.
+        """
+        entry = self.entry_path(key, output_path.suffix)
+        if not entry.is_file():
+            return False
+        if probe_audio_file(entry) is None:
+            self.discard(entry, logger)
+            return False
+        try:
+            place_audio_file(entry, output_path, self.link_mode)
+            os.utime(entry)
+        except OSError:
+            return False
+        with self.lock:
+            self.hits += 1
+            self.hit_characters += characters
+        return True
+
+    def store(self, key: str, output_path: Path, logger: logging.Logger) -> None:
+        """Add a freshly generated file to the store, if it probes as intact."""
+        if probe_audio_file(output_path) is None:
+            logger.warning(f"Not caching {output_path.name}: audio failed validation")
+            return
+        entry = self.entry_path(key, output_path.suffix)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            place_audio_file(output_path, entry, self.link_mode)
+        except OSError as e:
+            logger.warning(f"Could not add {output_path.name} to audio cache: {e}")
+            return
+        with self.lock:
+            self.stored += 1
+
+    def evict(self, logger: logging.Logger) -> None:
+        """Remove least recently used entries until the store fits max_bytes."""
+        entries = []
+        total_bytes = 0
+        for entry in self.directory.glob("*/*"):
+            if entry.name.startswith("."):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+            total_bytes += stat.st_size
+
+        entries.sort()
+        for _, size, entry in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total_bytes -= size
+            self.evicted += 1
+
+        if self.evicted:
+            logger.info(
+                f"🧹 Evicted {self.evicted} audio cache entries "
+                f"({total_bytes / 1024 / 1024:.1f} MB kept)"
+            )
+
+    def summary(self) -> Dict[str, Any]:
+        """Audio cache statistics for the voice report."""
+        return {
+            "hits": self.hits,
+            "characters_reused": self.hit_characters,
+            "stored": self.stored,
+            "evicted": self.evicted,
+            "corrupt_removed": self.corrupt,
+        }
+
+
+def build_audio_cache(config: Dict[str, Any]) -> Optional[AudioCache]:
+    """Create the audio cache from voice_generation.audio_cache, or None if disabled."""
+    cache_config = config.get("voice_generation", {}).get("audio_cache", {})
+    if not cache_config.get("enabled", True):
+        return None
+    return AudioCache(
+        Path(cache_config.get("directory", "output/cache/audio")),
+        int(cache_config.get("max_size_mb", 2048) * 1024 * 1024),
+        cache_config.get("link_mode", "hardlink"),
+    )
+
+
 def generate_voice_file(
-    client: Any,
+    backend: TTSBackend,
     dialogue: Dict[str, Any],
-    voice_settings: Dict[str, Any],
+    voice_settings: VoiceSettings,
     output_path: Path,
     filename: str,
     config: Dict[str, Any],
-    logger: logging.Logger
+    logger: logging.Logger,
+    rate_limiter: Optional[TTSRateLimiter] = None,
+    audio_cache: Optional[AudioCache] = None,
+    audio_consumer: Optional[Callable[[Path, bytes], None]] = None
 ) -> bool:
-    """Generate a single voice file using ElevenLabs API."""
+    """Generate a single voice file using the TTS backend.
+
+    With an ``audio_cache``, identical requests (same text, voice, model,
+    format and adjusted settings) are served from the store without an API call.
+    ``audio_consumer`` receives (output_path, audio bytes) for every file
+    produced, straight from memory for newly synthesized audio.
+
+    Throttled (HTTP 429) attempts are retried up to
+    rate_limits.max_throttle_retries times, separately from max_retries for
+    other errors, waiting for Retry-After when the API sends it.
+    """
     if output_path.exists():
         logger.debug(f"Skipping existing file: {filename}")
         return True
     
     try:
         voice_config = config.get("voice_generation", {})
+        rate_config = voice_config.get("rate_limits", {})
         model = voice_config.get("model", "eleven_multilingual_v2")
         output_format = voice_config.get("output_format", "wav_44100")
         max_retries = voice_config.get("max_retries", 3)
         retry_delay = voice_config.get("retry_delay_seconds", 1.0)
+        max_backoff = rate_config.get("max_backoff_seconds", 30.0)
+        max_throttle_retries = rate_config.get("max_throttle_retries", 8)
         
         text = dialogue["text"]
-        voice_id = voice_settings["voice_id"]
+        voice_id = voice_settings.voice_id
         
         # Prepare voice settings for API
-        api_voice_settings = {
-            "stability": voice_settings.get("stability", 0.5),
-            "similarity_boost": voice_settings.get("similarity", 0.75),
-            "style": voice_settings.get("style", 0.5)
-        }
+        api_voice_settings = build_api_voice_settings(voice_settings)
+
+        cache_key = None
+        if audio_cache:
+            cache_key = compute_audio_cache_key(
+                text, voice_id, model, output_format, api_voice_settings
+            )
+            if audio_cache.fetch(cache_key, output_path, len(text), logger):
+                logger.debug(f"♻️ Reused cached audio: {filename}")
+                if audio_consumer:
+                    audio_consumer(output_path, output_path.read_bytes())
+                return True
         
         # Retry logic for API calls
-        for attempt in range(max_retries):
+        failures = 0
+        throttles = 0
+        while True:
+            ticket = rate_limiter.acquire(len(text)) if rate_limiter else 0
             try:
                 logger.debug(f"Generating voice for: {text[:50]}...")
                 
-                # Generate audio using ElevenLabs
-                audio_data = client.text_to_speech.convert(
+                # Generate audio using the TTS backend
+                audio_data = backend.convert(
                     text=text,
                     voice_id=voice_id,
                     model_id=model,
@@ -297,49 +1038,598 @@ def generate_voice_file(
                     voice_settings=api_voice_settings
                 )
                 
-                # Save audio to file
-                with open(output_path, "wb") as audio_file:
+                # Stream to disk atomically, validating the audio before it is renamed into place
+                with build_audio_sink(output_path, config, tee=audio_consumer is not None) as sink:
                     for chunk in audio_data:
-                        audio_file.write(chunk)
+                        sink.write(chunk)
                 
+                if rate_limiter:
+                    rate_limiter.release(ticket)
+                if audio_cache and cache_key is not None:
+                    audio_cache.store(cache_key, output_path, logger)
+                if audio_consumer:
+                    audio = sink.getvalue()
+                    audio_consumer(
+                        output_path, audio if audio is not None else output_path.read_bytes()
+                    )
                 logger.debug(f"✓ Generated: {filename}")
                 return True
                 
             except Exception as e:
-                if attempt < max_retries - 1:
-                    logger.warning(f"Attempt {attempt + 1} failed for {filename}: {e}")
-                    time.sleep(retry_delay * (attempt + 1))  # Exponential backoff
+                throttled = get_error_status_code(e) == 429
+                if rate_limiter:
+                    rate_limiter.release(ticket, throttled)
+
+                if throttled:
+                    throttles += 1
+                    if throttles > max_throttle_retries:
+                        logger.error(
+                            f"Failed to generate {filename}: "
+                            f"still throttled after {throttles} attempts"
+                        )
+                        return False
+                    delay = compute_backoff_delay(
+                        throttles, retry_delay, max_backoff, get_retry_after(e)
+                    )
+                    logger.warning(f"Throttled on {filename} - retrying in {delay:.1f}s")
                 else:
-                    logger.error(f"Failed to generate {filename} after {max_retries} attempts: {e}")
-                    return False
+                    failures += 1
+                    if failures >= max_retries:
+                        logger.error(
+                            f"Failed to generate {filename} after {max_retries} attempts: {e}"
+                        )
+                        return False
+                    delay = compute_backoff_delay(failures, retry_delay, max_backoff)
+                    logger.warning(f"Attempt {failures} failed for {filename}: {e}")
+                time.sleep(delay)
     
     except Exception as e:
         logger.error(f"Unexpected error generating {filename}: {e}")
         return False
 
 
-def process_dialogues(
-    client: Any,
+class AudioValidationError(ValueError):
+    """Generated audio failed header or length validation."""
+
+
+def parse_wav_header(header: bytes) -> Optional[Tuple[int, int, int]]:
+    """Return (data offset, declared data size, byte rate) from a WAV header, or None."""
+    if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        return None
+
+    byte_rate = 0
+    position = 12
+    while position + 8 <= len(header):
+        chunk_id = header[position:position + 4]
+        chunk_size = int.from_bytes(header[position + 4:position + 8], "little")
+        if chunk_id == b"fmt " and position + 20 <= len(header):
+            byte_rate = int.from_bytes(header[position + 16:position + 20], "little")
+        elif chunk_id == b"data":
+            return position + 8, chunk_size, byte_rate
+        position += 8 + chunk_size + (chunk_size & 1)
+    return None
+
+
+class AudioSink:
+    """Atomic, buffered writer for one streamed audio file.
+
+    Chunks from the TTS stream are coalesced into ``buffer_size`` writes on an
+    unbuffered temp file, so write syscalls no longer follow the SDK's chunk
+    sizes. On close the data is optionally fsync'd and, for .wav targets, the
+    header and length are validated before the temp file is renamed into
+    place. With ``tee`` the complete audio stays available from getvalue().
+
+    Use as a context manager; an exception discards the temp file.
+    """
+
+    HEADER_BYTES = 4096
+
+    def __init__(
+        self,
+        output_path: Path,
+        buffer_size: int = 1024 * 1024,
+        fsync: bool = False,
+        tee: bool = False,
+    ):
+        self.output_path = output_path
+        self.temp_path = output_path.with_name(f".{output_path.name}.{threading.get_ident()}.tmp")
+        self.buffer_size = max(4096, buffer_size)
+        self.fsync = fsync
+        self.buffer = bytearray()
+        self.header = bytearray()
+        self.tee_buffer: Optional[bytearray] = bytearray() if tee else None
+        self.bytes_written = 0
+        self.write_calls = 0
+        self.duration_seconds: Optional[float] = None
+        self.file: Optional[BinaryIO] = None
+
+    def __enter__(self) -> "AudioSink":
+        self.file = open(self.temp_path, "wb", buffering=0)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            try:
+                self.close()
+                return
+            except BaseException:
+                self.abort()
+                raise
+        self.abort()
+
+    def write(self, chunk: bytes) -> None:
+        """Buffer a chunk, writing out whole ``buffer_size`` blocks as they fill."""
+        if len(self.header) < self.HEADER_BYTES:
+            self.header += chunk[:self.HEADER_BYTES - len(self.header)]
+        if self.tee_buffer is not None:
+            self.tee_buffer += chunk
+        self.buffer += chunk
+        if len(self.buffer) >= self.buffer_size:
+            block_end = len(self.buffer) - len(self.buffer) % self.buffer_size
+            with memoryview(self.buffer) as view, view[:block_end] as block:
+                self._write_out(block)
+            del self.buffer[:block_end]
+
+    def _open_file(self) -> BinaryIO:
+        if self.file is None:
+            raise RuntimeError("AudioSink must be entered before writing")
+        return self.file
+
+    def _write_out(self, data: memoryview) -> None:
+        file = self._open_file()
+        while data:
+            written = file.write(data)
+            self.write_calls += 1
+            self.bytes_written += written
+            data = data[written:]
+
+    def close(self) -> None:
+        """Flush, validate and move the file into place."""
+        if self.buffer:
+            with memoryview(self.buffer) as remaining:
+                self._write_out(remaining)
+            self.buffer.clear()
+        file = self._open_file()
+        if self.fsync:
+            os.fsync(file.fileno())
+        file.close()
+        self.validate()
+        os.replace(self.temp_path, self.output_path)
+
+    def abort(self) -> None:
+        """Discard the partial temp file."""
+        if self.file and not self.file.closed:
+            self.file.close()
+        self.temp_path.unlink(missing_ok=True)
+
+    def validate(self) -> None:
+        """Check the audio is non-empty and, for WAV, that its data chunk is complete."""
+        if self.bytes_written == 0:
+            raise AudioValidationError(f"{self.output_path.name}: empty audio stream")
+        if self.output_path.suffix.lower() != ".wav":
+            return
+
+        parsed = parse_wav_header(bytes(self.header))
+        if parsed is None:
+            raise AudioValidationError(f"{self.output_path.name}: missing or malformed WAV header")
+        data_offset, data_size, byte_rate = parsed
+        actual_data = self.bytes_written - data_offset
+        # Streamed WAVs may leave the size unset (0 or 0xFFFFFFFF); trust the byte count then
+        if data_size not in (0, 0xFFFFFFFF):
+            if actual_data < data_size:
+                raise AudioValidationError(
+                    f"{self.output_path.name}: truncated audio "
+                    f"({actual_data} of {data_size} data bytes)"
+                )
+            actual_data = data_size
+        if byte_rate:
+            self.duration_seconds = round(actual_data / byte_rate, 3)
+
+    def getvalue(self) -> Optional[bytes]:
+        """The complete audio when created with tee, else None."""
+        return bytes(self.tee_buffer) if self.tee_buffer is not None else None
+
+
+def build_audio_sink(output_path: Path, config: Dict[str, Any], tee: bool = False) -> AudioSink:
+    """Create an AudioSink using voice_generation.audio_io settings."""
+    io_config = config.get("voice_generation", {}).get("audio_io", {})
+    return AudioSink(
+        output_path,
+        buffer_size=int(io_config.get("write_buffer_kb", 1024) * 1024),
+        fsync=io_config.get("fsync", False),
+        tee=tee,
+    )
+
+
+def probe_audio_file(path: Path) -> Optional[Dict[str, Any]]:
+    """Size and duration of a generated audio file, or None if missing or corrupt.
+
+    WAV files must parse and hold every frame their header declares; other
+    formats are only checked for being non-empty (duration_seconds is None).
+    """
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return None
+    if size == 0:
+        return None
+
+    duration = None
+    if path.suffix.lower() == ".wav":
+        try:
+            with wave.open(str(path), "rb") as wav_file:
+                frame_count = wav_file.getnframes()
+                frame_bytes = wav_file.getsampwidth() * wav_file.getnchannels()
+                if len(wav_file.readframes(frame_count)) < frame_count * frame_bytes:
+                    return None
+                duration = frame_count / wav_file.getframerate()
+        except (wave.Error, EOFError, ZeroDivisionError):
+            return None
+
+    return {"bytes": size, "duration_seconds": round(duration, 3) if duration is not None else None}
+
+
+class GenerationManifest:
+    """Append-only JSONL record of every voice file produced for an episode.
+
+    Each line holds filename, request_hash, bytes, duration_seconds, status
+    and recorded_at; the last line for a filename wins. Unreadable lines (a
+    crash mid-append) are ignored on load.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(entry, dict) and "filename" in entry:
+                        self.entries[entry["filename"]] = entry
+        except FileNotFoundError:
+            pass
+
+    def record(self, output_path: Path, request_hash: str, status: str) -> str:
+        """Append an entry for output_path and return the status recorded.
+
+        A "complete" file is probed first and recorded as "corrupt" if the
+        probe fails.
+        """
+        probe = probe_audio_file(output_path) if status == "complete" else None
+        recorded_status = status if probe or status != "complete" else "corrupt"
+        entry: Dict[str, Any] = {
+            "filename": output_path.name,
+            "request_hash": request_hash,
+            "bytes": probe["bytes"] if probe else 0,
+            "duration_seconds": probe["duration_seconds"] if probe else None,
+            "status": recorded_status,
+            "recorded_at": datetime.now().isoformat(),
+        }
+        with self.lock:
+            self.entries[output_path.name] = entry
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+        return recorded_status
+
+    def is_complete(self, output_path: Path, request_hash: str) -> bool:
+        """True if the manifest vouches for output_path as produced by request_hash."""
+        entry = self.entries.get(output_path.name)
+        if (
+            not entry
+            or entry.get("status") != "complete"
+            or entry.get("request_hash") != request_hash
+        ):
+            return False
+        probe = probe_audio_file(output_path)
+        return probe is not None and probe["bytes"] == entry.get("bytes")
+
+
+class VoiceJob(NamedTuple):
+    """One pending voice file: its dialogue, settings, target and request hash."""
+
+    dialogue: Dict[str, Any]
+    voice_settings: VoiceSettings
+    output_path: Path
+    filename: str
+    request_hash: str
+
+
+def plan_synthesis(jobs: List[VoiceJob]) -> List[Tuple[VoiceJob, List[VoiceJob]]]:
+    """Group jobs that would send identical TTS requests.
+
+    Returns (primary job, duplicate jobs) pairs in script order; only the
+    primary is synthesized and its file is linked to every duplicate.
+    """
+    groups: Dict[str, Tuple[VoiceJob, List[VoiceJob]]] = {}
+    for job in jobs:
+        if job.request_hash in groups:
+            groups[job.request_hash][1].append(job)
+        else:
+            groups[job.request_hash] = (job, [])
+
+    return list(groups.values())
+
+
+# Whitespace after sentence-ending punctuation, where long lines are split
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?…])\s+")
+
+
+class SynthesisUnit(NamedTuple):
+    """TTS requests that together produce the files of one or more job groups.
+
+    ``kind`` is "single" (one request for one group), "split" (one long line
+    synthesized in parts and stitched) or "merged" (consecutive short lines of
+    one speaker in a single request, cut apart at silences). ``texts`` and
+    ``part_paths`` hold each request's text and target; parts of split and
+    merged units are hidden temp files next to the final output.
+    """
+
+    kind: str
+    groups: List[Tuple[VoiceJob, List[VoiceJob]]]
+    texts: List[str]
+    part_paths: List[Path]
+
+
+def split_text_chunks(text: str, max_characters: int) -> List[str]:
+    """Split text into chunks of at most max_characters at sentence boundaries.
+
+    Sentences longer than the limit are split between words (or mid-word
+    as a last resort).
+    """
+    if len(text) <= max_characters:
+        return [text]
+
+    chunks = []
+    current = ""
+    for sentence in SENTENCE_BOUNDARY_PATTERN.split(text):
+        pieces = [sentence]
+        if len(sentence) > max_characters:
+            pieces = textwrap.wrap(sentence, max_characters, break_on_hyphens=False)
+        for piece in pieces:
+            if current and len(current) + 1 + len(piece) > max_characters:
+                chunks.append(current)
+                current = piece
+            else:
+                current = f"{current} {piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def plan_requests(
+    synthesis_plan: List[Tuple[VoiceJob, List[VoiceJob]]],
+    config: Dict[str, Any],
+    audio_cache: Optional[AudioCache] = None
+) -> List[SynthesisUnit]:
+    """Turn coalesced job groups into TTS requests using voice_generation.chunking.
+
+    Lines over max_chunk_characters are split for parallel synthesis, unless
+    ``audio_cache`` already holds the whole stitched line. With
+    merge_short_lines, runs of consecutive lines shorter than
+    short_line_characters from the same speaker, scene and settings share one
+    request, joined by <break> tags of merge_break_seconds.
+    """
+    chunk_config = config.get("voice_generation", {}).get("chunking", {})
+    max_chunk_characters = chunk_config.get("max_chunk_characters", 1000)
+    merge_short_lines = chunk_config.get("merge_short_lines", False)
+    short_line_characters = chunk_config.get("short_line_characters", 5)
+    max_merged_lines = max(2, chunk_config.get("max_merged_lines", 8))
+    separator = f' <break time="{chunk_config.get("merge_break_seconds", 0.5)}s" /> '
+
+    units: List[SynthesisUnit] = []
+    pending: List[Tuple[VoiceJob, List[VoiceJob]]] = []
+
+    def single(group: Tuple[VoiceJob, List[VoiceJob]]) -> SynthesisUnit:
+        job = group[0]
+        return SynthesisUnit("single", [group], [job.dialogue["text"]], [job.output_path])
+
+    def flush_pending() -> None:
+        if len(pending) > 1:
+            first = pending[0][0].output_path
+            units.append(SynthesisUnit(
+                "merged", list(pending),
+                [separator.join(group[0].dialogue["text"] for group in pending)],
+                [first.with_name(f".{first.stem}.merged{first.suffix}")]
+            ))
+        else:
+            units.extend(single(group) for group in pending)
+        pending.clear()
+
+    for group in synthesis_plan:
+        job = group[0]
+        text = job.dialogue["text"]
+
+        if merge_short_lines and len(text) < short_line_characters:
+            if pending:
+                previous = pending[-1][0]
+                same_run = (
+                    previous.dialogue["character"] == job.dialogue["character"]
+                    and previous.dialogue["scene_id"] == job.dialogue["scene_id"]
+                    and previous.voice_settings == job.voice_settings
+                )
+                if not same_run or len(pending) >= max_merged_lines:
+                    flush_pending()
+            pending.append(group)
+            continue
+
+        flush_pending()
+        chunks = split_text_chunks(text, max_chunk_characters) if max_chunk_characters else [text]
+        if len(chunks) > 1 and not (
+            audio_cache and audio_cache.contains(job.request_hash, job.output_path.suffix)
+        ):
+            path = job.output_path
+            units.append(SynthesisUnit("split", [group], chunks, [
+                path.with_name(f".{path.stem}.part{index:02d}{path.suffix}")
+                for index in range(len(chunks))
+            ]))
+        else:
+            units.append(single(group))
+
+    flush_pending()
+    return units
+
+
+def read_wav(path: Path) -> Tuple[Tuple[int, int, int], bytes]:
+    """Return ((channels, sample width, frame rate), frames) of a WAV file."""
+    with wave.open(str(path), "rb") as wav_file:
+        params = (wav_file.getnchannels(), wav_file.getsampwidth(), wav_file.getframerate())
+        return params, wav_file.readframes(wav_file.getnframes())
+
+
+def encode_wav(params: Tuple[int, int, int], frames: bytes) -> bytes:
+    """Encode PCM frames as a WAV file."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(params[0])
+        wav_file.setsampwidth(params[1])
+        wav_file.setframerate(params[2])
+        wav_file.writeframes(frames)
+    return buffer.getvalue()
+
+
+def stitch_wav_files(part_paths: List[Path]) -> bytes:
+    """Concatenate WAV parts with identical formats into one WAV file."""
+    if not part_paths:
+        raise AudioValidationError("No audio parts to stitch")
+    # The first part fixes the format every later part must match
+    params, first_frames = read_wav(part_paths[0])
+    frames = [first_frames]
+    for path in part_paths[1:]:
+        part_params, part_frames = read_wav(path)
+        if part_params != params:
+            raise AudioValidationError(
+                f"{path.name}: audio format {part_params} differs from {params}"
+            )
+        frames.append(part_frames)
+    return encode_wav(params, b"".join(frames))
+
+
+def find_silence_cuts(
+    frames: bytes,
+    params: Tuple[int, int, int],
+    cut_count: int,
+    min_silence_ms: float = 200,
+    threshold: int = 500
+) -> Optional[List[int]]:
+    """Frame offsets splitting 16-bit PCM at its ``cut_count`` longest inner silences.
+
+    Silence is a run of 10 ms windows whose peak amplitude stays below
+    ``threshold`` for at least ``min_silence_ms``; leading and trailing
+    silence is ignored. Returns None when fewer silences are found.
+    """
+    channels, sample_width, frame_rate = params
+    if sample_width != 2:
+        return None
+
+    samples = array("h", frames)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    window_frames = max(1, frame_rate // 100)
+    window_samples = window_frames * channels
+    quiet = [
+        max(map(abs, samples[start:start + window_samples])) < threshold
+        for start in range(0, len(samples), window_samples)
+    ]
+
+    silences = []  # (length in windows, first window)
+    run_start = None
+    for index, is_quiet in enumerate(quiet):
+        if is_quiet and run_start is None:
+            run_start = index
+        elif not is_quiet and run_start is not None:
+            if run_start > 0:
+                silences.append((index - run_start, run_start))
+            run_start = None
+
+    min_windows = max(1, math.ceil(min_silence_ms / 10))
+    silences = [silence for silence in silences if silence[0] >= min_windows]
+    if len(silences) < cut_count:
+        return None
+
+    longest = sorted(silences, key=lambda silence: (-silence[0], silence[1]))[:cut_count]
+    return sorted((first + length // 2) * window_frames for length, first in longest)
+
+
+def split_merged_audio(
+    merged_path: Path,
+    output_paths: List[Path],
+    config: Dict[str, Any],
+    logger: logging.Logger,
+    audio_consumer: Optional[Callable[[Path, bytes], None]] = None
+) -> bool:
+    """Cut a merged request's audio at its silences into one file per line."""
+    chunk_config = config.get("voice_generation", {}).get("chunking", {})
+    try:
+        params, frames = read_wav(merged_path)
+        cuts = find_silence_cuts(
+            frames, params, len(output_paths) - 1,
+            chunk_config.get("min_silence_ms", 200), chunk_config.get("silence_threshold", 500)
+        )
+        if cuts is None:
+            logger.warning(f"Could not find {len(output_paths) - 1} pauses in {merged_path.name}")
+            return False
+
+        frame_bytes = params[0] * params[1]
+        bounds = [0] + cuts + [len(frames) // frame_bytes]
+        for output_path, start, end in zip(output_paths, bounds, bounds[1:]):
+            audio = encode_wav(params, frames[start * frame_bytes:end * frame_bytes])
+            with build_audio_sink(output_path, config) as sink:
+                sink.write(audio)
+            if audio_consumer:
+                audio_consumer(output_path, audio)
+        return True
+    except (OSError, wave.Error, EOFError, AudioValidationError) as e:
+        logger.warning(f"Could not split merged audio {merged_path.name}: {e}")
+        return False
+
+
+def prepare_voice_jobs(
     dialogues: List[Dict[str, Any]],
     episode_name: str,
     output_dir: Path,
     config: Dict[str, Any],
-    logger: logging.Logger
-) -> Dict[str, Any]:
-    """Process all dialogues and generate voice files."""
-    
-    logger.info(f"🎤 Step 1: Processing {len(dialogues)} dialogues...")
-    
-    # Track processing statistics
-    stats = {
-        "total_dialogues": len(dialogues),
-        "successful_generations": 0,
-        "failed_generations": 0,
-        "skipped_existing": 0,
-        "character_counts": {},
-        "processing_start_time": time.time()
-    }
-    
+    logger: logging.Logger,
+    stats: Dict[str, Any],
+    manifest: GenerationManifest,
+    resume: bool = False,
+    dry_run: bool = False
+) -> List[VoiceJob]:
+    """Resolve voice settings and return the jobs still to generate, in script order.
+
+    Updates character, skip and re-queue counts in ``stats``. With
+    ``dry_run`` the manifest and output files are left untouched.
+    """
+    voice_config = config.get("voice_generation", {})
+    model = voice_config.get("model", "eleven_multilingual_v2")
+    output_format = voice_config.get("output_format", "wav_44100")
+
+    # Resolve every character/direction once, and flag config gaps before any API spend
+    settings_table = build_voice_settings_table(dialogues, config)
+    stats["voice_settings_resolved"] = len(settings_table.settings)
+    stats["unknown_characters"] = list(settings_table.unknown_characters)
+    stats["unknown_directions"] = list(settings_table.unknown_directions)
+    for character in settings_table.unknown_characters:
+        logger.warning(f"⚠️ No voice configured for {character}; using the default voice")
+    if settings_table.unknown_directions:
+        logger.warning(
+            f"⚠️ {len(settings_table.unknown_directions)} voice directions have no adjustment "
+            f"and will use base settings: {', '.join(settings_table.unknown_directions)}"
+        )
+
+    # Generation jobs in script order
+    jobs = []
+
     for idx, dialogue in enumerate(dialogues):
         character = dialogue["character"]
         scene_id = dialogue["scene_id"]
@@ -352,38 +1642,288 @@ def process_dialogues(
             stats["character_counts"][character] = 0
         stats["character_counts"][character] += len(text)
         
-        # Get character voice settings
-        base_voice_settings = get_character_voice_settings(character, config)
-        
-        # Apply voice direction adjustments
-        voice_settings = apply_voice_direction_adjustments(
-            base_voice_settings, direction, config
-        )
+        voice_settings = settings_table.lookup(character, direction)
         
         # Generate filename and path
         filename = generate_voice_filename(episode_name, scene_id, dialogue_index, character)
         output_path = output_dir / filename
         
         # Show progress
-        progress = f"({idx + 1}/{len(dialogues)})"
-        direction_text = f" ({direction})" if direction else ""
-        logger.info(f"  {progress} {character}{direction_text}: {text[:50]}{'...' if len(text) > 50 else ''}")
+        if not dry_run:
+            progress = f"({idx + 1}/{len(dialogues)})"
+            direction_text = f" ({direction})" if direction else ""
+            preview = f"{text[:50]}{'...' if len(text) > 50 else ''}"
+            logger.info(f"  {progress} {character}{direction_text}: {preview}")
         
+        request_hash = compute_audio_cache_key(
+            text, voice_settings.voice_id, model, output_format,
+            build_api_voice_settings(voice_settings)
+        )
+
         # Check if file already exists
-        if output_path.exists():
+        if resume:
+            if manifest.is_complete(output_path, request_hash):
+                stats["skipped_existing"] += 1
+                logger.debug(f"Skipping file verified by manifest: {filename}")
+                continue
+            if output_path.exists():
+                # Files with no matching manifest entry may predate a script edit
+                if not dry_run:
+                    # Unlink rather than overwrite: the file may be a hard link to a cache entry
+                    output_path.unlink()
+                stats["requeued_from_manifest"] += 1
+                logger.info(f"    ↻ Re-queued unrecorded, corrupt or outdated file: {filename}")
+        elif output_path.exists():
             stats["skipped_existing"] += 1
             logger.debug(f"Skipping existing file: {filename}")
             continue
         
-        # Generate voice file
-        success = generate_voice_file(
-            client, dialogue, voice_settings, output_path, filename, config, logger
+        jobs.append(VoiceJob(dialogue, voice_settings, output_path, filename, request_hash))
+
+    return jobs
+
+
+def plan_voice_requests(
+    jobs: List[VoiceJob],
+    config: Dict[str, Any],
+    logger: logging.Logger,
+    stats: Dict[str, Any],
+    audio_cache: Optional[AudioCache] = None
+) -> List[SynthesisUnit]:
+    """Coalesce duplicate jobs and plan the TTS requests, recording counts in ``stats``."""
+    # Synthesize each distinct request once
+    synthesis_plan = plan_synthesis(jobs)
+    for _, duplicates in synthesis_plan:
+        stats["coalesced_duplicates"] += len(duplicates)
+        stats["characters_saved_by_coalescing"] += sum(
+            len(job.dialogue["text"]) for job in duplicates
         )
-        
-        if success:
-            stats["successful_generations"] += 1
-        else:
-            stats["failed_generations"] += 1
+    if stats["coalesced_duplicates"]:
+        logger.info(
+            f"🔗 Coalesced {stats['coalesced_duplicates']} duplicate lines "
+            f"({stats['characters_saved_by_coalescing']} characters saved)"
+        )
+
+    # Split long lines and merge runs of short ones into the actual TTS requests
+    synthesis_units = plan_requests(synthesis_plan, config, audio_cache)
+    stats["split_lines"] = sum(1 for unit in synthesis_units if unit.kind == "split")
+    stats["split_requests"] = sum(
+        len(unit.texts) for unit in synthesis_units if unit.kind == "split"
+    )
+    stats["merged_lines"] = sum(
+        len(unit.groups) for unit in synthesis_units if unit.kind == "merged"
+    )
+    stats["merged_requests"] = sum(1 for unit in synthesis_units if unit.kind == "merged")
+    if stats["split_lines"]:
+        logger.info(
+            f"✂️ Splitting {stats['split_lines']} long lines "
+            f"into {stats['split_requests']} requests"
+        )
+    if stats["merged_lines"]:
+        logger.info(
+            f"🧩 Merging {stats['merged_lines']} short lines "
+            f"into {stats['merged_requests']} requests"
+        )
+
+    return synthesis_units
+
+
+def process_dialogues(
+    backend: TTSBackend,
+    dialogues: List[Dict[str, Any]],
+    episode_name: str,
+    output_dir: Path,
+    config: Dict[str, Any],
+    logger: logging.Logger,
+    max_concurrency: Optional[int] = None,
+    use_audio_cache: bool = True,
+    resume: bool = False,
+    audio_consumer: Optional[Callable[[Path, bytes], None]] = None
+) -> Dict[str, Any]:
+    """Process all dialogues and generate voice files.
+
+    Dialogues are prepared in script order and identical requests are
+    coalesced (see plan_synthesis), then up to ``max_concurrency`` (default:
+    voice_generation.max_concurrency) TTS requests run at once on a thread
+    pool. Filenames and stats do not depend on completion order. Requests
+    also pass through the shared rate limiter (see build_rate_limiter): a
+    configured rate_limits.requests_per_second caps throughput no matter how
+    high ``max_concurrency`` is, while the default (null) leaves it to
+    adaptive concurrency and Retry-After.
+
+    Every outcome is recorded in the episode manifest as soon as its file is
+    finished, so an interrupted run keeps the work it completed. With
+    ``resume``, only files the manifest vouches for (same request hash,
+    intact on disk) are skipped; missing, corrupt, outdated and unrecorded
+    files are regenerated.
+
+    Long lines are synthesized in parts and stitched, and short lines can
+    share one request (see plan_requests); a merged request whose audio
+    cannot be cut at silences falls back to one request per line.
+
+    ``audio_consumer`` is called with (output_path, audio bytes) for each
+    synthesized or cache-served primary file, for downstream processing
+    without re-reading from disk.
+    """
+    if max_concurrency is None:
+        max_concurrency = config.get("voice_generation", {}).get("max_concurrency", 1)
+    max_concurrency = max(1, max_concurrency)
+
+    logger.info(f"🎤 Step 1: Processing {len(dialogues)} dialogues...")
+    
+    # Track processing statistics
+    stats: Dict[str, Any] = {
+        "total_dialogues": len(dialogues),
+        "successful_generations": 0,
+        "failed_generations": 0,
+        "skipped_existing": 0,
+        "requeued_from_manifest": 0,
+        "coalesced_duplicates": 0,
+        "characters_saved_by_coalescing": 0,
+        "character_counts": {},
+        "max_concurrency": max_concurrency,
+        "processing_start_time": time.time()
+    }
+    
+    voice_config = config.get("voice_generation", {})
+    manifest = GenerationManifest(output_dir / f"{episode_name}_manifest.jsonl")
+    jobs = prepare_voice_jobs(
+        dialogues, episode_name, output_dir, config, logger, stats, manifest, resume
+    )
+    audio_cache = build_audio_cache(config) if use_audio_cache else None
+    synthesis_units = plan_voice_requests(jobs, config, logger, stats, audio_cache)
+    requests = [(unit, index) for unit in synthesis_units for index in range(len(unit.texts))]
+    for unit in synthesis_units:
+        if unit.kind != "single":
+            # Parts left by an interrupted run may belong to other settings
+            for part_path in unit.part_paths:
+                part_path.unlink(missing_ok=True)
+
+    rate_limiter = build_rate_limiter(config, max_concurrency)
+    link_mode = voice_config.get("audio_cache", {}).get("link_mode", "hardlink")
+    merge_fallbacks = []
+
+    def generate_job(job: VoiceJob) -> bool:
+        return generate_voice_file(
+            backend, job.dialogue, job.voice_settings, job.output_path, job.filename,
+            config, logger, rate_limiter, audio_cache, audio_consumer
+        )
+
+    def run_request(request: Tuple[SynthesisUnit, int]) -> bool:
+        unit, index = request
+        if unit.kind == "single":
+            return generate_job(unit.groups[0][0])
+        job = unit.groups[0][0]
+        part_path = unit.part_paths[index]
+        return generate_voice_file(
+            backend, {**job.dialogue, "text": unit.texts[index]}, job.voice_settings,
+            part_path, part_path.name, config, logger, rate_limiter, audio_cache
+        )
+
+    def finish_group(group: Tuple[VoiceJob, List[VoiceJob]], success: bool) -> List[bool]:
+        job, duplicates = group
+        # The manifest probes the file; anything short of "complete" fails the whole group
+        status = manifest.record(
+            job.output_path, job.request_hash, "complete" if success else "failed"
+        )
+        if success and status != "complete":
+            logger.error(f"Generated file failed validation: {job.filename}")
+        success = status == "complete"
+        results = [success]
+        for duplicate in duplicates:
+            if success:
+                try:
+                    place_audio_file(job.output_path, duplicate.output_path, link_mode)
+                    logger.debug(f"✓ Linked duplicate: {duplicate.filename}")
+                except OSError as e:
+                    logger.error(f"Failed to link {duplicate.filename} from {job.filename}: {e}")
+                    manifest.record(duplicate.output_path, duplicate.request_hash, "failed")
+                    results.append(False)
+                    continue
+            status = manifest.record(
+                duplicate.output_path, duplicate.request_hash, "complete" if success else "failed"
+            )
+            results.append(status == "complete")
+        return results
+
+    def finish_unit(unit: SynthesisUnit, request_results: List[bool]) -> List[bool]:
+        if unit.kind == "single":
+            return finish_group(unit.groups[0], request_results[0])
+
+        if unit.kind == "split":
+            job = unit.groups[0][0]
+            success = all(request_results)
+            if success:
+                try:
+                    audio = stitch_wav_files(unit.part_paths)
+                    with build_audio_sink(job.output_path, config) as sink:
+                        sink.write(audio)
+                    if audio_cache:
+                        # Cache the whole line too, so a rerun needs no parts at all
+                        audio_cache.store(job.request_hash, job.output_path, logger)
+                    if audio_consumer:
+                        audio_consumer(job.output_path, audio)
+                    logger.debug(f"✓ Stitched {len(unit.part_paths)} parts: {job.filename}")
+                except (OSError, wave.Error, EOFError, AudioValidationError) as e:
+                    logger.error(f"Failed to stitch {job.filename}: {e}")
+                    success = False
+            for part_path in unit.part_paths:
+                part_path.unlink(missing_ok=True)
+            return finish_group(unit.groups[0], success)
+
+        # Merged: cut the shared audio apart, or synthesize each line on its own
+        primaries = [group[0] for group in unit.groups]
+        placed = request_results[0] and split_merged_audio(
+            unit.part_paths[0], [job.output_path for job in primaries], config, logger,
+            audio_consumer
+        )
+        unit.part_paths[0].unlink(missing_ok=True)
+        if not placed:
+            merge_fallbacks.append(unit)
+            logger.info(f"    ↪ Generating {len(primaries)} merged lines individually")
+        results = []
+        for group in unit.groups:
+            results.extend(finish_group(group, True if placed else generate_job(group[0])))
+        return results
+
+    # Generate voice files; each unit is stitched, cut, linked and recorded
+    # as soon as its last request finishes
+    parallel = max_concurrency > 1 and len(requests) > 1
+    if parallel:
+        logger.info(
+            f"⚡ Generating {len(requests)} voice requests "
+            f"with up to {max_concurrency} concurrent requests"
+        )
+    unit_request_results = [[False] * len(unit.texts) for unit in synthesis_units]
+    pending_requests = [len(unit.texts) for unit in synthesis_units]
+    unit_results: List[List[bool]] = [[] for _ in synthesis_units]
+    executor = ThreadPoolExecutor(max_workers=max_concurrency if parallel else 1)
+    try:
+        futures = {
+            executor.submit(run_request, (unit, index)): (unit_index, index)
+            for unit_index, unit in enumerate(synthesis_units)
+            for index in range(len(unit.texts))
+        }
+        for future in as_completed(futures):
+            unit_index, index = futures[future]
+            unit_request_results[unit_index][index] = future.result()
+            pending_requests[unit_index] -= 1
+            if not pending_requests[unit_index]:
+                unit_results[unit_index] = finish_unit(
+                    synthesis_units[unit_index], unit_request_results[unit_index]
+                )
+    finally:
+        # On Ctrl-C or an error, drop queued requests instead of running them all
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    results = [success for unit in unit_results for success in unit]
+    stats["successful_generations"] += sum(1 for success in results if success)
+    stats["failed_generations"] += sum(1 for success in results if not success)
+    stats["merge_fallbacks"] = len(merge_fallbacks)
+    stats["rate_limiting"] = rate_limiter.summary()
+    if audio_cache:
+        audio_cache.evict(logger)
+        stats["audio_cache"] = audio_cache.summary()
     
     stats["processing_end_time"] = time.time()
     stats["total_processing_time"] = stats["processing_end_time"] - stats["processing_start_time"]
@@ -391,6 +1931,185 @@ def process_dialogues(
     return stats
 
 
+def estimate_request_seconds(
+    characters: int, config: Dict[str, Any], backend_name: str = "elevenlabs"
+) -> float:
+    """Expected latency of one TTS request for the dry-run plan.
+
+    The mock backend uses its configured latency; real backends use
+    voice_generation.planning (fixed overhead plus time per character).
+    """
+    voice_config = config.get("voice_generation", {})
+    if backend_name == "mock":
+        return float(voice_config.get("mock_backend", {}).get("latency_seconds", 0.2))
+    planning_config = voice_config.get("planning", {})
+    request_latency = float(planning_config.get("request_latency_seconds", 0.8))
+    per_character = float(planning_config.get("latency_seconds_per_character", 0.01))
+    return request_latency + characters * per_character
+
+
+@dataclass(slots=True)
+class PlanRequestTotals:
+    """API requests and audio cache hits counted by the dry-run plan."""
+
+    billed_characters: List[int] = field(default_factory=list)
+    cache_hits: int = 0
+    cached_characters: int = 0
+
+
+def simulate_request_schedule(
+    request_characters: List[int],
+    config: Dict[str, Any],
+    max_concurrency: int,
+    request_seconds: Callable[[int], float]
+) -> Dict[str, float]:
+    """Project wall-clock time for requests dispatched in order on the worker pool.
+
+    Uses the same TTSRateLimiter token buckets as a real run, driven by a
+    simulated clock; no throttling or retries are assumed, so adaptive
+    concurrency stays at ``max_concurrency``. Requests take tokens in order,
+    so the clock never runs backwards even when a worker frees up before the
+    previous request got its tokens.
+    """
+    rate_limiter = build_rate_limiter(config, max_concurrency)
+    origin = time.monotonic()
+    workers = [0.0] * max(1, max_concurrency)
+    rate_limited_seconds = 0.0
+    clock = 0.0
+
+    for characters in request_characters:
+        start = heapq.heappop(workers)
+        ready = max(start, clock)
+        buckets = ((rate_limiter.request_bucket, 1), (rate_limiter.character_bucket, characters))
+        for bucket, amount in buckets:
+            if not bucket:
+                continue
+            while True:
+                delay = bucket.try_acquire(amount, origin + ready)
+                if not delay:
+                    break
+                ready += delay
+        clock = ready
+        rate_limited_seconds += ready - start
+        heapq.heappush(workers, ready + request_seconds(characters))
+
+    return {
+        "projected_seconds": round(max(workers) if request_characters else 0.0, 2),
+        "rate_limited_seconds": round(rate_limited_seconds, 2),
+    }
+
+
+def plan_voice_generation(
+    dialogues: List[Dict[str, Any]],
+    episode_name: str,
+    output_dir: Path,
+    config: Dict[str, Any],
+    logger: logging.Logger,
+    max_concurrency: Optional[int] = None,
+    use_audio_cache: bool = True,
+    resume: bool = False,
+    backend_name: str = "elevenlabs"
+) -> Dict[str, Any]:
+    """Dry run of process_dialogues: what would be sent, billed and how long it would take.
+
+    Job selection, duplicate coalescing and request planning are the ones a
+    real run uses; audio cache hits are looked up without being placed, and
+    nothing is written or deleted.
+    """
+    if max_concurrency is None:
+        max_concurrency = config.get("voice_generation", {}).get("max_concurrency", 1)
+    max_concurrency = max(1, max_concurrency)
+
+    voice_config = config.get("voice_generation", {})
+    model = voice_config.get("model", "eleven_multilingual_v2")
+    output_format = voice_config.get("output_format", "wav_44100")
+    cost_config = config.get("cost_estimation", {})
+    cost_per_character = cost_config.get("elevenlabs_cost_per_character", 0.0003)
+
+    plan: Dict[str, Any] = {
+        "total_dialogues": len(dialogues),
+        "script_characters": sum(len(dialogue["text"]) for dialogue in dialogues),
+        "skipped_existing": 0,
+        "requeued_from_manifest": 0,
+        "coalesced_duplicates": 0,
+        "characters_saved_by_coalescing": 0,
+        "character_counts": {},
+        "max_concurrency": max_concurrency,
+        "backend": backend_name,
+    }
+
+    manifest = GenerationManifest(output_dir / f"{episode_name}_manifest.jsonl")
+    jobs = prepare_voice_jobs(
+        dialogues, episode_name, output_dir, config, logger, plan, manifest, resume, dry_run=True
+    )
+    audio_cache = build_audio_cache(config) if use_audio_cache else None
+    synthesis_units = plan_voice_requests(jobs, config, logger, plan, audio_cache)
+
+    totals = PlanRequestTotals()
+    for unit in synthesis_units:
+        voice_settings = unit.groups[0][0].voice_settings
+        api_voice_settings = build_api_voice_settings(voice_settings)
+        for text, part_path in zip(unit.texts, unit.part_paths):
+            if audio_cache:
+                cache_key = compute_audio_cache_key(
+                    text, voice_settings.voice_id, model, output_format, api_voice_settings
+                )
+                if audio_cache.contains(cache_key, part_path.suffix):
+                    totals.cache_hits += 1
+                    totals.cached_characters += len(text)
+                    continue
+            totals.billed_characters.append(len(text))
+
+    schedule = simulate_request_schedule(
+        totals.billed_characters, config, max_concurrency,
+        lambda characters: estimate_request_seconds(characters, config, backend_name)
+    )
+
+    plan.update({
+        "lines_to_generate": len(jobs),
+        "api_requests": len(totals.billed_characters),
+        "audio_cache_hits": totals.cache_hits,
+        "characters_from_cache": totals.cached_characters,
+        "billed_characters": sum(totals.billed_characters),
+        "estimated_cost": round(sum(totals.billed_characters) * cost_per_character, 4),
+        "currency": cost_config.get("currency", "USD"),
+        **schedule,
+    })
+    return plan
+
+
+def log_generation_plan(plan: Dict[str, Any], logger: logging.Logger) -> None:
+    """Log the dry-run plan summary."""
+    logger.info(
+        f"🧮 Voice generation plan ({plan['backend']} backend, "
+        f"concurrency {plan['max_concurrency']}):"
+    )
+    logger.info(f"  Dialogues: {plan['total_dialogues']} ({plan['script_characters']} characters)")
+    logger.info(f"  Already generated: {plan['skipped_existing']}")
+    logger.info(f"  Lines to generate: {plan['lines_to_generate']}")
+    logger.info(
+        f"  Duplicates coalesced: {plan['coalesced_duplicates']} "
+        f"({plan['characters_saved_by_coalescing']} characters)"
+    )
+    if plan.get("split_lines") or plan.get("merged_lines"):
+        logger.info(
+            f"  Long lines split: {plan['split_lines']}, "
+            f"short lines merged: {plan['merged_lines']} "
+            f"into {plan['merged_requests']} requests"
+        )
+    logger.info(
+        f"  Audio cache hits: {plan['audio_cache_hits']} "
+        f"({plan['characters_from_cache']} characters)"
+    )
+    logger.info(f"  API requests: {plan['api_requests']}")
+    logger.info(f"  Billed characters: {plan['billed_characters']}")
+    logger.info(f"💰 Estimated cost: {plan['estimated_cost']:.4f} {plan['currency']}")
+    logger.info(
+        f"⏱️ Projected wall-clock: {plan['projected_seconds']:.1f}s "
+        f"({plan['rate_limited_seconds']:.1f}s of request time spent waiting on rate limits)"
+    )
+
+
 def generate_voice_report(
     stats: Dict[str, Any],
     episode_name: str,
@@ -405,13 +2124,63 @@ def generate_voice_report(
         file.write(f"versusMonster Voice Generator - Processing Report\n")
         file.write(f"Generated: {datetime.now().isoformat()}\n")
         file.write(f"Episode: {episode_name}\n")
-        file.write(f"Processing time: {stats['total_processing_time']:.2f}s\n\n")
+        file.write(f"Processing time: {stats['total_processing_time']:.2f}s\n")
+        file.write(f"Max concurrency: {stats.get('max_concurrency', 1)}\n\n")
         
         file.write(f"GENERATION SUMMARY:\n")
         file.write(f"  Total dialogues: {stats['total_dialogues']}\n")
         file.write(f"  Successfully generated: {stats['successful_generations']}\n")
         file.write(f"  Failed generations: {stats['failed_generations']}\n")
-        file.write(f"  Skipped existing: {stats['skipped_existing']}\n\n")
+        file.write(f"  Skipped existing: {stats['skipped_existing']}\n")
+        if stats.get("requeued_from_manifest"):
+            file.write(f"  Re-queued by --resume: {stats['requeued_from_manifest']}\n")
+        file.write(
+            f"  Duplicate lines coalesced: {stats.get('coalesced_duplicates', 0)} "
+            f"({stats.get('characters_saved_by_coalescing', 0)} characters saved)\n"
+        )
+        if stats.get("split_lines"):
+            file.write(
+                f"  Long lines split: {stats['split_lines']} "
+                f"({stats['split_requests']} requests)\n"
+            )
+        if stats.get("merged_lines"):
+            file.write(
+                f"  Short lines merged: {stats['merged_lines']} "
+                f"({stats['merged_requests']} requests, "
+                f"{stats.get('merge_fallbacks', 0)} regenerated individually)\n"
+            )
+        file.write(f"\n")
+
+        audio_cache = stats.get("audio_cache")
+        if audio_cache:
+            file.write(f"AUDIO CACHE:\n")
+            file.write(
+                f"  Reused from cache: {audio_cache['hits']} "
+                f"({audio_cache['characters_reused']} characters)\n"
+            )
+            file.write(f"  Added to cache: {audio_cache['stored']}\n")
+            file.write(f"  Evicted: {audio_cache['evicted']}\n")
+            file.write(f"  Corrupt entries removed: {audio_cache.get('corrupt_removed', 0)}\n\n")
+
+        if stats.get("unknown_characters") or stats.get("unknown_directions"):
+            file.write(f"VOICE SETTINGS:\n")
+            file.write(
+                f"  Settings combinations resolved: {stats.get('voice_settings_resolved', 0)}\n"
+            )
+            for character in stats.get("unknown_characters", []):
+                file.write(f"  Unknown character (default voice): {character}\n")
+            for direction in stats.get("unknown_directions", []):
+                file.write(f"  Unknown direction (base settings): {direction}\n")
+            file.write(f"\n")
+
+        rate_limiting = stats.get("rate_limiting")
+        if rate_limiting:
+            file.write(f"RATE LIMITING:\n")
+            file.write(f"  Throttled requests (429): {rate_limiting['throttled_requests']}\n")
+            file.write(
+                f"  Time waiting on rate limits: {rate_limiting['rate_limited_seconds']:.2f}s\n"
+            )
+            file.write(f"  Lowest concurrency limit: {rate_limiting['min_concurrency_limit']}\n\n")
         
         file.write(f"CHARACTER USAGE:\n")
         for character, char_count in stats['character_counts'].items():
@@ -462,7 +2231,51 @@ def main() -> int:
         "--output-dir",
         type=str,
         default=voice_config.get("output_dir", "output/voices"),
-        help=f"Custom output directory (default: {voice_config.get('output_dir', 'output/voices')})",
+        help=(
+            "Custom output directory "
+            f"(default: {voice_config.get('output_dir', 'output/voices')})"
+        ),
+    )
+
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=voice_config.get("max_concurrency", 1),
+        help=(
+            f"Concurrent TTS requests (default: {voice_config.get('max_concurrency', 1)}); "
+            "rate_limits.requests_per_second still applies"
+        ),
+    )
+
+    parser.add_argument(
+        "--backend",
+        choices=["elevenlabs", "mock"],
+        default=voice_config.get("backend", "elevenlabs"),
+        help="TTS backend; mock synthesizes offline test tones (default: %(default)s)",
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Trust the episode manifest: regenerate missing, corrupt, outdated "
+            "or unrecorded files"
+        ),
+    )
+
+    parser.add_argument(
+        "--no-audio-cache",
+        action="store_true",
+        help="Always call the TTS API instead of reusing identical cached audio",
+    )
+
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help=(
+            "Dry run: report requests, billed characters, cost and projected time "
+            "without calling the API"
+        ),
     )
 
     parser.add_argument(
@@ -477,7 +2290,8 @@ def main() -> int:
     logger = setup_logging(args.debug, config)
     pipeline_info = config.get("pipeline", {})
     logger.info(
-        f"🚀 versusMonster Voice Generator v1.0 - Step 2 of {pipeline_info.get('pipeline_total_steps', 8)}-Component Pipeline"
+        f"🚀 versusMonster Voice Generator v1.0 - "
+        f"Step 2 of {pipeline_info.get('pipeline_total_steps', 8)}-Component Pipeline"
     )
 
     try:
@@ -486,12 +2300,14 @@ def main() -> int:
         input_path = validate_input_file(args.input_file)
         logger.info(f"✓ Input file validated: {input_path}")
 
-        # Step 2: Initialize ElevenLabs client
-        logger.info(f"🎤 Step 2: Initializing ElevenLabs API client...")
-        client = setup_elevenlabs_client(logger)
-        if not client:
-            logger.error("❌ Failed to initialize ElevenLabs client")
-            return 1
+        # Step 2: Initialize TTS backend (not needed for a dry run)
+        backend: Optional[TTSBackend] = None
+        if not args.plan:
+            logger.info(f"🎤 Step 2: Initializing {args.backend} TTS backend...")
+            backend = create_tts_backend(args.backend, config, logger)
+            if not backend:
+                logger.error(f"❌ Failed to initialize {args.backend} TTS backend")
+                return 1
         
         # Step 3: Load and process Script Parser JSON
         logger.info(f"📖 Step 3: Loading Script Parser JSON...")
@@ -506,14 +2322,28 @@ def main() -> int:
         
         logger.info(f"✓ Script data loaded - found {len(dialogues)} dialogues")
 
+        if args.plan:
+            plan = plan_voice_generation(
+                dialogues, episode_name, Path(args.output_dir) / episode_name, config, logger,
+                args.max_concurrency, not args.no_audio_cache, args.resume, args.backend
+            )
+            log_generation_plan(plan, logger)
+            logger.info(f"💡 Dry run only - no API calls were made")
+            return 0
+
         # Step 4: Prepare output directory
         logger.info(f"📁 Step 4: Preparing output directory...")
         output_dir = ensure_output_directory(args.output_dir, episode_name)
         logger.info(f"✓ Output directory ready: {output_dir}")
 
         # Step 5: Generate voice files
+        if backend is None:
+            raise RuntimeError("TTS backend was not initialized")
         logger.info(f"🎧 Step 5: Generating voice files...")
-        stats = process_dialogues(client, dialogues, episode_name, output_dir, config, logger)
+        stats = process_dialogues(
+            backend, dialogues, episode_name, output_dir, config, logger,
+            args.max_concurrency, not args.no_audio_cache, args.resume
+        )
         
         # Generate report
         generate_voice_report(stats, episode_name, output_dir, config, logger)
@@ -522,7 +2352,10 @@ def main() -> int:
         processing_time = time.time() - start_time
         logger.info(f"✅ Voice generation complete in {processing_time:.2f}s")
         logger.info(f"📄 Output: {output_dir}")
-        logger.info(f"🎯 Status: {stats['successful_generations']}/{stats['total_dialogues']} voices generated")
+        logger.info(
+            f"🎯 Status: {stats['successful_generations']}/{stats['total_dialogues']} "
+            "voices generated"
+        )
         
         if stats['failed_generations'] > 0:
             logger.info(f"⚠️ {stats['failed_generations']} generations failed - check voice report")
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Script Parser Microbenchmarks
+
+Measures parser hot paths on a synthetic episode script so performance
+changes can be compared before and after.
+
+Usage:
+    python tools/benchmark_parser.py
+    python tools/benchmark_parser.py --lines 50000 --repeat 5
+    python tools/benchmark_parser.py --json
+
+Author: versusMonster Pipeline System
+Version: 1.0
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import parser as script_parser  # noqa: E402  (src/parser.py)
+from utils import serialization  # noqa: E402
+
+
+SCENE_NAMES = ["COLD OPEN", "INTRO & HOST BANTER", "BATTLE SETUP", "BATTLE COMMENTARY", "OUTRO"]
+
+BODY_LINES = [
+    'ZARA: (Breathless excitement) "Oh honey, did you SEE that?! Absolutely incredible!"',
+    "",
+    'THORAK: (Impressed gravelly tone) "Aye, lass! Forty years of service '
+    'and never seen the like."',
+    "",
+    "\\[SFX: massive_impact_thud\\]",
+    "",
+    '\\[IMG: battle_moment\\] PROMPT: "Owlbear charging through a moonlit glade, '
+    'fantasy concept art"',
+    "",
+    "\\[MUSIC: battle_theme\\]",
+    "",
+    "[Brief pause for dramatic effect]",
+    "",
+    "\\[AMBIENT: forest_night\\]",
+    "",
+    "\\[TRANSITION: magical_whoosh\\]",
+    "",
+]
+
+
+def build_synthetic_script(line_count: int, lines_per_scene: int = 200) -> str:
+    """Build a synthetic episode script with roughly ``line_count`` lines."""
+    lines = ["# **SYNTHETIC BENCHMARK EPISODE**", ""]
+    scene_number = 0
+
+    while len(lines) < line_count:
+        scene_name = f"{SCENE_NAMES[scene_number % len(SCENE_NAMES)]} {scene_number}"
+        lines.extend([f"## **\\[SCENE: {scene_name}\\]**", ""])
+        scene_number += 1
+
+        for i in range(lines_per_scene):
+            lines.append(BODY_LINES[i % len(BODY_LINES)])
+
+        lines.extend(["---", ""])
+
+    return "\n".join(lines[:line_count])
+
+
+def time_call(func: Callable[[], object], repeat: int) -> float:
+    """Return the best wall-clock time of ``repeat`` calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def token_offsets(content: str) -> List[int]:
+    """Offsets of every line start that can begin a parser token."""
+    return [match.start() for match in script_parser.TOKEN_LINE_START_PATTERN.finditer(content)]
+
+
+def benchmark_line_numbers(content: str, repeat: int) -> Dict[str, float]:
+    """Compare slice-and-count line lookup with the shared LineIndex."""
+    offsets = token_offsets(content)
+
+    def slice_and_count() -> List[int]:
+        return [content[:offset].count("\n") + 1 for offset in offsets]
+
+    def line_index_lookup() -> List[int]:
+        line_index = script_parser.LineIndex(content)
+        return [line_index.line_number(offset) for offset in offsets]
+
+    assert slice_and_count() == line_index_lookup()
+
+    return {
+        "lookups": len(offsets),
+        "slice_and_count_seconds": time_call(slice_and_count, repeat),
+        "line_index_seconds": time_call(line_index_lookup, repeat),
+    }
+
+
+def benchmark_extract_scenes(content: str, repeat: int) -> Dict[str, float]:
+    """Time a full extract_scenes pass over the script."""
+    logger = logging.getLogger("versusMonster.benchmark")
+    logger.disabled = True
+
+    return {
+        "extract_scenes_seconds": time_call(
+            lambda: script_parser.extract_scenes(content, logger), repeat
+        ),
+    }
+
+
+def benchmark_metadata(content: str, repeat: int) -> Dict[str, float]:
+    """Compare per-section scene walks with one shared EpisodeAccumulator."""
+    logger = logging.getLogger("versusMonster.benchmark")
+    logger.disabled = True
+    config = script_parser.load_config()
+    scenes = script_parser.extract_scenes(content, logger)
+
+    def separate_walks() -> None:
+        # One walk per report section, as validation + metadata used to do
+        script_parser.EpisodeAccumulator(config).add_scenes(scenes).validation(logger)
+        script_parser.calculate_character_counts(scenes)
+        script_parser.calculate_multimedia_counts(scenes)
+        script_parser.calculate_timing_estimates(scenes, config)
+        script_parser.calculate_detailed_costs(scenes, config)
+
+    def single_walk() -> None:
+        accumulator = script_parser.EpisodeAccumulator(config).add_scenes(scenes)
+        accumulator.validation(logger)
+        accumulator.output_metadata(Path("benchmark.md"), 0.0)
+
+    return {
+        "separate_walks_seconds": time_call(separate_walks, repeat),
+        "single_walk_seconds": time_call(single_walk, repeat),
+    }
+
+
+def benchmark_serialization(content: str, repeat: int) -> Dict[str, float]:
+    """Compare stdlib json with the pluggable serializer on parsed scenes."""
+    logger = logging.getLogger("versusMonster.benchmark")
+    logger.disabled = True
+    data = {"scenes": script_parser.extract_scenes(content, logger)}
+    encoded = json.dumps(data, indent=2, ensure_ascii=False)
+
+    return {
+        "backend": serialization.json_backend(),
+        "output_bytes": len(encoded.encode("utf-8")),
+        "stdlib_dump_seconds": time_call(
+            lambda: json.dumps(data, indent=2, ensure_ascii=False), repeat
+        ),
+        "backend_dump_seconds": time_call(lambda: serialization.dumps_json(data, 2), repeat),
+        "stdlib_load_seconds": time_call(lambda: json.loads(encoded), repeat),
+        "backend_load_seconds": time_call(lambda: serialization.loads_json(encoded), repeat),
+    }
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Run Script Parser microbenchmarks on a synthetic episode script",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--lines', type=int, default=50000,
+                        help='Synthetic script length in lines (default: 50000)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per measurement; the best is reported (default: 3)')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+
+    args = parser.parse_args()
+
+    content = build_synthetic_script(args.lines)
+    results = {
+        "script_lines": content.count("\n") + 1,
+        "script_characters": len(content),
+        "line_numbers": benchmark_line_numbers(content, args.repeat),
+        "parser": benchmark_extract_scenes(content, args.repeat),
+        "metadata": benchmark_metadata(content, args.repeat),
+        "serialization": benchmark_serialization(content, args.repeat),
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    line_numbers = results["line_numbers"]
+    speedup = (
+        line_numbers["slice_and_count_seconds"] / max(line_numbers["line_index_seconds"], 1e-9)
+    )
+
+    print(f"📄 Synthetic script: {results['script_lines']:,} lines, "
+          f"{results['script_characters']:,} characters")
+    print(f"\n📏 Line number lookups ({line_numbers['lookups']:,} tokens):")
+    print(f"   slice + count: {line_numbers['slice_and_count_seconds'] * 1000:.1f} ms")
+    print(f"   LineIndex:     {line_numbers['line_index_seconds'] * 1000:.1f} ms")
+    print(f"   Speedup:       {speedup:.0f}x")
+    print(f"\n📖 extract_scenes: {results['parser']['extract_scenes_seconds'] * 1000:.1f} ms")
+
+    metadata = results["metadata"]
+    print(f"\n📊 Validation + metadata:")
+    print(f"   separate scene walks: {metadata['separate_walks_seconds'] * 1000:.1f} ms")
+    print(f"   single accumulator:   {metadata['single_walk_seconds'] * 1000:.1f} ms")
+
+    serialization_results = results["serialization"]
+    print(f"\n💾 JSON ({serialization_results['output_bytes'] / 1024 / 1024:.1f} MiB, "
+          f"backend: {serialization_results['backend']}):")
+    print(f"   dump: stdlib {serialization_results['stdlib_dump_seconds'] * 1000:.1f} ms, "
+          f"backend {serialization_results['backend_dump_seconds'] * 1000:.1f} ms")
+    print(f"   load: stdlib {serialization_results['stdlib_load_seconds'] * 1000:.1f} ms, "
+          f"backend {serialization_results['backend_load_seconds'] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Episode Post-Processor Benchmarks
+
+Measures EpisodeTagProcessor on synthetic scripts with many unescaped tags
+and code blocks, comparing code-block detection by prefix counting (the
+previous approach) with the bisect-based CodeBlockIndex, and one pass per
+tag type with the single combined-regex pass.
+
+Usage:
+    python tools/benchmark_process_episode.py
+    python tools/benchmark_process_episode.py --tags 2500 5000 10000 --repeat 3
+    python tools/benchmark_process_episode.py --json
+
+Author: versusMonster Pipeline System
+Version: 1.0
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import process_episode  # noqa: E402  (tools/process_episode.py)
+
+
+TAG_LINES = [
+    "[SFX: massive_impact_thud]",
+    '[IMG: battle_moment] PROMPT: "Owlbear charging through a moonlit glade"',
+    "[MUSIC: battle_theme]",
+    "[AMBIENT: forest_night]",
+    "[TRANSITION: magical_whoosh]",
+]
+
+
+class PrefixCountIndex:
+    """Previous code-block check: count fences in a prefix copy per lookup."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def contains(self, position: int) -> bool:
+        return self.text[:position].count('```') % 2 == 1
+
+
+def build_synthetic_script(tag_count: int, tags_per_scene: int = 50) -> str:
+    """Build a script with ``tag_count`` unescaped tags and a code block per scene."""
+    lines = ["# Synthetic Benchmark Episode", ""]
+    for index in range(tag_count):
+        if index % tags_per_scene == 0:
+            scene = index // tags_per_scene
+            lines.extend([
+                f"## **[SCENE: SCENE {scene}]**", "",
+                "```markdown", "[SFX: example_inside_code_block]", "```", "",
+            ])
+        lines.append(TAG_LINES[index % len(TAG_LINES)])
+        lines.append('ZARA: (Excited) "Did you see that?!"')
+        lines.append("")
+    return "\n".join(lines)
+
+
+def time_call(func: Callable[[], object], repeat: int) -> float:
+    """Return the best wall-clock time of ``repeat`` calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def process_with_index(content: str, index_class: type) -> str:
+    """Run the processor with the given code-block index implementation."""
+    original = process_episode.CodeBlockIndex
+    process_episode.CodeBlockIndex = index_class
+    try:
+        processor = process_episode.EpisodeTagProcessor(verbose=False)
+        processed, _ = processor.process_file_content(content)
+    finally:
+        process_episode.CodeBlockIndex = original
+    return processed
+
+
+def benchmark_tags(tag_count: int, repeat: int) -> Dict[str, float]:
+    """Time full processing with both code-block checks and both pass strategies."""
+    content = build_synthetic_script(tag_count)
+    processor = process_episode.EpisodeTagProcessor(verbose=False)
+    assert (
+        process_with_index(content, PrefixCountIndex)
+        == process_with_index(content, process_episode.CodeBlockIndex)
+    )
+    assert processor._process_per_tag_type(content)[0] == processor.process_file_content(content)[0]
+
+    return {
+        "tags": tag_count,
+        "characters": len(content),
+        "prefix_count_seconds": time_call(
+            lambda: process_with_index(content, PrefixCountIndex), repeat
+        ),
+        "bisect_index_seconds": time_call(
+            lambda: process_with_index(content, process_episode.CodeBlockIndex), repeat
+        ),
+        "per_tag_type_seconds": time_call(lambda: processor._process_per_tag_type(content), repeat),
+        "single_pass_seconds": time_call(lambda: processor.process_file_content(content), repeat),
+    }
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark episode post-processing on synthetic scripts",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--tags', type=int, nargs='+', default=[2500, 5000, 10000],
+                        help='Tag counts to compare')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per measurement; the best is reported (default: 3)')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+
+    args = parser.parse_args()
+
+    results: List[Dict[str, float]] = [
+        benchmark_tags(tag_count, args.repeat) for tag_count in args.tags
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print("🏷️ Tag processing (code-block check per match):")
+    print(f"   {'tags':>7} {'chars':>10} {'prefix count':>13} {'bisect':>9} {'speedup':>8}")
+    for result in results:
+        speedup = result["prefix_count_seconds"] / max(result["bisect_index_seconds"], 1e-9)
+        print(f"   {result['tags']:>7,} {result['characters']:>10,} "
+              f"{result['prefix_count_seconds'] * 1000:>11.1f}ms "
+              f"{result['bisect_index_seconds'] * 1000:>7.1f}ms "
+              f"{speedup:>7.1f}x")
+
+    print("\n🔁 Tag types (one pass per type vs combined regex):")
+    print(f"   {'tags':>7} {'per type':>10} {'single':>9} {'speedup':>8}")
+    for result in results:
+        speedup = result["per_tag_type_seconds"] / max(result["single_pass_seconds"], 1e-9)
+        print(f"   {result['tags']:>7,} {result['per_tag_type_seconds'] * 1000:>8.1f}ms "
+              f"{result['single_pass_seconds'] * 1000:>7.1f}ms {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
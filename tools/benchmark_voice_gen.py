@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Voice Generator Benchmarks
+
+Runs the voice generation engine against the offline mock TTS backend so
+concurrency, retry, rate limiting and cache behavior can be compared
+reproducibly without network access or API spend.
+
+Usage:
+    python tools/benchmark_voice_gen.py
+    python tools/benchmark_voice_gen.py --lines 120 --concurrency 1 4 8
+    python tools/benchmark_voice_gen.py --throttle-rate 0.1 --concurrency-limit 3
+    python tools/benchmark_voice_gen.py --short-every 3 --merge-short-lines
+    python tools/benchmark_voice_gen.py output/json/episode_007.json --json
+
+Author: versusMonster Pipeline System
+Version: 1.0
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import voice_gen  # noqa: E402  (src/voice_gen.py)
+
+
+def build_synthetic_dialogues(line_count: int, short_every: int = 0) -> List[Dict[str, Any]]:
+    """Alternating THORAK/ZARA lines of varying length across a few scenes.
+
+    With ``short_every``, each such line is followed by two short reactions
+    from the same speaker.
+    """
+    scenes = []
+    for index in range(line_count):
+        if index % 20 == 0:
+            scenes.append({"scene_id": f"scene_{len(scenes) + 1}", "dialogues": []})
+        character = "THORAK" if index % 2 else "ZARA"
+        text = f"Line {index}: " + "the owlbear charges across the glade " * (1 + index % 4)
+        scenes[-1]["dialogues"].append({"character": character, "direction": None, "text": text})
+        if short_every and index % short_every == 0:
+            for reaction in (f"{index}!", f"{index}?"):
+                scenes[-1]["dialogues"].append(
+                    {"character": character, "direction": None, "text": reaction}
+                )
+
+    logger = logging.getLogger("versusMonster.benchmark")
+    return voice_gen.extract_dialogues(scenes, logger)
+
+
+def run_once(
+    dialogues: List[Dict[str, Any]],
+    config: Dict[str, Any],
+    mock_options: Dict[str, Any],
+    concurrency: int,
+    use_audio_cache: bool,
+) -> Dict[str, Any]:
+    """Generate every dialogue into a fresh directory and return timing and stats."""
+    logger = logging.getLogger("versusMonster.benchmark")
+    backend = voice_gen.MockTTSBackend(**mock_options)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        stats = voice_gen.process_dialogues(
+            backend, dialogues, "benchmark", Path(output_dir), config, logger,
+            concurrency, use_audio_cache
+        )
+        elapsed = time.perf_counter() - start
+
+    return {
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "lines_per_second": round(len(dialogues) / elapsed, 2),
+        "api_requests": backend.requests,
+        "successful": stats["successful_generations"],
+        "failed": stats["failed_generations"],
+        "throttled": stats["rate_limiting"]["throttled_requests"],
+        "cache_hits": stats.get("audio_cache", {}).get("hits", 0),
+    }
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark voice generation against the offline mock TTS backend",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('input_file', nargs='?',
+                        help='Script Parser JSON to use instead of synthetic lines')
+    parser.add_argument('--lines', type=int, default=60,
+                        help='Synthetic dialogue lines (default: 60)')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='Concurrency levels to compare')
+    parser.add_argument('--latency', type=float, default=0.1,
+                        help='Mock request latency in seconds (default: 0.1)')
+    parser.add_argument('--jitter', type=float, default=0.02,
+                        help='Mock latency jitter in seconds (default: 0.02)')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='Fraction of requests failing with HTTP 500')
+    parser.add_argument('--throttle-rate', type=float, default=0.0,
+                        help='Fraction of requests answered with HTTP 429')
+    parser.add_argument('--concurrency-limit', type=int, default=None,
+                        help='Mock provider in-flight limit (429 beyond it)')
+    parser.add_argument('--rps', type=float, default=None,
+                        help='Client requests/second limit (default: unlimited)')
+    parser.add_argument('--with-cache', action='store_true',
+                        help='Use the audio cache (second pass measures hits)')
+    parser.add_argument('--short-every', type=int, default=0,
+                        help='Add two short reactions after every Nth synthetic line')
+    parser.add_argument('--merge-short-lines', action='store_true',
+                        help='Merge consecutive short lines into one request')
+    parser.add_argument('--max-chunk-characters', type=int, default=None,
+                        help='Split lines longer than this many characters')
+    parser.add_argument('--json', action='store_true', help='Output results as JSON')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.CRITICAL)
+
+    if args.input_file:
+        logger = logging.getLogger("versusMonster.benchmark")
+        script_data = voice_gen.load_script_parser_json(Path(args.input_file), logger)
+        dialogues = voice_gen.extract_dialogues(script_data["scenes"], logger)
+    else:
+        dialogues = build_synthetic_dialogues(args.lines, args.short_every)
+
+    config_path = Path(__file__).resolve().parent.parent / "config" / "config.json"
+    config = voice_gen.load_config(str(config_path))
+    voice_config = config.setdefault("voice_generation", {})
+    voice_config["retry_delay_seconds"] = 0.05
+    voice_config["rate_limits"] = {
+        **voice_config.get("rate_limits", {}), "requests_per_second": args.rps
+    }
+    chunk_config = voice_config.setdefault("chunking", {})
+    chunk_config["merge_short_lines"] = args.merge_short_lines
+    if args.max_chunk_characters:
+        chunk_config["max_chunk_characters"] = args.max_chunk_characters
+
+    mock_options = {
+        "latency_seconds": args.latency,
+        "jitter_seconds": args.jitter,
+        "error_rate": args.error_rate,
+        "throttle_rate": args.throttle_rate,
+        "concurrency_limit": args.concurrency_limit,
+        "retry_after_seconds": 0.2,
+    }
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        voice_config["audio_cache"] = {
+            **voice_config.get("audio_cache", {}), "directory": cache_dir
+        }
+        runs = []
+        for concurrency in args.concurrency:
+            runs.append(run_once(dialogues, config, mock_options, concurrency, args.with_cache))
+        if args.with_cache:
+            cached_run = run_once(dialogues, config, mock_options, args.concurrency[-1], True)
+            runs.append({**cached_run, "pass": "cached"})
+
+    results = {"lines": len(dialogues), "mock_backend": mock_options, "runs": runs}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"🎤 {results['lines']} lines, mock latency {args.latency * 1000:.0f} ms")
+    print(f"   {'workers':>7} {'seconds':>8} {'lines/s':>8} {'requests':>8} "
+          f"{'429s':>5} {'failed':>6} {'hits':>5}")
+    for run in runs:
+        label = f"{run['concurrency']}{'*' if run.get('pass') else ''}"
+        print(f"   {label:>7} {run['seconds']:>8.2f} {run['lines_per_second']:>8.1f} "
+              f"{run['api_requests']:>8} "
+              f"{run['throttled']:>5} {run['failed']:>6} {run['cache_hits']:>5}")
+    if args.with_cache:
+        print("   * second pass served from the audio cache")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,17 +10,22 @@ Usage:
     python process_episode.py episode_file.md --dry-run
     python process_episode.py episode_file.md --verify
     python process_episode.py episode_file.md --silent --json
+    python process_episode.py ep1.md ep2.md scripts/ --workers 4
+    python process_episode.py --recursive archive/ --verify --state-file .process_state.json
 
 Author: versusMonster Pipeline System
 Version: 1.0
 """
 
+import os
 import re
 import sys
 import json
+import bisect
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
 
@@ -54,6 +59,29 @@ class ProcessingStats:
                 self.transition_already_escaped + self.thumbnail_already_escaped + self.scene_already_escaped)
 
 
+class CodeBlockIndex:
+    """Sorted code-fence offsets for one version of the content.
+
+    Fences are found left to right exactly as ``text[:position].count('```')``
+    would count them, so a position is inside a code block when an odd number
+    of fences end at or before it. Built once per pass; each lookup is a
+    bisect instead of a prefix copy and scan.
+    """
+
+    __slots__ = ("fence_ends",)
+
+    def __init__(self, text: str):
+        self.fence_ends: List[int] = []
+        position = text.find('```')
+        while position != -1:
+            self.fence_ends.append(position + 3)
+            position = text.find('```', position + 3)
+
+    def contains(self, position: int) -> bool:
+        """Whether position lies within a markdown code block."""
+        return bisect.bisect_right(self.fence_ends, position) % 2 == 1
+
+
 class EpisodeTagProcessor:
     """Main processor for fixing multimedia tags in episode files"""
     
@@ -70,7 +98,14 @@ class EpisodeTagProcessor:
         self._compile_patterns()
     
     def _compile_patterns(self):
-        """Compile regex patterns for detecting multimedia tags"""
+        """Compile regex patterns for detecting multimedia tags
+        
+        ``tag_pattern`` matches every tag type, escaped or not, in one
+        alternation of named groups (dispatched on ``match.lastgroup``):
+        ``escaped_<TAG>`` for tags that already carry a backslash and
+        ``<TAG>`` for tags still needing escaping.
+        """
+        # Per-type patterns, used when tags overlap (see process_file_content)
         self.patterns = {}
         
         # Pattern for IMG tags with optional PROMPT continuation
@@ -99,6 +134,36 @@ class EpisodeTagProcessor:
             re.MULTILINE
         )
         
+        # Combined pattern: tag bodies after the opening bracket, per tag type
+        tag_bodies = {
+            'IMG': r'IMG:\s*[^\]]+\](?:\s*PROMPT:\s*"[^"]*")?',
+            'THUMBNAIL': r'THUMBNAIL\]',
+        }
+        for tag in ['SFX', 'MUSIC', 'AMBIENT', 'TRANSITION', 'SCENE']:
+            tag_bodies[tag] = rf'{tag}:\s*[^\]]+\]'
+        
+        # Already escaped tags are counted, never rewritten (PROMPT text is not part of them)
+        escaped_alternatives = [
+            rf'(?P<escaped_{tag}>{tag}\])' if tag == 'THUMBNAIL'
+            else rf'(?P<escaped_{tag}>{tag}:\s*[^\]]+\])'
+            for tag in self.MULTIMEDIA_TAGS
+        ]
+        unescaped_alternatives = [
+            rf'(?P<{tag}>{tag_bodies[tag]})' for tag in self.MULTIMEDIA_TAGS
+        ]
+        # Both branches start with a literal so the regex engine can skip ahead
+        # to the next backslash or bracket; the lookbehind follows the bracket
+        self.tag_pattern = re.compile(
+            r'\\\[(?:' + '|'.join(escaped_alternatives) + r')'
+            r'|\[(?<!\\\[)(?:' + '|'.join(unescaped_alternatives) + ')',
+            re.MULTILINE
+        )
+        
+        # ProcessingStats field updated for each named group
+        self.stat_fields = {}
+        for tag in self.MULTIMEDIA_TAGS:
+            self.stat_fields[tag] = f'{tag.lower()}_fixed'
+            self.stat_fields[f'escaped_{tag}'] = f'{tag.lower()}_already_escaped'
         
         # Pattern to detect already escaped tags
         self.escaped_pattern = re.compile(
@@ -106,17 +171,6 @@ class EpisodeTagProcessor:
             re.MULTILINE
         )
     
-    def _is_in_code_block(self, text: str, position: int) -> bool:
-        """Check if position is within a markdown code block"""
-        # Find all code block boundaries before this position
-        text_before = text[:position]
-        
-        # Count triple backticks
-        triple_backticks = text_before.count('```')
-        
-        # If odd number, we're inside a code block
-        return triple_backticks % 2 == 1
-    
     def _count_already_escaped(self, content: str, tag_type: str) -> int:
         """Count already escaped tags of a specific type"""
         if tag_type == 'THUMBNAIL':
@@ -139,11 +193,14 @@ class EpisodeTagProcessor:
         # Count already escaped tags before processing
         already_escaped_count = self._count_already_escaped(content, tag_type)
         
+        # Code fence offsets for this pass's content
+        code_blocks = CodeBlockIndex(content)
+        
         def replace_match(match):
             nonlocal fixed_count
             
             # Check if we're in a code block
-            if self._is_in_code_block(content, match.start()):
+            if code_blocks.contains(match.start()):
                 return match.group(0)  # Don't modify
             
             original = match.group(0)
@@ -165,8 +222,8 @@ class EpisodeTagProcessor:
         processed_content = pattern.sub(replace_match, content)
         return processed_content, fixed_count, already_escaped_count
     
-    def process_file_content(self, content: str) -> Tuple[str, ProcessingStats]:
-        """Process file content and return modified content with statistics"""
+    def _process_per_tag_type(self, content: str) -> Tuple[str, ProcessingStats]:
+        """Escape and count one tag type at a time, in MULTIMEDIA_TAGS order"""
         self.stats = ProcessingStats()
         self.sample_fixes = []
         
@@ -184,6 +241,67 @@ class EpisodeTagProcessor:
         
         return processed_content, self.stats
     
+    def process_file_content(self, content: str) -> Tuple[str, ProcessingStats]:
+        """Process file content and return modified content with statistics
+        
+        All tag types are escaped and counted in a single regex pass. Content
+        where a tag's text contains another bracket falls back to one pass
+        per tag type, which resolves such overlaps differently.
+        """
+        self.stats = ProcessingStats()
+        self.sample_fixes = []
+        
+        nested = False
+        counts = dict.fromkeys(self.stat_fields, 0)
+        samples: Dict[str, List[Tuple[str, str]]] = {tag: [] for tag in self.MULTIMEDIA_TAGS}
+        code_blocks = CodeBlockIndex(content)
+        
+        def replace_match(match):
+            nonlocal nested
+            group = match.lastgroup
+            original = match.group(0)
+            
+            # Another bracket inside the match: an unclosed tag or tags in PROMPT text
+            if original.find('[', 2) != -1:
+                nested = True
+            
+            if group.startswith('escaped_'):
+                counts[group] += 1
+                return original
+            
+            # Check if we're in a code block
+            if code_blocks.contains(match.start()):
+                return original  # Don't modify
+            
+            # Add escaping (regex already excludes escaped ones)
+            if group == 'SCENE':
+                # SCENE tags need both brackets escaped for parser compatibility
+                escaped = original.replace('[SCENE:', '\\[SCENE:').replace(']', '\\]')
+            else:
+                escaped = '\\' + original
+            counts[group] += 1
+            
+            # Store sample for reporting
+            if len(samples[group]) < 5:  # Limit samples
+                samples[group].append((original, escaped))
+            
+            return escaped
+        
+        processed_content = self.tag_pattern.sub(replace_match, content)
+        
+        if nested:
+            # Per-type passes also escape tags nested in other tags' text; keep their results
+            return self._process_per_tag_type(content)
+        
+        # Update statistics
+        for group, count in counts.items():
+            setattr(self.stats, self.stat_fields[group], count)
+        
+        # Samples in tag type order, as reported before the single pass
+        self.sample_fixes = [sample for tag in self.MULTIMEDIA_TAGS for sample in samples[tag]][:5]
+        
+        return processed_content, self.stats
+    
     def process_episode_file(self, input_path: Path, output_path: Optional[Path] = None, 
                            dry_run: bool = False) -> Dict:
         """Process an episode file and return results"""
@@ -193,7 +311,7 @@ class EpisodeTagProcessor:
         
         # Determine output path
         if output_path is None:
-            output_path = input_path.parent / f"{input_path.stem}_processed{input_path.suffix}"
+            output_path = processed_output_path(input_path)
         
         # Read input file
         try:
@@ -302,6 +420,215 @@ class EpisodeTagProcessor:
             print(f"\n❌ Processing failed: {results.get('error', 'Unknown error')}")
 
 
+def processed_output_path(input_path: Path) -> Path:
+    """Default location of the processed copy: <stem>_processed<suffix> beside the input"""
+    return input_path.parent / f"{input_path.stem}_processed{input_path.suffix}"
+
+
+def normalize_episode_content(content: str) -> Tuple[str, ProcessingStats]:
+    """Escape multimedia tags in script text without touching the filesystem
+
+    Shared entry point for callers that parse the result directly, such as
+    ``parser.py --normalize``.
+    """
+    return EpisodeTagProcessor(verbose=False).process_file_content(content)
+
+
+def collect_episode_files(paths: List[str], recursive_dirs: List[str]) -> List[Path]:
+    """Expand files and directories into a sorted, de-duplicated list of .md files.
+
+    Directories given as paths are scanned one level deep, ``recursive_dirs``
+    at any depth. Files found by scanning skip this tool's own
+    ``*_processed.md`` outputs; explicitly named files are always kept.
+    """
+    files: Dict[Path, Path] = {}
+    
+    def add_directory(directory: Path, pattern: str):
+        if not directory.is_dir():
+            raise FileNotFoundError(f"Directory not found: {directory}")
+        for path in directory.glob(pattern):
+            if path.is_file() and not path.stem.endswith('_processed'):
+                files.setdefault(path.resolve(), path)
+    
+    for raw_path in paths:
+        path = Path(raw_path)
+        if path.is_dir():
+            add_directory(path, '*.md')
+        else:
+            files.setdefault(path.resolve(), path)
+    
+    for raw_dir in recursive_dirs:
+        add_directory(Path(raw_dir), '**/*.md')
+    
+    return [files[key] for key in sorted(files)]
+
+
+def load_state(state_path: Path) -> Dict[str, Any]:
+    """Load the per-file state recorded by a previous sweep (empty if missing or unreadable)"""
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state.get('files', {}) if isinstance(state, dict) else {}
+
+
+def save_state(state_path: Path, files: Dict[str, Any]) -> None:
+    """Write the state file atomically"""
+    temp_path = state_path.with_name(f".{state_path.name}.tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': 1, 'files': files}, f, indent=2, sort_keys=True)
+    os.replace(temp_path, state_path)
+
+
+def state_is_current(entry: Optional[Dict[str, Any]], stat: os.stat_result, dry_run: bool) -> bool:
+    """Whether a recorded result still holds for a file with this stat.
+
+    A file that needed fixing only counts as done once its processed output
+    was written and still exists (or when just verifying).
+    """
+    if not entry or entry.get('mtime_ns') != stat.st_mtime_ns or entry.get('size') != stat.st_size:
+        return False
+    if dry_run or not entry.get('needs_processing'):
+        return True
+    output_file = entry.get('output_file')
+    if not output_file:
+        return False
+    return Path(output_file).exists()
+
+
+def process_path(task: Tuple[str, bool]) -> Dict[str, Any]:
+    """Process one file in a worker process; errors are returned, not raised"""
+    input_file, dry_run = task
+    input_path = Path(input_file)
+    try:
+        stat = input_path.stat()
+        processor = EpisodeTagProcessor(verbose=False)
+        results = processor.process_episode_file(input_path, dry_run=dry_run)
+    except Exception as e:
+        return {'input_file': input_file, 'success': False, 'error': str(e)}
+    
+    results['mtime_ns'] = stat.st_mtime_ns
+    results['size'] = stat.st_size
+    return results
+
+
+def process_episode_tree(files: List[Path], dry_run: bool = False, workers: Optional[int] = None,
+                         state_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Process many episode files across a process pool and return a combined report
+    
+    With ``state_path``, files whose mtime and size match the recorded state
+    (keyed by absolute path) are skipped and reported from it; the state is
+    updated afterwards.
+    """
+    state: Dict[str, Any] = load_state(state_path) if state_path else {}
+    file_results: Dict[str, Dict[str, Any]] = {}
+    tasks: List[Tuple[str, bool]] = []
+    
+    for path in files:
+        key = str(path)
+        try:
+            stat = path.stat()
+        except OSError as e:
+            file_results[key] = {'input_file': key, 'success': False, 'error': str(e)}
+            continue
+        entry = state.get(str(path.resolve()))
+        if entry is not None and state_is_current(entry, stat, dry_run):
+            file_results[key] = {
+                'input_file': key,
+                'output_file': entry.get('output_file'),
+                'skipped': True,
+                'needs_processing': entry.get('needs_processing', False),
+                'total_fixed': entry.get('total_fixed', 0),
+                'success': True
+            }
+        else:
+            tasks.append((key, dry_run))
+    
+    workers = max(1, workers or os.cpu_count() or 1)
+    processed: List[Dict[str, Any]]
+    if workers == 1 or len(tasks) <= 1:
+        processed = [process_path(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            chunksize = max(1, len(tasks) // (workers * 4))
+            processed = list(executor.map(process_path, tasks, chunksize=chunksize))
+    
+    for results in processed:
+        results['skipped'] = False
+        file_results[results['input_file']] = results
+        if results['success'] and 'mtime_ns' in results:
+            written = not dry_run and results['stats']['total_fixed'] > 0
+            state[str(Path(results['input_file']).resolve())] = {
+                'mtime_ns': results['mtime_ns'],
+                'size': results['size'],
+                'needs_processing': results['needs_processing'],
+                'total_fixed': results['stats']['total_fixed'],
+                'output_file': str(Path(results['output_file']).resolve()) if written else None
+            }
+    
+    if state_path:
+        save_state(state_path, state)
+    
+    ordered = [file_results[str(path)] for path in files]
+    from_state = [results for results in ordered if results.get('skipped')]
+    return {
+        'dry_run': dry_run,
+        'files': ordered,
+        'summary': {
+            'total_files': len(ordered),
+            'processed': len(processed),
+            'skipped_unchanged': len(from_state),
+            'needs_processing': sum(1 for results in ordered if results.get('needs_processing')),
+            'tags_fixed': sum(tags_fixed(results) for results in ordered if results['success']),
+            # Part of the totals above, taken from the state file rather than this run
+            'needs_processing_from_state': sum(
+                1 for results in from_state if results.get('needs_processing')
+            ),
+            'tags_fixed_from_state': sum(tags_fixed(results) for results in from_state),
+            'failed': sum(1 for results in ordered if not results['success'])
+        }
+    }
+
+
+def tags_fixed(results: Dict[str, Any]) -> int:
+    """Tags a file result fixed (or would fix), whether processed or read from state"""
+    if 'stats' in results:
+        return int(results['stats']['total_fixed'])
+    return int(results.get('total_fixed', 0))
+
+
+def print_tree_report(report: Dict[str, Any]) -> None:
+    """Print human-readable report for a multi-file run"""
+    summary = report['summary']
+    
+    def state_note(count: int) -> str:
+        return f" ({count} recorded in state file)" if count else ""
+    
+    if report['dry_run']:
+        print("🔍 DRY RUN MODE - No files modified")
+    
+    action = "to fix" if report['dry_run'] else "fixed"
+    for results in report['files']:
+        if not results['success']:
+            print(f"❌ {results['input_file']}: {results.get('error', 'Unknown error')}")
+        elif results.get('needs_processing') and (report['dry_run'] or not results.get('skipped')):
+            state = " (unchanged since last sweep)" if results.get('skipped') else ""
+            print(f"🔧 {results['input_file']}: {tags_fixed(results)} tags {action}{state}")
+    
+    print(f"\n📊 Files: {summary['total_files']} ({summary['processed']} processed, "
+          f"{summary['skipped_unchanged']} unchanged since last sweep)")
+    print(f"   Needing processing: {summary['needs_processing']}"
+          f"{state_note(summary['needs_processing_from_state'])}")
+    print(f"   Tags {action}: {summary['tags_fixed']}"
+          f"{state_note(summary['tags_fixed_from_state'])}")
+    if summary['failed']:
+        print(f"   Failed: {summary['failed']}")
+        print("\n❌ Some files could not be processed!")
+    else:
+        print("\n✅ Processing complete!")
+
+
 def create_test_content() -> str:
     """Create test content for validation"""
     return r"""# Test Episode
@@ -328,6 +655,43 @@ Already escaped: \[SFX: already_escaped\]
 """
 
 
+def compare_normalized_parse(content: str) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Tag counts from ``parser.py --normalize`` and ``--escape-tolerant`` on content"""
+    src_dir = Path(__file__).resolve().parent.parent / 'src'
+    if str(src_dir) not in sys.path:
+        sys.path.insert(0, str(src_dir))
+    import logging
+    import tempfile
+    import parser as script_parser
+
+    config = script_parser.load_config(str(src_dir.parent / 'config' / 'config.json'))
+    logger = logging.getLogger('process_episode.selftest')
+    logger.setLevel(logging.CRITICAL)
+
+    def count_tags(output_file: Path) -> Dict[str, int]:
+        with open(output_file, 'r', encoding='utf-8') as f:
+            scenes = json.load(f)['scenes']
+        counts: Dict[str, int] = {}
+        for scene in scenes:
+            for tag_type, tags in scene['multimedia'].items():
+                counts[tag_type] = counts.get(tag_type, 0) + len(tags)
+        return counts
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        script_path = Path(temp_dir) / 'selftest.md'
+        script_path.write_text(content, encoding='utf-8')
+        for output_name, run_config, normalize in (
+            ('normalized', config, True),
+            ('tolerant', script_parser.escape_tolerant_config(config), False),
+        ):
+            script_parser.process_episode_file(
+                str(script_path), str(Path(temp_dir) / output_name), run_config, logger,
+                use_cache=False, normalize=normalize
+            )
+        return (count_tags(Path(temp_dir) / 'normalized' / 'selftest.json'),
+                count_tags(Path(temp_dir) / 'tolerant' / 'selftest.json'))
+
+
 def run_tests() -> bool:
     """Run built-in tests to verify processor functionality"""
     print("🧪 Running built-in tests...")
@@ -389,7 +753,17 @@ def run_tests() -> bool:
         print("✓ Code blocks preserved")
     else:
         print("✗ Code blocks not preserved")
-    
+
+    # Test 6: parser.py --normalize finds the same tags as an escape-tolerant parse
+    total_tests += 1
+    normalized_counts, tolerant_counts = compare_normalized_parse(test_content)
+    if normalized_counts == tolerant_counts and sum(tolerant_counts.values()) > 0:
+        tests_passed += 1
+        print("✓ Normalized tags parsed")
+    else:
+        print(f"✗ Normalized tags parsed (normalized: {normalized_counts}, "
+              f"tolerant: {tolerant_counts})")
+
     success = tests_passed == total_tests
     print(f"\n📊 Tests: {tests_passed}/{total_tests} passed")
     
@@ -401,6 +775,38 @@ def run_tests() -> bool:
     return success
 
 
+def run_tree(args: argparse.Namespace) -> int:
+    """Process several files or directories; returns the exit code"""
+    try:
+        files = collect_episode_files(args.input_files, args.recursive)
+    except FileNotFoundError as e:
+        if args.json:
+            print(json.dumps({'success': False, 'error': str(e)}))
+        else:
+            print(f"❌ Error: {e}")
+        return 2
+    
+    report = process_episode_tree(
+        files,
+        dry_run=args.dry_run or args.verify,
+        workers=args.workers,
+        state_path=Path(args.state_file) if args.state_file else None
+    )
+    summary = report['summary']
+    
+    if args.json:
+        print(json.dumps(report, indent=None if args.silent else 2))
+    elif not args.silent:
+        print_tree_report(report)
+    
+    if summary['failed']:
+        return 2
+    if args.verify:
+        # Exit code 0 if any file needs processing, 1 if all are already processed
+        return 0 if summary['needs_processing'] else 1
+    return 0
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -412,11 +818,25 @@ Examples:
   python process_episode.py episode_2_ex_final.md --dry-run
   python process_episode.py episode_2_ex_final.md --output fixed_episode.md
   python process_episode.py episode_2_ex_final.md --verify
+  python process_episode.py ep1.md ep2.md scripts/ --workers 4
+  python process_episode.py --recursive archive/ --verify --json --state-file .process_state.json
   python process_episode.py --test
+
+With several files or directories, files are processed in parallel and
+--verify exits 0 if any file needs processing, 1 if none do, and 2 if any
+file could not be read.
         """
     )
     
-    parser.add_argument('input_file', nargs='?', help='Input episode markdown file')
+    parser.add_argument('input_files', nargs='*', metavar='input_file',
+                        help='Input episode markdown files or directories of them')
+    parser.add_argument('--recursive', '-r', action='append', default=[], metavar='DIR',
+                        help='Process every .md file under DIR (repeatable)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--state-file',
+                        help='Skip files whose mtime and size match this state file; '
+                             'update it after')
     parser.add_argument('--output', '-o', help='Output file path (default: input_processed.md)')
     parser.add_argument('--dry-run', action='store_true', help='Preview changes without writing files')
     parser.add_argument('--verify', action='store_true', help='Check if file needs processing')
@@ -432,11 +852,18 @@ Examples:
         sys.exit(0 if success else 1)
     
     # Validate arguments
-    if not args.input_file:
+    if not args.input_files and not args.recursive:
         parser.print_help()
         sys.exit(1)
     
-    input_path = Path(args.input_file)
+    tree_mode = (len(args.input_files) > 1 or bool(args.recursive) or bool(args.state_file)
+                 or any(Path(path).is_dir() for path in args.input_files))
+    if tree_mode:
+        if args.output:
+            parser.error('--output can only be used with a single input file')
+        sys.exit(run_tree(args))
+    
+    input_path = Path(args.input_files[0])
     output_path = Path(args.output) if args.output else None
     
     # Create processor